@@ -0,0 +1,111 @@
+# clientregistry.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Map clients to update notification callbacks using weak references.
+
+DataSource and DataRegister keep the callbacks of clients which want to
+know about database updates.  Dialogs and grids which are not removed by
+register_out were kept alive, with their decoded records and widgets, by
+strong references to the client and to it's bound method callback.
+
+A ClientRegistry refers to clients, and to callbacks which are bound
+methods, by weak references so an entry disappears when the client, or
+the object whose method is the callback, is garbage collected.  Clients
+which cannot be weakly referenced, and callbacks which are not bound
+methods, are referred to by strong references.
+
+"""
+
+import types
+import weakref
+from collections.abc import MutableMapping
+
+
+class ClientRegistry(MutableMapping):
+    """Mapping of client to callback which does not keep either alive.
+
+    Iteration is over a snapshot of the live clients, so callbacks may
+    register or cancel clients while the registry is being iterated.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Create registry with entries from args and kwargs like dict."""
+        super().__init__()
+        self._weak = weakref.WeakKeyDictionary()
+        self._strong = dict()
+        self.update(*args, **kwargs)
+
+    def _entries(self, client):
+        """Return the dict holding client, weak or strong, for client."""
+        try:
+            weakref.ref(client)
+        except TypeError:
+            return self._strong
+        return self._weak
+
+    def __getitem__(self, client):
+        """Return callback for client.
+
+        KeyError is raised if the callback has been garbage collected, and
+        the entry for client is removed.
+
+        """
+        entries = self._entries(client)
+        callback = entries[client]()
+        if callback is None:
+            del entries[client]
+            raise KeyError(client)
+        return callback
+
+    def __setitem__(self, client, callback):
+        """Set callback for client."""
+        if isinstance(callback, types.MethodType):
+            reference = weakref.WeakMethod(callback)
+        else:
+            reference = _StrongReference(callback)
+        self._entries(client)[client] = reference
+
+    def __delitem__(self, client):
+        """Remove entry for client."""
+        del self._entries(client)[client]
+
+    def __iter__(self):
+        """Return iterator over snapshot of clients with live callbacks."""
+        clients = []
+        for entries in self._weak, self._strong:
+            for client, reference in list(entries.items()):
+                if reference() is not None:
+                    clients.append(client)
+        return iter(clients)
+
+    def __len__(self):
+        """Return number of clients with live callbacks."""
+        return len(list(iter(self)))
+
+    def __repr__(self):
+        """Return repr of dict of live entries."""
+        return repr(dict(self.items()))
+
+    def report_live_clients(self):
+        """Return {class name: number of live clients, ...}."""
+        report = {}
+        for client in self:
+            name = type(client).__name__
+            report[name] = report.get(name, 0) + 1
+        return report
+
+
+class _StrongReference:
+    """Strong reference with same interface as weakref.ref instances."""
+
+    __slots__ = ("referent",)
+
+    def __init__(self, referent):
+        """Refer to referent."""
+        self.referent = referent
+
+    def __call__(self):
+        """Return referent."""
+        return self.referent
@@ -31,6 +31,42 @@ Partial key can be specified to define a key range to be returned.
 
 """
 
+import sys
+import time
+from collections import OrderedDict
+
+from .clientregistry import ClientRegistry
+from .datakeys import DataKeys
+from .notificationqueue import NotificationQueue
+
+# Number of records read by default in each step of a readahead fill.
+READAHEAD_STEP = 10
+
+# Number of reads in progress on each database by DataClient and DataLookup
+# instances.  Transactions belong to the database and cannot be nested, so
+# only the first read starts a read-only transaction and only the last read
+# ends it.  {id(<Database instance>): count, ...}
+_active_reads = dict()
+
+
+def start_read(dbhome):
+    """Start read-only transaction on dbhome unless a read is active."""
+    key = id(dbhome)
+    count = _active_reads.get(key, 0)
+    if not count:
+        dbhome.start_read_only_transaction()
+    _active_reads[key] = count + 1
+
+
+def end_read(dbhome):
+    """End read-only transaction on dbhome unless other reads are active."""
+    key = id(dbhome)
+    count = _active_reads.pop(key, 1) - 1
+    if count:
+        _active_reads[key] = count
+        return
+    dbhome.end_read_only_transaction()
+
 
 class DataNotify:
     """Provide interface to register a callback with a DataSource.
@@ -227,15 +263,194 @@ class DataClient(_DataAccess):
 
         """
         super().__init__(**kwargs)
-        self.keys = []
+        self.keys = DataKeys()
         self.rows = 0
         self.objects = dict()
 
+        # Milliseconds the cursor, and the read-only transaction it was
+        # made in, are kept open after the last read in a burst of
+        # navigation actions, or None to close them at the end of each read.
+        # The cursor never outlives the transaction: some engines' cursors
+        # are invalid once their transaction ends.  Other reads on the
+        # database share the kept-open transaction through start_read and
+        # end_read.
+        self.cursor_idle_timeout = None
+        self._client_read_depth = 0
+        self._client_read_dbhome = None
+        self._client_read_idle = None
+
+        # Number of records either side of self.keys decoded in advance,
+        # and the decoded records, with the same keys as self.objects.
+        self.readahead = 0
+        self.readahead_objects = dict()
+
+        # The readahead fill in progress, or None: [[key, cursor method
+        # name, number of records to read], ...] for the directions not
+        # finished, and the rows decoded so far.
+        self._readahead_fill = None
+        self._readahead_rows = dict()
+
+        # Counts of records for datasources and partial keys, and updates
+        # not yet applied to counts for indexes other than the current one.
+        # {<DataSource.record_count_key(partial)>: count, ...}
+        # {<DataSource.record_count_key(partial)>: [instance, ...], ...}
+        self.record_counts = dict()
+        self._record_count_changes = dict()
+
+        # A recordcache.RecordCache, perhaps the one shared with other
+        # clients from recordcache.get_shared_record_cache, or None to
+        # decode every record.
+        self.record_cache = None
+
+        # True if records either side of self.keys would not be displayed,
+        # so updates to them do not change the display.  Subclasses which
+        # display records set this when self.keys is filled.
+        self.view_is_full = False
+
+    def adjust_record_counts(self, instance):
+        """Adjust record counts after database update for instance.
+
+        Counts for the current datasource's index, with and without partial
+        keys, are adjusted by the number of index entries added or removed
+        for the record, using the newrecord attribute of instance like the
+        on_data_change methods.  Counts for other indexes in the dbset are
+        adjusted by get_record_count when next used, because get_keys needs
+        a datasource on the index.  A count is discarded if the change
+        cannot be found.  All counts are discarded if instance is None.
+
+        """
+        if instance is None or self.datasource is None:
+            self.record_counts.clear()
+            self._record_count_changes.clear()
+            return
+        datasource = self.datasource
+        record_counts = self.record_counts
+        for count_key in list(record_counts):
+            if count_key[0] != datasource.dbset:
+                continue
+            if count_key[1] != datasource.dbname:
+                self._record_count_changes.setdefault(count_key, []).append(
+                    instance
+                )
+                continue
+            change = self._get_record_count_change(
+                datasource, count_key[2], instance
+            )
+            if change is None:
+                del record_counts[count_key]
+                self._record_count_changes.pop(count_key, None)
+            else:
+                record_counts[count_key] += change
+
+    def _get_record_count_change(self, datasource, partial, instance):
+        """Return change in count of records for update, or None if unknown.
+
+        The count is of the records in datasource selected by partial key.
+
+        """
+        newrecord = instance.__dict__.get("newrecord")
+        try:
+            oldkeys = instance.get_keys(datasource)
+            if newrecord is None:
+                newkeys = []
+            elif newrecord is False:
+                oldkeys, newkeys = [], oldkeys
+            else:
+                newkeys = newrecord.get_keys(datasource)
+            if partial:
+                oldkeys = [k for k in oldkeys if k[0].startswith(partial)]
+                newkeys = [k for k in newkeys if k[0].startswith(partial)]
+        except Exception:
+            return None
+        return len(newkeys) - len(oldkeys)
+
+    def after_client_read(self, delay, callback):
+        """Return identifier of callback scheduled to run after delay.
+
+        None is returned because DataClient has no event loop: the read
+        is closed immediately.  Subclasses with an event loop override
+        this method and after_cancel_client_read.
+
+        """
+        return None
+
+    def after_cancel_client_read(self, identifier):
+        """Cancel callback scheduled by after_client_read."""
+
     def clear_client_keys(self):
-        """Delete current keys and objects."""
+        """Delete current keys and objects.
+
+        The objects are kept in readahead_objects if readahead is set.
+
+        """
+        if self.readahead:
+            self.readahead_objects.update(self.objects)
         self.keys[:] = []
         self.objects.clear()
 
+    def clear_readahead(self):
+        """Discard records decoded in advance and any fill in progress."""
+        self.readahead_objects.clear()
+        self._readahead_fill = None
+        self._readahead_rows = dict()
+
+    def close_client_read(self):
+        """Close cursor and end read-only transaction started for reads."""
+        if self._client_read_idle is not None:
+            self.after_cancel_client_read(self._client_read_idle)
+            self._client_read_idle = None
+        self._client_read_depth = 0
+        self.close_client_cursor()
+        self._end_client_transaction()
+
+    def _end_client_transaction(self):
+        """End read-only transaction started by start_client_read."""
+        dbhome, self._client_read_dbhome = self._client_read_dbhome, None
+        if dbhome is not None:
+            end_read(dbhome)
+
+    def end_client_read(self):
+        """End read started by start_client_read.
+
+        The cursor and read-only transaction are closed immediately unless
+        cursor_idle_timeout is set: then they are closed together if no
+        read is started within cursor_idle_timeout milliseconds.
+
+        Applications which set cursor_idle_timeout must call the
+        close_client_read method before starting an update transaction.
+
+        """
+        if self._client_read_depth > 1:
+            self._client_read_depth -= 1
+            return
+        self._client_read_depth = 0
+        if self.cursor_idle_timeout is not None:
+            self._client_read_idle = self.after_client_read(
+                self.cursor_idle_timeout, self.close_client_read
+            )
+            if self._client_read_idle is not None:
+                return
+        self.close_client_read()
+
+    def start_client_read(self, record=None):
+        """Return make_client_cursor(record) in a read-only transaction.
+
+        The cursor and transaction kept open by an earlier end_client_read
+        call are used if still open.  A cursor without a transaction, or
+        from an earlier transaction, is closed rather than reused.
+
+        """
+        if self._client_read_idle is not None:
+            self.after_cancel_client_read(self._client_read_idle)
+            self._client_read_idle = None
+        if self._client_read_dbhome is None:
+            self.close_client_cursor()
+            dbhome = self.datasource.dbhome
+            start_read(dbhome)
+            self._client_read_dbhome = dbhome
+        self._client_read_depth += 1
+        return self.make_client_cursor(record)
+
     def close_client_cursor(self):
         """Close the dataclient cursor."""
         try:
@@ -255,18 +470,204 @@ class DataClient(_DataAccess):
             return self.cursor.setat(record)
         return None
 
+    def decode_readahead(self, cursor, first, last, exclude, decoded):
+        """Return dict of rows for records either side of first and last.
+
+        cursor - the cursor used to find records.
+        first, last - the keys before and after which records are read.
+        exclude - keys of records not to be decoded.
+        decoded - rows decoded earlier, used rather than decoding again.
+
+        Up to self.readahead records are read in each direction.
+
+        """
+        rows = dict()
+        for start, step in ((last, "next"), (first, "prev")):
+            self._decode_records(
+                cursor, start, step, self.readahead, exclude, decoded, rows
+            )
+        return rows
+
+    def _decode_records(
+        self, cursor, start, step, count, exclude, decoded, rows
+    ):
+        """Add rows for up to count records after start to rows.
+
+        step - name of cursor method, "next" or "prev", reading a record.
+
+        Keys in exclude are read but not decoded, and rows in decoded are
+        used rather than decoding again.  The last key read is returned,
+        or None if there are no more records to read.
+
+        """
+        if cursor.setat(start) is None:
+            return None
+        step = getattr(cursor, step)
+        key = start
+        for i in range(count):
+            key = step()
+            if key is None:
+                return None
+            if key in exclude:
+                continue
+            newrow = decoded.get(key)
+            if newrow is None:
+                try:
+                    newrow = self.make_object(key)
+                except (TypeError, ValueError):
+                    return None
+            rows[key] = newrow
+        return key
+
+    def fill_readahead(self):
+        """Decode up to readahead records either side of self.keys.
+
+        The decoded records replace those in readahead_objects, which are
+        used by load_object rather than decoding the record again.
+
+        """
+        self.start_readahead()
+        self.continue_readahead(steps=None)
+
+    def start_readahead(self):
+        """Start a fill of readahead records either side of self.keys.
+
+        The records are decoded by continue_readahead calls.  A fill in
+        progress is abandoned: the rows it decoded are in readahead_objects
+        so they are not decoded again.
+
+        """
+        self._readahead_rows = dict()
+        if not self.readahead or not self.keys or self.datasource is None:
+            self._readahead_fill = None
+            self.readahead_objects.clear()
+            return
+        self._readahead_fill = [
+            [self.keys[-1], "next", self.readahead],
+            [self.keys[0], "prev", self.readahead],
+        ]
+
+    def continue_readahead(self, steps=READAHEAD_STEP):
+        """Read up to steps records for fill and return True if done.
+
+        steps - number of records read, or None to read all records.
+
+        Each decoded record is put in readahead_objects at once.  When the
+        fill is done readahead_objects is replaced by the records decoded
+        since start_readahead.
+
+        """
+        fill = self._readahead_fill
+        if fill is None:
+            return True
+        rows = self._readahead_rows
+        self.start_client_read()
+        try:
+            while fill:
+                start, step, remaining = fill[0]
+                if steps is None:
+                    count = remaining
+                elif steps > 0:
+                    count = min(steps, remaining)
+                    steps -= count
+                else:
+                    break
+                decoded = dict()
+                key = self._decode_records(
+                    self.cursor,
+                    start,
+                    step,
+                    count,
+                    self.objects,
+                    self.readahead_objects,
+                    decoded,
+                )
+                rows.update(decoded)
+                self.readahead_objects.update(decoded)
+                if key is None or count == remaining:
+                    del fill[0]
+                else:
+                    fill[0] = [key, step, remaining - count]
+        finally:
+            self.end_client_read()
+        if fill:
+            return False
+        self._readahead_fill = None
+        self._readahead_rows = dict()
+        self.readahead_objects = rows
+        return True
+
+    def get_record_count(self):
+        """Return number of records available to cursor.
+
+        The count is noted for reuse unless the datasource says counts
+        cannot be cached.  Updates noted by adjust_record_counts since the
+        count was noted are applied first.  The cursor must exist.
+
+        """
+        key = self.datasource.record_count_key(self.partial)
+        if key is None:
+            return self.cursor.count_records()
+        count = self.record_counts.get(key)
+        for instance in self._record_count_changes.pop(key, ()):
+            if count is None:
+                break
+            change = self._get_record_count_change(
+                self.datasource, self.partial, instance
+            )
+            if change is None:
+                count = None
+            else:
+                count += change
+        if count is None:
+            count = self.cursor.count_records()
+        self.record_counts[key] = count
+        return count
+
+    def get_visible_key_range(self):
+        """Return (partial key, first key, last key) displayed or None.
+
+        DataSource.refresh_widgets uses the range to decide if an update
+        may change the display.  None means any update may do so, and is
+        returned unless view_is_full is True.
+
+        """
+        if not self.view_is_full or not self.keys:
+            return None
+        return (self.partial, self.keys[0], self.keys[-1])
+
     def load_object(self, key):
-        """Create a new row and populate it with data from record for key."""
+        """Create a new row and populate it with data from record for key.
+
+        The row decoded in advance for key by fill_readahead is used if
+        available.
+
+        """
+        newrow = self.readahead_objects.pop(key, None)
+        if newrow is None:
+            # Adjusted to catch exception diplaying grid after drop table.
+            # self.objects[key] = newrow
+            newrow = self.make_object(key)
+        self.objects[key] = newrow
+
+    def make_object(self, key):
+        """Return a new row populated with data from record for key.
+
+        The record is taken from record_cache, if set, when another client
+        has decoded it already.
+
+        """
         newrow = self.datasource.new_row()
-        # Adjusted to catch exception diplaying grid after drop table.
-        # self.objects[key] = newrow
+        if self.record_cache is not None:
+            self.record_cache.load_row(self.datasource, key, newrow)
+            return newrow
         newrow.load_instance(
             self.datasource.dbhome,
             self.datasource.dbset,
             self.datasource.dbname,
             key,
         )
-        self.objects[key] = newrow
+        return newrow
 
     def refresh_cursor(self, instance=None):
         """Modify cursor data structures after database update.
@@ -282,15 +683,30 @@ class DataClient(_DataAccess):
         # the end of large recordsets in DPT.  This introduced the problem of
         # dealing with record deletion and addition because the DPT foundsets
         # may no longer agree with the existence bitmap.
+        # A cursor kept open by cursor_idle_timeout is closed so the next
+        # read uses a new cursor which sees the update.
+        if self._client_read_idle is not None:
+            self.close_client_read()
+        self.clear_readahead()
+        if self.record_cache is not None and self.datasource is not None:
+            self.record_cache.on_data_change(self.datasource, instance)
         if self.cursor:
             self.cursor.refresh_recordset(instance)
 
     def set_partial_key(self, key=None):
         """Set a partial key. key=None unsets partial key."""
         super().set_partial_key(key)
+        self.clear_readahead()
         if self.cursor:
             self.cursor.set_partial_key(self.partial)
 
+    def set_data_source(self, source=None, callback=None):
+        """Extend to discard reads kept open or done on current datasource."""
+        if self._client_read_idle is not None:
+            self.close_client_read()
+        self.clear_readahead()
+        super().set_data_source(source=source, callback=callback)
+
 
 class DataLookup(_DataAccess):
     """Provide a cache of records from a database with unique keys.
@@ -303,38 +719,129 @@ class DataLookup(_DataAccess):
     def __init__(self, **kwargs):
         """Extend _DataAccess with cache of records read from database.
 
-        self.keys: the variable set of record keys.
-                   [pkey1, pkey2, ...] or [skey1, skey2, ...]
-        self.rowmax: maximum number of records to be held in self.keys.
-        self.rowmin: number of records to be held in self.keys after
-                     trimming when self.rowmax reached.
-        self.cache: the unpickled values for the records in self.keys.
+        self.cache: the unpickled values for records read, least recently
+                   used first.
                    {pkey : unpickled value, ...} or
                    {skey : unpickled primary value, ...}
+        self.rowmax: maximum number of records held in self.cache.
+        self.bytemax: maximum of estimated bytes held in self.cache, or
+                      None for no limit.
+        self.ttl: seconds a record is held in self.cache before it is read
+                  from database again, or None to hold until evicted.
+        self.hits, self.misses, self.evictions: counts of load_cache
+                  calls answered from self.cache, calls which read the
+                  database, and records removed to keep within limits.
 
         """
         super().__init__(**kwargs)
-        self.keys = []
         self.rowmax = 100
-        self.rowmin = 10
-        self.cache = dict()
+        self.bytemax = None
+        self.ttl = None
+        self.cache = OrderedDict()
+        self._cache_sizes = dict()
+        self._cache_expiry = dict()
+        self._cache_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def close(self):
         """Not implemented."""
 
+    def estimate_size(self, record):
+        """Return estimated bytes held in cache for record.
+
+        record is (key, value) read from database.  Subclasses should
+        override this method if the size of value is a poor estimate.
+
+        """
+        return sys.getsizeof(record[1])
+
+    def get_cache_statistics(self):
+        """Return dict of cache size and hit, miss, and eviction, counts."""
+        return dict(
+            entries=len(self.cache),
+            bytes=self._cache_bytes,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
     def load_cache(self, key):
         """Return new row for record key from cache after adding if absent.
 
-        Delete old entries if necessary to keep within cache size limits.
+        Delete least recently used entries if necessary to keep within
+        cache size limits.
 
         """
-        if key in self.cache:
+        if self.is_cached(key):
+            self.hits += 1
+            self.cache.move_to_end(key)
             return self.cache[key]
+        self.misses += 1
         record = self.get_record(self.datasource.get_database().get(key))
-        if record:
-            value = (key, record)
-        else:
+        if not record:
             return None
+        return self._add_cache_entry(key, record)
+
+    def load_many(self, keys):
+        """Return dict of new rows for record keys from cache.
+
+        Records absent from cache are read in key order, within one
+        read-only transaction, and added to cache.  The transaction of a
+        DataClient read in progress on the database is used if there is
+        one.  The dict is in order
+        of first appearance of each key in keys, and the value for a key
+        with no record is None.
+
+        """
+        rows = dict.fromkeys(keys)
+        cache = self.cache
+        misses = []
+        for key in rows:
+            if self.is_cached(key):
+                self.hits += 1
+                cache.move_to_end(key)
+                rows[key] = cache[key]
+            else:
+                misses.append(key)
+        if not misses:
+            return rows
+        try:
+            misses.sort()
+        except TypeError:
+            pass
+        dbhome = self.datasource.dbhome
+        start_read(dbhome)
+        try:
+            database = self.datasource.get_database()
+            for key in misses:
+                self.misses += 1
+                record = self.get_record(database.get(key))
+                if record:
+                    rows[key] = self._add_cache_entry(key, record)
+        finally:
+            end_read(dbhome)
+        return rows
+
+    def is_cached(self, key):
+        """Return True if cache has unexpired entry for key.
+
+        An expired entry is removed from cache.
+
+        """
+        if key not in self.cache:
+            return False
+        expiry = self._cache_expiry.get(key)
+        if expiry is None or expiry > time.monotonic():
+            return True
+        self.discard_cache_entry(key)
+        return False
+
+    def _add_cache_entry(self, key, record):
+        """Return new row for record after adding it to cache as key."""
+        cache = self.cache
+        value = (key, record)
         newrow = self.datasource.new_row()
         newrow.load_instance(
             self.datasource.dbhome,
@@ -342,30 +849,73 @@ class DataLookup(_DataAccess):
             self.datasource.dbname,
             value,
         )
-        self.cache[key] = newrow
-        self.keys.append(key)
-        if len(self.keys) > self.rowmax:
-            cache = self.cache
-            for k in self.keys[: -self.rowmin]:
-                del cache[k]
-            del self.keys[: -self.rowmin]
+        cache[key] = newrow
+        size = self.estimate_size(record)
+        self._cache_sizes[key] = size
+        self._cache_bytes += size
+        if self.ttl is not None:
+            self._cache_expiry[key] = time.monotonic() + self.ttl
+        bytemax = self.bytemax
+        while len(cache) > 1 and (
+            len(cache) > self.rowmax
+            or (bytemax is not None and self._cache_bytes > bytemax)
+        ):
+            self.discard_cache_entry(next(iter(cache)))
+            self.evictions += 1
         return newrow
 
+    def discard_cache_entry(self, key):
+        """Remove entry for key from cache if present."""
+        self.cache.pop(key, None)
+        self._cache_bytes -= self._cache_sizes.pop(key, 0)
+        self._cache_expiry.pop(key, None)
+
     def on_data_change(self, instance):
-        """Not implemented.  Raises RuntimeError exception."""
-        raise RuntimeError("Not implemented")
+        """Discard cache entries for keys affected by update to instance.
+
+        The keys of instance, and of it's newrecord attribute if the update
+        is an edit, are taken from the get_keys methods.  The next
+        load_cache call for any of these keys reads the database.  The
+        whole cache is discarded if instance is None or the keys cannot be
+        found.
+
+        """
+        if instance is None or self.datasource is None:
+            self.clear_cache()
+            return
+        datasource = self.datasource
+        try:
+            newrecord = instance.__dict__.get("newrecord")
+            keys = instance.get_keys(datasource)
+            if newrecord:
+                keys = keys + newrecord.get_keys(datasource)
+            for key in keys:
+                self.discard_cache_entry(key[0])
+        except Exception:
+            self.clear_cache()
+
+    def clear_cache(self):
+        """Remove all entries from cache."""
+        self.cache.clear()
+        self._cache_sizes.clear()
+        self._cache_expiry.clear()
+        self._cache_bytes = 0
 
 
 class DataSourceError(Exception):
     """Exception for DataSource class."""
 
 
-class DataSource:
+class DataSource(NotificationQueue):
     """Provide interface to database records and update notifications.
 
     This class is designed to work with records defined by subclasses of
     Record accesed via subclasses of DataNotify.
 
+    Clients are held in a ClientRegistry so they are not kept alive by the
+    DataSource.  Notifications can be coalesced using the NotificationQueue
+    methods.
+
     """
 
     def __init__(
@@ -380,7 +930,7 @@ class DataSource:
 
         """
         super().__init__(**kwargs)
-        self.clients = {}
+        self.clients = ClientRegistry()
         if dbhome.exists(dbset, dbname):
             self.dbhome = dbhome
             self.dbset = dbset
@@ -421,6 +971,14 @@ class DataSource:
         newrow.dbname = self.dbname
         return newrow
 
+    def record_count_key(self, partial):
+        """Return key for count of records selected by partial key.
+
+        DataClient instances cache record counts using the key.
+
+        """
+        return (self.dbset, self.dbname, partial)
+
     def register_in(self, client, callback):
         """Register client for update notification using callback."""
         if callable(callback):
@@ -430,11 +988,75 @@ class DataSource:
         """Cancel registration of client for update notification."""
         if client in self.clients:
             del self.clients[client]
+        self.discard_notifications(client)
+
+    def report_live_clients(self):
+        """Return {class name: number of live clients, ...} registered."""
+        return self.clients.report_live_clients()
 
     def refresh_widgets(self, instance):
-        """Notify registered clients about database update for instance."""
+        """Notify registered clients about database update for instance.
+
+        Clients with an on_data_change_out_of_view method are told about
+        the update by calling it, rather than the callback, if none of the
+        keys of instance are in the range of keys displayed by the client.
+
+        """
+        keys = self.get_notification_keys(instance)
         for client in self.clients:
-            self.clients[client](instance)
+            if keys and not self.is_update_in_view(client, keys):
+                callback = getattr(client, "on_data_change_out_of_view", None)
+                if callback is not None:
+                    callback(instance)
+                    continue
+            self.queue_notification(client, self.clients[client], instance)
+
+    def get_notification_keys(self, instance):
+        """Return keys changed in this datasource by update for instance.
+
+        The keys of instance, and of it's newrecord attribute if the update
+        is an edit, are returned.  An empty list means the keys are not
+        known.
+
+        """
+        if instance is None:
+            return []
+        try:
+            keys = instance.get_keys(self)
+            newrecord = instance.__dict__.get("newrecord")
+            if newrecord:
+                keys = keys + newrecord.get_keys(self)
+        except Exception:
+            return []
+        return keys
+
+    def is_update_in_view(self, client, keys):
+        """Return True if update to keys may change display in client.
+
+        keys are (key, value) tuples compared on key with the range of keys
+        given by the client's get_visible_key_range method.  Comparison on
+        key alone includes records with the same key either side of the
+        range, but avoids comparing values encoded differently by
+        get_keys and cursors.  Keys which do not start with the client's
+        partial key are not displayed.
+
+        """
+        get_visible_key_range = getattr(client, "get_visible_key_range", None)
+        if get_visible_key_range is None:
+            return True
+        key_range = get_visible_key_range()
+        if key_range is None:
+            return True
+        partial, low, high = key_range
+        for key in keys:
+            try:
+                if partial and not key[0].startswith(partial):
+                    continue
+                if low[0] <= key[0] <= high[0]:
+                    return True
+            except (AttributeError, TypeError, IndexError):
+                return True
+        return False
 
     @property
     def dbidentity(self):
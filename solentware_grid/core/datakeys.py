@@ -0,0 +1,213 @@
+# datakeys.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Lists of record keys with fast membership and position lookup.
+
+DataKeys holds the keys of the records displayed by a DataClient in
+display order.  A DataGridBase instance asks if a key is displayed, and
+where, many times for each navigation action, so DataKeys keeps a dict
+of the keys alongside the list.  The keys are added and removed at the
+ends of the list almost always, which is done without renumbering the
+other keys.
+
+SortedKeys holds bookmarks in key order, where membership and position
+are found by binary search.
+
+Both classes are list subclasses so code which treats them as lists,
+including code which replaces them with lists, continues to work.
+
+"""
+
+import bisect
+
+
+class DataKeys(list):
+    """List of unique hashable keys with constant time 'in' and index.
+
+    Positions are held as sequence numbers relative to the sequence
+    number of the first key.  Changes to the ends of the list adjust the
+    sequence numbers of the changed keys only: other changes renumber
+    all the keys.
+
+    """
+
+    def __init__(self, iterable=()):
+        """Create list from keys in iterable and note their positions."""
+        super().__init__(iterable)
+        self._positions = {}
+        self._first = 0
+        self._renumber()
+
+    def _renumber(self):
+        """Note position of every key."""
+        self._first = 0
+        self._positions = {key: number for number, key in enumerate(self)}
+
+    def __contains__(self, key):
+        """Return True if key is in list."""
+        try:
+            return key in self._positions
+        except TypeError:
+            return False
+
+    def index(self, key, *args):
+        """Return position of key in list.
+
+        The list.index method is used if start or stop arguments are given.
+
+        """
+        if args:
+            return super().index(key, *args)
+        try:
+            return self._positions[key] - self._first
+        except (KeyError, TypeError):
+            raise ValueError(repr(key) + " is not in list") from None
+
+    def append(self, key):
+        """Append key to end of list."""
+        self._positions[key] = self._first + len(self)
+        super().append(key)
+
+    def extend(self, iterable):
+        """Append keys in iterable to end of list."""
+        for key in iterable:
+            self.append(key)
+
+    def __iadd__(self, iterable):
+        """Append keys in iterable to end of list."""
+        self.extend(iterable)
+        return self
+
+    def insert(self, index, key):
+        """Insert key before index."""
+        if index <= -len(self) or index == 0:
+            self._first -= 1
+            self._positions[key] = self._first
+            super().insert(0, key)
+        elif index >= len(self):
+            self.append(key)
+        else:
+            super().insert(index, key)
+            self._renumber()
+
+    def pop(self, index=-1):
+        """Remove and return key at index, default last."""
+        key = self[index]
+        del self[index]
+        return key
+
+    def remove(self, key):
+        """Remove key from list."""
+        del self[self.index(key)]
+
+    def clear(self):
+        """Remove all keys from list."""
+        super().clear()
+        self._renumber()
+
+    def __delitem__(self, index):
+        """Delete key, or keys if slice, at index."""
+        length = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(length)
+            if step != 1 or start >= stop:
+                super().__delitem__(index)
+                self._renumber()
+                return
+            removed = self[start:stop]
+            super().__delitem__(index)
+            if start and stop < length:
+                self._renumber()
+                return
+            for key in removed:
+                del self._positions[key]
+            if not start:
+                self._first += stop
+            return
+        if index < 0:
+            index += length
+        key = self[index]
+        super().__delitem__(index)
+        if index == 0:
+            del self._positions[key]
+            self._first += 1
+        elif index == length - 1:
+            del self._positions[key]
+        else:
+            self._renumber()
+
+    def __setitem__(self, index, value):
+        """Set key, or keys if slice, at index."""
+        super().__setitem__(index, value)
+        self._renumber()
+
+    def __imul__(self, count):
+        """Repeat keys in list count times, which must be 0 or 1."""
+        super().__imul__(count)
+        self._renumber()
+        return self
+
+    def sort(self, *args, **kwargs):
+        """Sort keys in list."""
+        super().sort(*args, **kwargs)
+        self._renumber()
+
+    def reverse(self):
+        """Reverse order of keys in list."""
+        super().reverse()
+        self._renumber()
+
+    def copy(self):
+        """Return copy of list as a DataKeys instance."""
+        return DataKeys(self)
+
+
+class SortedKeys(list):
+    """List of keys kept in ascending order with binary search lookup.
+
+    append and add insert the key at it's place in the order and do
+    nothing if the key is present already.
+
+    """
+
+    def __init__(self, iterable=()):
+        """Create list of unique keys in iterable sorted in key order."""
+        super().__init__(sorted(set(iterable)))
+
+    def add(self, key):
+        """Insert key in order if not present."""
+        index = bisect.bisect_left(self, key)
+        if index == len(self) or self[index] != key:
+            super().insert(index, key)
+
+    append = add
+
+    def extend(self, iterable):
+        """Insert keys in iterable in order if not present."""
+        for key in iterable:
+            self.add(key)
+
+    def __contains__(self, key):
+        """Return True if key is in list."""
+        try:
+            index = bisect.bisect_left(self, key)
+        except TypeError:
+            return False
+        return index != len(self) and self[index] == key
+
+    def index(self, key, *args):
+        """Return position of key in list.
+
+        The list.index method is used if start or stop arguments are given.
+
+        """
+        if args:
+            return super().index(key, *args)
+        if key not in self:
+            raise ValueError(repr(key) + " is not in list")
+        return bisect.bisect_left(self, key)
+
+    def remove(self, key):
+        """Remove key from list."""
+        del self[self.index(key)]
@@ -8,8 +8,11 @@ This module designed to work with the dataclient module.
 
 """
 
+from .clientregistry import ClientRegistry
+from .notificationqueue import NotificationQueue
 
-class DataRegister:
+
+class DataRegister(NotificationQueue):
     """Register the interest of a DataSource instance in updates to an index.
 
     Maintain a dictionary of callback methods:
@@ -20,6 +23,11 @@ class DataRegister:
     dictionary allows the indexes to be cross referenced so that all controls
     that may be displaying the updated instance get a chance to refresh.
 
+    The callbacks for each index are held in a ClientRegistry so clients
+    are not kept alive by the register.
+
+    Notifications can be coalesced using the NotificationQueue methods.
+
     """
 
     def __init__(self, **kargs):
@@ -51,14 +59,34 @@ class DataRegister:
         """
         if dskey in self.datasources:
             for client in self.datasources[dskey]:
-                self.datasources[dskey][client](instance)
+                self.queue_notification(
+                    client, self.datasources[dskey][client], instance
+                )
+
+    def report_live_clients(self):
+        """Return {dskey: {class name: number of live clients, ...}, ...}.
+
+        Entries for dskeys with no live clients are removed.
+
+        """
+        report = {}
+        for dskey, clients in list(self.datasources.items()):
+            live = {}
+            for client in clients:
+                name = type(client).__name__
+                live[name] = live.get(name, 0) + 1
+            if live:
+                report[dskey] = live
+            else:
+                del self.datasources[dskey]
+        return report
 
     def register_in(self, client, callback):
         """Register callback for updates to current DataSource of client."""
         source = client.datasource
         key = (source.dbhome, source.dbset, source.dbname)
         if key not in self.datasources:
-            self.datasources[key] = dict()
+            self.datasources[key] = ClientRegistry()
         self.datasources[key][client] = callback
 
     def register_out(self, client):
@@ -69,7 +97,9 @@ class DataRegister:
         """
         if client is None:
             self.datasources.clear()
+            self._queued_notifications.clear()
             return
+        self.discard_notifications(client)
         source = client.datasource
         key = (source.dbhome, source.dbset, source.dbname)
         if key in self.datasources:
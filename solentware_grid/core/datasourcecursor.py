@@ -37,6 +37,10 @@ class DataSourceCursor(DataSource):
         """Create and return cursor on this datasource's recordset."""
         return self.dbhome.get_datasourcecursor_recordset_cursor(self)
 
+    def record_count_key(self, partial):
+        """Return None because record count depends on recordset."""
+        return None
+
     def set_recordset(self, recordset):
         """Set recordset as this datasource's recordset."""
         self.dbhome.set_datasourcecursor_recordset(self, recordset)
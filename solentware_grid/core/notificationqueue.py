@@ -0,0 +1,138 @@
+# notificationqueue.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Coalesce update notifications to clients of DataSource and DataRegister.
+
+DataSource.refresh_widgets and DataRegister.refresh_after_update call the
+callback of every registered client for every update.  A batch of edits
+causes each DataGrid to refill itself once per edit.
+
+A NotificationQueue delivers the notifications immediately unless they
+are being coalesced.  Notifications are coalesced between begin_batch and
+end_batch calls, usually around a transaction, and, if an after function
+is given by set_notification_window, for a time after the first queued
+notification.  The notifications queued for a client are delivered in one
+call when the batch ends, the time elapses, or flush_notifications is
+called.
+
+A single queued instance is delivered to the callback as usual.  Several
+instances are given, as a list, to the client's on_data_changes method if
+it has one, otherwise the callback is called with None which means refresh
+as close as possible to the existing display.
+
+"""
+
+
+class NotificationQueue:
+    """Queue update notifications per client and deliver them together.
+
+    Subclasses call queue_notification(client, callback, instance) where
+    they would call callback(instance).
+
+    """
+
+    def __init__(self, **kwargs):
+        """Extend to deliver notifications immediately by default."""
+        super().__init__(**kwargs)
+        self.notification_delay = None
+        self.notification_after = None
+        self._notification_batch_depth = 0
+        self._notification_flush_scheduled = False
+
+        # {client: (callback, [instance, ...]), ...}
+        self._queued_notifications = dict()
+
+    def set_notification_window(self, delay=None, after=None):
+        """Set time, in milliseconds, notifications are queued.
+
+        after - function like tkinter's Misc.after which calls a function
+        after delay milliseconds.
+
+        Notifications are not delayed, except between begin_batch and
+        end_batch calls, if delay or after is None.
+
+        """
+        self.notification_delay = delay
+        self.notification_after = after
+
+    def begin_batch(self):
+        """Queue notifications until matching end_batch call."""
+        self._notification_batch_depth += 1
+
+    def end_batch(self):
+        """Deliver queued notifications if this ends the outermost batch."""
+        if self._notification_batch_depth:
+            self._notification_batch_depth -= 1
+        if self._notification_batch_depth:
+            return
+        self.flush_notifications()
+
+    def is_coalescing(self):
+        """Return True if notifications are queued rather than delivered."""
+        return bool(
+            self._notification_batch_depth
+            or (
+                self.notification_delay is not None
+                and self.notification_after is not None
+            )
+        )
+
+    def queue_notification(self, client, callback, instance):
+        """Queue, or deliver, notification of update for instance to client.
+
+        A flush is scheduled if a notification window is set and none is
+        scheduled already.
+
+        """
+        if not self.is_coalescing():
+            callback(instance)
+            return
+        queued = self._queued_notifications.get(client)
+        if queued is None:
+            self._queued_notifications[client] = (callback, [instance])
+        else:
+            queued[1].append(instance)
+        if self._notification_flush_scheduled:
+            return
+        if self.notification_delay is None or self.notification_after is None:
+            return
+        self._notification_flush_scheduled = True
+        self.notification_after(
+            self.notification_delay, self._flush_scheduled_notifications
+        )
+
+    def discard_notifications(self, client):
+        """Discard notifications queued for client."""
+        self._queued_notifications.pop(client, None)
+
+    def flush_notifications(self):
+        """Deliver all queued notifications, one call per client."""
+        while self._queued_notifications:
+            queued = self._queued_notifications
+            self._queued_notifications = dict()
+            for client, (callback, instances) in queued.items():
+                _deliver_notifications(client, callback, instances)
+
+    def _flush_scheduled_notifications(self):
+        """Deliver queued notifications when notification window closes.
+
+        Delivery is left to end_batch if a batch is in progress.
+
+        """
+        self._notification_flush_scheduled = False
+        if self._notification_batch_depth:
+            return
+        self.flush_notifications()
+
+
+def _deliver_notifications(client, callback, instances):
+    """Deliver notification of updates for instances to client."""
+    if len(instances) == 1:
+        callback(instances[0])
+        return
+    on_data_changes = getattr(client, "on_data_changes", None)
+    if on_data_changes is None or any(i is None for i in instances):
+        callback(None)
+        return
+    on_data_changes(instances)
@@ -0,0 +1,260 @@
+# positionestimator.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Estimate positions of records from a sparse index of checkpoints.
+
+The DataGridBase class asks the cursor for the exact position of the top
+record in the grid whenever the vertical scrollbar is set, and for the
+record at a position when the slider is moved.  These requests are slow
+on database engines which do not maintain record counts, such as Berkeley
+DB.
+
+A PositionEstimator takes a (position, record) checkpoint every so many
+records in one pass through the cursor and answers later requests by
+binary search of the checkpoints.  The pass can be done in steps of a few
+thousand records, so a client can take the checkpoints when idle rather
+than block while walking every record.  The checkpoints are discarded
+when too many updates have been noted or when the records come from a
+different source, so they are rebuilt on next use.
+
+A record at a position is found by moving a cursor from the nearest
+checkpoint, so the checkpoints are close enough together for the move to
+be quick.
+
+"""
+
+import bisect
+import numbers
+
+# Number of checkpoints taken by default when walking the cursor.
+CHECKPOINTS = 1024
+
+# Number of records walked by default in each step of a build.
+BUILD_STEP = 5000
+
+# Number of database updates tolerated by default before checkpoints are
+# rebuilt.  Each update moves following positions by at most one record.
+MAXIMUM_CHANGES = 100
+
+
+class PositionEstimator:
+    """Estimate record positions in a cursor from sampled checkpoints.
+
+    checkpoints - approximate number of checkpoints taken from a cursor.
+    maximum_changes - number of updates noted before checkpoints are stale.
+    refine - True means clients should replace estimates with exact
+    positions when idle.
+
+    Positions are counted from 1 like get_position_of_record methods of
+    solentware_base cursors.
+
+    """
+
+    def __init__(
+        self,
+        checkpoints=CHECKPOINTS,
+        maximum_changes=MAXIMUM_CHANGES,
+        refine=False,
+    ):
+        """Create an empty estimator."""
+        self.checkpoints = checkpoints
+        self.maximum_changes = maximum_changes
+        self.refine = refine
+        self.positions = []
+        self.records = []
+        self.count = 0
+        self.changes = 0
+        self.source = None
+
+        # State of a build done in steps by continue_build.
+        self._building = False
+        self._build_source = None
+        self._build_stride = 1
+        self._build_record = None
+
+    def clear(self):
+        """Discard the checkpoints and any build in progress."""
+        self.positions = []
+        self.records = []
+        self.count = 0
+        self.changes = 0
+        self.source = None
+        self._building = False
+        self._build_source = None
+        self._build_stride = 1
+        self._build_record = None
+
+    def is_valid(self, source):
+        """Return True if checkpoints are usable for records from source.
+
+        source - any value, compared with == to the value given to build,
+        which identifies the records available from the cursor.
+
+        """
+        return bool(
+            self.positions
+            and self.changes <= self.maximum_changes
+            and self.source == source
+        )
+
+    def note_change(self):
+        """Note a database update which may move records in the cursor."""
+        self.changes += 1
+
+    def is_building(self, source):
+        """Return True if a build for records from source is in progress."""
+        return self._building and self._build_source == source
+
+    def build(self, cursor, source):
+        """Take checkpoints from cursor in one pass through it's records.
+
+        cursor - positioned anywhere, which is moved through the records.
+        source - identifies the records available from cursor.
+
+        """
+        self.start_build(cursor, source)
+        while not self.continue_build(cursor, steps=None):
+            pass
+
+    def start_build(self, cursor, source):
+        """Discard checkpoints and prepare to take them from cursor.
+
+        cursor - used to count the records.
+        source - identifies the records available from cursor.
+
+        The checkpoints are taken by calls of continue_build.
+
+        """
+        self.clear()
+        count = cursor.count_records()
+        self._build_stride = max(1, count // max(1, self.checkpoints))
+        self._building = True
+        self._build_source = source
+
+    def continue_build(self, cursor, steps=BUILD_STEP):
+        """Take checkpoints from up to steps records and return True if done.
+
+        cursor - a cursor on the records given to start_build, which may
+        be a different cursor for each call.
+        steps - number of records walked, or None to walk all records.
+
+        The walk continues from the record after the last one seen in the
+        previous call.  It starts again if that record has been deleted.
+
+        """
+        if not self._building:
+            return True
+        positions = self.positions
+        records = self.records
+        stride = self._build_stride
+        position = self.count
+        last = self._build_record
+        if last is None:
+            record = cursor.first()
+        elif cursor.setat(last) is None:
+            self.start_build(cursor, self._build_source)
+            return False
+        else:
+            record = cursor.next()
+        while record is not None:
+            if steps is not None:
+                if not steps:
+                    self.count = position
+                    self._build_record = last
+                    return False
+                steps -= 1
+            position += 1
+            if not (position - 1) % stride:
+                positions.append(position)
+                records.append(record)
+            last = record
+            record = cursor.next()
+        if position and positions[-1] != position:
+            positions.append(position)
+            records.append(last)
+        self.count = position
+        self.source = self._build_source
+        self._building = False
+        self._build_source = None
+        self._build_record = None
+        return True
+
+    def estimate_position(self, record):
+        """Return estimated position of record or None if not possible.
+
+        The position of a checkpoint is exact.  Positions between
+        checkpoints are interpolated on the first element of the records
+        if numeric, otherwise the mid-point is taken.
+
+        """
+        if record is None:
+            return 0
+        if not self.positions:
+            return None
+        records = self.records
+        try:
+            index = bisect.bisect_left(records, record)
+        except TypeError:
+            return None
+        positions = self.positions
+        if index == len(records):
+            return positions[-1]
+        if records[index] == record or index == 0:
+            return positions[index]
+        low = positions[index - 1]
+        high = positions[index]
+        fraction = _fraction_between(
+            records[index - 1], records[index], record
+        )
+        return min(high - 1, low + max(1, int((high - low) * fraction)))
+
+    def estimate_record(self, position):
+        """Return record at checkpoint nearest position or None.
+
+        position - counted from 1, or from -1 backwards from the end.
+
+        """
+        return self.nearest_checkpoint(position)[0]
+
+    def nearest_checkpoint(self, position):
+        """Return (record, offset) for checkpoint nearest position.
+
+        position - counted from 1, or from -1 backwards from the end.
+
+        offset is the number of records from the checkpoint record to the
+        record at position: negative if position is before the checkpoint.
+        (None, 0) is returned if there are no checkpoints.
+
+        """
+        if not self.positions:
+            return None, 0
+        if position < 0:
+            position += self.count + 1
+        position = max(1, min(position, self.count))
+        positions = self.positions
+        index = bisect.bisect_left(positions, position)
+        if index == len(positions):
+            index -= 1
+        elif index and position - positions[index - 1] < (
+            positions[index] - position
+        ):
+            index -= 1
+        return self.records[index], position - positions[index]
+
+
+def _fraction_between(low, high, record):
+    """Return fraction of distance of record between low and high records.
+
+    Records are compared on their first element if they are tuples.  The
+    mid-point, 0.5, is assumed if the values are not all numbers.
+
+    """
+    values = [r[0] if isinstance(r, tuple) else r for r in (low, high, record)]
+    for value in values:
+        if not isinstance(value, numbers.Real) or isinstance(value, bool):
+            return 0.5
+    low, high, record = values
+    if high <= low:
+        return 0.5
+    return min(1.0, max(0.0, (record - low) / (high - low)))
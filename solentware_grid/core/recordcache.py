@@ -0,0 +1,177 @@
+# recordcache.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Cache of decoded records shared by DataClient instances.
+
+Each DataClient decodes the records it displays by calling load_instance
+on a new row.  Several grids, and the DataShow and DataEdit dialogs, can
+display the same records so each pays for the same decode.
+
+A RecordCache holds the attributes bound by load_instance for each record,
+keyed by (DataSource.dbidentity, dbset, dbname, key) where key is the
+record as returned by the cursor.  The key and value attributes are always
+held because load_instance fills them in place.  Each client is given a
+new row, from the datasource's new_row method, with deep copies of the
+held attributes: so rows never share decoded data, or their widgets and
+bindings, with each other or with the cache.  The database attribute is
+shared, not copied.
+
+Entries are discarded using the keys given by the get_keys method of the
+record in update notifications from DataSource.refresh_widgets, so the
+cache can be kept for the whole session.
+
+No cache is used unless a DataClient's record_cache attribute is set, to
+a RecordCache of it's own or to the one from get_shared_record_cache.
+
+"""
+
+import copy
+import weakref
+from collections import OrderedDict
+
+# Number of decoded records held by default.
+MAXIMUM_RECORDS = 1000
+
+# Row attributes always held because load_instance fills them in place.
+_RECORD_ATTRIBUTES = ("key", "value")
+
+
+class RecordCache:
+    """Hold decoded records least recently used first.
+
+    maximum_records - number of records held before the least recently
+    used are discarded.
+
+    """
+
+    def __init__(self, maximum_records=MAXIMUM_RECORDS):
+        """Create an empty cache."""
+        self.maximum_records = maximum_records
+        self.records = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # The datasources whose records are in cache, to get the keys of
+        # updated records.  {(dbidentity, dbset, dbname): DataSource, ...}
+        self._datasources = weakref.WeakValueDictionary()
+
+    def clear(self):
+        """Discard all records."""
+        self.records.clear()
+        self._datasources.clear()
+
+    def load_row(self, datasource, key, row):
+        """Populate row with record for key in datasource.
+
+        row - a new row from datasource's new_row method.
+
+        The record is decoded by row.load_instance, and the attributes it
+        binds are held, unless held already: then row is given copies of
+        the held attributes.
+
+        """
+        try:
+            cache_key = _cache_key(datasource, key)
+        except TypeError:
+            cache_key = None
+        if cache_key is not None:
+            record = self.records.get(cache_key)
+            if record is not None:
+                self.hits += 1
+                self.records.move_to_end(cache_key)
+                row.__dict__.update(_copy_record(record, datasource))
+                return
+            self.misses += 1
+        initial = dict(row.__dict__)
+        row.load_instance(
+            datasource.dbhome, datasource.dbset, datasource.dbname, key
+        )
+        if cache_key is None:
+            return
+        record = {
+            name: value
+            for name, value in row.__dict__.items()
+            if name in _RECORD_ATTRIBUTES
+            or name not in initial
+            or initial[name] is not value
+        }
+        self.records[cache_key] = _copy_record(record, datasource)
+        self._datasources[cache_key[:-1]] = datasource
+        records = self.records
+        while len(records) > self.maximum_records:
+            records.popitem(last=False)
+            self.evictions += 1
+
+    def get_statistics(self):
+        """Return dict of cache size and hit, miss, and eviction, counts."""
+        return dict(
+            entries=len(self.records),
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+    def on_data_change(self, datasource, instance):
+        """Discard records made stale by database update for instance.
+
+        The records for the keys of instance, and of it's newrecord
+        attribute if the update is an edit, are discarded for every
+        database in the datasource's dbset.  All records for the dbset are
+        discarded if instance is None or the keys cannot be found.
+
+        """
+        try:
+            dbset = (datasource.dbidentity, datasource.dbset)
+        except Exception:
+            self.clear()
+            return
+        records = self.records
+        names = {k[:-1] for k in records if k[:2] == dbset}
+        for name in names:
+            source = self._datasources.get(name)
+            try:
+                if instance is None or source is None:
+                    raise ValueError
+                instances = [instance]
+                newrecord = instance.__dict__.get("newrecord")
+                if newrecord:
+                    instances.append(newrecord)
+                for record in instances:
+                    for key in record.get_keys(source):
+                        records.pop(name + (key,), None)
+            except Exception:
+                for cache_key in [k for k in records if k[:-1] == name]:
+                    del records[cache_key]
+
+
+def _cache_key(datasource, key):
+    """Return key of record for key in datasource in RecordCache.
+
+    TypeError is raised if key is not hashable.
+
+    """
+    cache_key = (datasource.dbidentity, datasource.dbset, datasource.dbname)
+    cache_key += (key,)
+    hash(cache_key)
+    return cache_key
+
+
+def _copy_record(record, datasource):
+    """Return deep copy of record attributes sharing datasource.dbhome."""
+    dbhome = datasource.dbhome
+    return copy.deepcopy(record, memo={id(dbhome): dbhome})
+
+
+# The cache shared by DataClient instances which set their record_cache
+# attribute to it.  It is created by the first get_shared_record_cache call.
+_shared_record_cache = None
+
+
+def get_shared_record_cache():
+    """Return the RecordCache shared by DataClient instances which opt in."""
+    global _shared_record_cache
+    if _shared_record_cache is None:
+        _shared_record_cache = RecordCache()
+    return _shared_record_cache
@@ -0,0 +1,112 @@
+# test_clientregistry.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""clientregistry tests"""
+
+import unittest
+import gc
+import weakref
+
+from .. import clientregistry
+
+
+class ClientRegistry(unittest.TestCase):
+    def setUp(self):
+        class Client:
+            def callback(self, instance):
+                pass
+
+        self.Client = Client
+        self.registry = clientregistry.ClientRegistry()
+
+    def tearDown(self):
+        pass
+
+    def test_001___init___001(self):
+        def f(instance):
+            pass
+
+        registry = clientregistry.ClientRegistry({"client": f})
+        self.assertEqual(registry, {"client": f})
+        self.assertEqual(len(registry), 1)
+
+    def test_002___setitem___001(self):
+        client = self.Client()
+        self.registry[client] = client.callback
+        self.registry["name"] = print
+        self.assertEqual(self.registry[client], client.callback)
+        self.assertIs(self.registry["name"], print)
+        self.assertEqual(client in self.registry, True)
+        self.assertEqual(len(self.registry), 2)
+
+    def test_003___delitem___001(self):
+        client = self.Client()
+        self.registry[client] = client.callback
+        self.registry["name"] = print
+        del self.registry[client]
+        del self.registry["name"]
+        self.assertEqual(self.registry, {})
+        self.assertRaises(KeyError, self.registry.__delitem__, *("name",))
+
+    def test_004_weak_references_001(self):
+        client = self.Client()
+        self.registry[client] = client.callback
+        del client
+        gc.collect()
+        self.assertEqual(len(self.registry), 0)
+        self.assertEqual(list(self.registry), [])
+
+    def test_004_weak_references_002(self):
+        client = self.Client()
+        other = self.Client()
+        self.registry[client] = other.callback
+        del other
+        gc.collect()
+        self.assertEqual(list(self.registry), [])
+        self.assertRaises(KeyError, self.registry.__getitem__, *(client,))
+        self.assertEqual(self.registry._weak.get(client), None)
+
+    def test_004_weak_references_003(self):
+        calls = []
+
+        class Client:
+            def callback(self, instance):
+                calls.append(instance)
+
+        client = Client()
+        reference = weakref.ref(client)
+        self.registry[client] = client.callback
+        for registered in self.registry:
+            self.registry[registered]("i1")
+        del client, registered
+        gc.collect()
+        self.assertIs(reference(), None)
+        self.assertEqual(len(self.registry), 0)
+        self.assertEqual(len(self.registry._weak), 0)
+        for registered in self.registry:
+            self.registry[registered]("i2")
+        self.assertEqual(calls, ["i1"])
+
+    def test_005___iter___001(self):
+        clients = [self.Client() for i in range(3)]
+        for client in clients:
+            self.registry[client] = client.callback
+        for client in self.registry:
+            del self.registry[client]
+        self.assertEqual(len(self.registry), 0)
+
+    def test_006_report_live_clients_001(self):
+        clients = [self.Client() for i in range(2)]
+        for client in clients:
+            self.registry[client] = client.callback
+        self.registry["name"] = print
+        self.assertEqual(
+            self.registry.report_live_clients(), {"Client": 2, "str": 1}
+        )
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+    runner().run(loader(ClientRegistry))
@@ -5,8 +5,11 @@
 """dataclient tests"""
 
 import unittest
+import sys
+import gc
 
 from .. import dataclient
+from .. import recordcache
 
 
 class _DataNotify(unittest.TestCase):
@@ -40,6 +43,19 @@ class _DataNotify(unittest.TestCase):
                     return key, d[key]
                 return None
 
+        class Dbhome:
+            transactions = 0
+            starts = 0
+
+            def start_read_only_transaction(self):
+                if self.transactions:
+                    raise RuntimeError("transaction already active")
+                self.transactions += 1
+                self.starts += 1
+
+            def end_read_only_transaction(self):
+                self.transactions -= 1
+
         class Datasource:
             def __init__(self):
                 self.recno = None
@@ -69,6 +85,7 @@ class _DataNotify(unittest.TestCase):
                 return self.new_row()
 
         self.newrow = Newrow
+        self.dbhome = Dbhome
         self.cursor = Cursor
         self.database = Database
         self.datasource = Datasource
@@ -440,6 +457,16 @@ class DataClient(_DataNotify):
     def test_002_clear_client_keys_002(self):
         self.assertEqual(self.dataclient.clear_client_keys(), None)
 
+    def test_002_clear_client_keys_003(self):
+        row = self.newrow()
+        self.dataclient.keys.append("key")
+        self.dataclient.objects["key"] = row
+        self.dataclient.readahead = 1
+        self.assertEqual(self.dataclient.clear_client_keys(), None)
+        self.assertEqual(self.dataclient.keys, [])
+        self.assertEqual(self.dataclient.objects, {})
+        self.assertIs(self.dataclient.readahead_objects["key"], row)
+
     def test_003_close_client_cursor_001(self):
         self.assertRaisesRegex(
             TypeError,
@@ -549,6 +576,13 @@ class DataClient(_DataNotify):
         self.dataclient.datasource = self.datasource()
         self.assertEqual(self.dataclient.load_object("key"), None)
 
+    def test_005_load_object_003(self):
+        row = self.newrow()
+        self.dataclient.readahead_objects["key"] = row
+        self.assertEqual(self.dataclient.load_object("key"), None)
+        self.assertIs(self.dataclient.objects["key"], row)
+        self.assertEqual(self.dataclient.readahead_objects, {})
+
     def test_006_refresh_cursor_001(self):
         self.assertRaisesRegex(
             TypeError,
@@ -568,7 +602,28 @@ class DataClient(_DataNotify):
 
     def test_006_refresh_cursor_003(self):
         self.dataclient.cursor = self.cursor()
+        self.dataclient.readahead_objects["key"] = self.newrow()
+        self.assertEqual(self.dataclient.refresh_cursor(), None)
+        self.assertEqual(self.dataclient.readahead_objects, {})
+
+    def test_006_refresh_cursor_004(self):
+        datasource = self.datasource()
+        datasource.dbhome = self.dbhome()
+        self.dataclient.datasource = datasource
+        self.dataclient.start_client_read()
+        self.dataclient._client_read_idle = "id"
+        self.assertEqual(self.dataclient.refresh_cursor(), None)
+        self.assertEqual(datasource.dbhome.transactions, 0)
+        self.assertEqual(self.dataclient.cursor, None)
+
+    def test_006_refresh_cursor_005(self):
+        datasource = self.datasource()
+        datasource.dbidentity = 1
+        self.dataclient.datasource = datasource
+        self.dataclient.record_cache = recordcache.RecordCache()
+        self.dataclient.make_object("key")
         self.assertEqual(self.dataclient.refresh_cursor(), None)
+        self.assertEqual(len(self.dataclient.record_cache.records), 0)
 
     def test_007_set_partial_key_001(self):
         self.assertRaisesRegex(
@@ -591,6 +646,596 @@ class DataClient(_DataNotify):
         self.dataclient.cursor = self.cursor()
         self.assertEqual(self.dataclient.set_partial_key(), None)
 
+    def test_008_start_client_read_001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"start_client_read\(\) takes from 1 to 2 positional ",
+                    "arguments but 3 were given",
+                )
+            ),
+            self.dataclient.start_client_read,
+            *(None, None),
+        )
+
+    def test_008_start_client_read_002(self):
+        datasource = self.datasource()
+        datasource.dbhome = self.dbhome()
+        self.dataclient.datasource = datasource
+        self.assertEqual(self.dataclient.start_client_read(), None)
+        self.assertEqual(self.dataclient.start_client_read("k"), "k")
+        self.assertEqual(datasource.dbhome.transactions, 1)
+        self.assertEqual(self.dataclient._client_read_depth, 2)
+        self.assertIs(self.dataclient._client_read_dbhome, datasource.dbhome)
+        self.dataclient.close_client_read()
+
+    def test_009_end_client_read_001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"end_client_read\(\) takes 1 positional argument ",
+                    "but 2 were given",
+                )
+            ),
+            self.dataclient.end_client_read,
+            *(None,),
+        )
+
+    def test_009_end_client_read_002(self):
+        datasource = self.datasource()
+        datasource.dbhome = self.dbhome()
+        self.dataclient.datasource = datasource
+        self.dataclient.start_client_read()
+        self.dataclient.start_client_read()
+        self.assertEqual(self.dataclient.end_client_read(), None)
+        self.assertEqual(datasource.dbhome.transactions, 1)
+        self.assertEqual(self.dataclient.end_client_read(), None)
+        self.assertEqual(datasource.dbhome.transactions, 0)
+        self.assertEqual(self.dataclient.cursor, None)
+
+    def test_009_end_client_read_003(self):
+        datasource = self.datasource()
+        datasource.dbhome = self.dbhome()
+        self.dataclient.datasource = datasource
+        self.dataclient.cursor_idle_timeout = 500
+        self.dataclient.start_client_read()
+        self.assertEqual(self.dataclient.end_client_read(), None)
+        self.assertEqual(datasource.dbhome.transactions, 0)
+        self.assertEqual(self.dataclient.cursor, None)
+
+    def test_009_end_client_read_004(self):
+        scheduled = []
+
+        def after_client_read(delay, callback):
+            scheduled.append(callback)
+            return "id"
+
+        def after_cancel_client_read(identifier):
+            pass
+
+        datasource = self.datasource()
+        datasource.dbhome = self.dbhome()
+        self.dataclient.datasource = datasource
+        self.dataclient.cursor_idle_timeout = 500
+        self.dataclient.after_client_read = after_client_read
+        self.dataclient.after_cancel_client_read = after_cancel_client_read
+        self.dataclient.start_client_read()
+        cursor = self.dataclient.cursor
+        cursor.dce = True
+        self.assertEqual(self.dataclient.end_client_read(), None)
+        self.assertEqual(datasource.dbhome.transactions, 1)
+        self.assertIs(self.dataclient.cursor, cursor)
+        self.assertEqual(len(scheduled), 1)
+        self.assertEqual(self.dataclient._client_read_idle, "id")
+        self.dataclient.start_client_read()
+        self.assertIs(self.dataclient.cursor, cursor)
+        self.assertEqual(datasource.dbhome.transactions, 1)
+        self.assertEqual(datasource.dbhome.starts, 1)
+        self.assertEqual(self.dataclient._client_read_idle, None)
+        self.dataclient.end_client_read()
+        self.assertEqual(datasource.dbhome.transactions, 1)
+        scheduled[-1]()
+        self.assertEqual(datasource.dbhome.transactions, 0)
+        self.assertEqual(self.dataclient.cursor, None)
+        self.assertEqual(self.dataclient._client_read_idle, None)
+
+    def test_009_end_client_read_005(self):
+        # Cursors, like lmdb ones, are unusable once the read-only
+        # transaction they were made in has ended.
+        scheduled = []
+
+        class Dbhome(self.dbhome):
+            generation = 0
+
+            def end_read_only_transaction(self):
+                super().end_read_only_transaction()
+                self.generation += 1
+
+        class Cursor(self.cursor):
+            def __init__(self, dbhome):
+                self.dbhome = dbhome
+                self.generation = dbhome.generation
+
+            def database_cursor_exists(self):
+                return (
+                    self.dbhome.transactions
+                    and self.generation == self.dbhome.generation
+                )
+
+            def setat(self, record):
+                if not self.database_cursor_exists():
+                    raise RuntimeError("transaction ended")
+                return record
+
+        class Datasource(self.datasource):
+            def get_cursor(self):
+                return Cursor(self.dbhome)
+
+        datasource = Datasource()
+        datasource.dbhome = Dbhome()
+        self.dataclient.datasource = datasource
+        self.dataclient.cursor_idle_timeout = 500
+        self.dataclient.after_client_read = (
+            lambda delay, callback: scheduled.append(callback) or "id"
+        )
+        self.dataclient.after_cancel_client_read = lambda identifier: None
+        for cycle in range(2):
+            self.assertEqual(self.dataclient.start_client_read("k"), "k")
+            self.dataclient.end_client_read()
+            self.assertEqual(self.dataclient.start_client_read("k"), "k")
+            self.dataclient.end_client_read()
+            self.assertEqual(
+                bool(self.dataclient.cursor.database_cursor_exists()), True
+            )
+            scheduled[-1]()
+            self.assertEqual(self.dataclient.cursor, None)
+            self.assertEqual(datasource.dbhome.transactions, 0)
+        self.assertEqual(datasource.dbhome.starts, 2)
+        self.dataclient.cursor = Cursor(datasource.dbhome)
+        self.assertEqual(self.dataclient.start_client_read("k"), "k")
+        self.dataclient.close_client_read()
+
+    def test_010_close_client_read_001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"close_client_read\(\) takes 1 positional argument ",
+                    "but 2 were given",
+                )
+            ),
+            self.dataclient.close_client_read,
+            *(None,),
+        )
+
+    def test_010_close_client_read_002(self):
+        self.assertEqual(self.dataclient.close_client_read(), None)
+
+    def test_011_after_client_read_001(self):
+        self.assertEqual(self.dataclient.after_client_read(1, None), None)
+
+    def test_012_after_cancel_client_read_001(self):
+        self.assertEqual(self.dataclient.after_cancel_client_read(None), None)
+
+    def test_013_set_data_source_001(self):
+        datasource = self.datasource()
+        datasource.dbhome = self.dbhome()
+        self.dataclient.datasource = datasource
+        self.dataclient.start_client_read()
+        self.dataclient._client_read_idle = "id"
+        self.assertEqual(self.dataclient.set_data_source(), None)
+        self.assertEqual(datasource.dbhome.transactions, 0)
+        self.assertEqual(self.dataclient.datasource, None)
+
+    def test_014_fill_readahead_001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"fill_readahead\(\) takes 1 positional argument ",
+                    "but 2 were given",
+                )
+            ),
+            self.dataclient.fill_readahead,
+            *(None,),
+        )
+
+    def test_014_fill_readahead_002(self):
+        self.dataclient.readahead_objects["k1"] = self.newrow()
+        self.assertEqual(self.dataclient.readahead, 0)
+        self.assertEqual(self.dataclient.fill_readahead(), None)
+        self.assertEqual(self.dataclient.readahead_objects, {})
+
+    def records_cursor(self, records):
+        class Cursor(self.cursor):
+            position = None
+
+            def setat(self, record):
+                self.position = records.index(record)
+                return record
+
+            def next(self):
+                self.position += 1
+                if self.position < len(records):
+                    return records[self.position]
+                return None
+
+            def prev(self):
+                self.position -= 1
+                if self.position >= 0:
+                    return records[self.position]
+                return None
+
+        return Cursor
+
+    def test_014_fill_readahead_003(self):
+        datasource = self.datasource()
+        datasource.dbhome = self.dbhome()
+        datasource.get_cursor = self.records_cursor(
+            ["k1", "k2", "k3", "k4", "k5", "k6"]
+        )
+        self.dataclient.datasource = datasource
+        self.dataclient.readahead = 2
+        self.dataclient.keys.extend(["k3", "k4"])
+        row = self.newrow()
+        self.dataclient.readahead_objects["k2"] = row
+        self.dataclient.readahead_objects["k6"] = self.newrow()
+        self.assertEqual(self.dataclient.fill_readahead(), None)
+        self.assertEqual(
+            set(self.dataclient.readahead_objects), {"k1", "k2", "k5", "k6"}
+        )
+        self.assertIs(self.dataclient.readahead_objects["k2"], row)
+        self.assertEqual(datasource.dbhome.transactions, 0)
+
+    def test_014_continue_readahead_001(self):
+        self.assertEqual(self.dataclient._readahead_fill, None)
+        self.assertEqual(self.dataclient.continue_readahead(), True)
+
+    def test_014_continue_readahead_002(self):
+        datasource = self.datasource()
+        datasource.dbhome = self.dbhome()
+        datasource.get_cursor = self.records_cursor(
+            ["k1", "k2", "k3", "k4", "k5", "k6", "k7", "k8"]
+        )
+        self.dataclient.datasource = datasource
+        self.dataclient.readahead = 3
+        self.dataclient.keys.extend(["k4", "k5"])
+        row = self.newrow()
+        self.dataclient.readahead_objects["k6"] = row
+        self.dataclient.readahead_objects["k8"] = self.newrow()
+        self.dataclient.start_readahead()
+        self.assertEqual(self.dataclient.continue_readahead(steps=2), False)
+        self.assertEqual(
+            set(self.dataclient.readahead_objects), {"k6", "k7", "k8"}
+        )
+        self.assertIs(self.dataclient.readahead_objects["k6"], row)
+        self.assertEqual(datasource.dbhome.transactions, 0)
+        self.assertEqual(self.dataclient.continue_readahead(steps=2), False)
+        self.assertEqual(self.dataclient.continue_readahead(steps=2), True)
+        self.assertEqual(
+            set(self.dataclient.readahead_objects),
+            {"k1", "k2", "k3", "k6", "k7", "k8"},
+        )
+        self.assertEqual(self.dataclient._readahead_fill, None)
+        self.assertEqual(self.dataclient.continue_readahead(steps=2), True)
+
+    def test_014_continue_readahead_003(self):
+        datasource = self.datasource()
+        datasource.dbhome = self.dbhome()
+        datasource.get_cursor = self.records_cursor(["k1", "k2", "k3"])
+        self.dataclient.datasource = datasource
+        self.dataclient.readahead = 2
+        self.dataclient.keys.extend(["k2"])
+        self.dataclient.start_readahead()
+        self.assertEqual(self.dataclient.continue_readahead(steps=1), False)
+        self.dataclient.clear_readahead()
+        self.assertEqual(self.dataclient.continue_readahead(steps=1), True)
+        self.assertEqual(self.dataclient.readahead_objects, {})
+
+    def test_015_make_object_001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"make_object\(\) missing 1 required positional ",
+                    "argument: 'key'",
+                )
+            ),
+            self.dataclient.make_object,
+        )
+
+    def test_015_make_object_002(self):
+        self.dataclient.datasource = self.datasource()
+        self.assertIsInstance(self.dataclient.make_object("key"), self.newrow)
+        self.assertEqual(self.dataclient.objects, {})
+
+    def test_015_make_object_003(self):
+        datasource = self.datasource()
+        datasource.dbidentity = 1
+        self.dataclient.datasource = datasource
+        self.dataclient.record_cache = recordcache.RecordCache()
+        row = self.dataclient.make_object("key")
+        self.assertIsInstance(row, self.newrow)
+        copied = self.dataclient.make_object("key")
+        self.assertIsInstance(copied, self.newrow)
+        self.assertIsNot(copied, row)
+        self.assertEqual(
+            self.dataclient.record_cache.get_statistics(),
+            dict(entries=1, hits=1, misses=1, evictions=0),
+        )
+
+    def test_016_clear_readahead_001(self):
+        self.dataclient.readahead_objects["key"] = self.newrow()
+        self.assertEqual(self.dataclient.clear_readahead(), None)
+        self.assertEqual(self.dataclient.readahead_objects, {})
+
+    def test_017_decode_readahead_001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"decode_readahead\(\) missing 5 required positional ",
+                    "arguments: 'cursor', 'first', 'last', 'exclude', ",
+                    "and 'decoded'",
+                )
+            ),
+            self.dataclient.decode_readahead,
+        )
+
+    def test_017_decode_readahead_002(self):
+        self.dataclient.datasource = self.datasource()
+        self.dataclient.readahead = 3
+        cursor = self.records_cursor(["k1", "k2", "k3", "k4", "k5"])()
+        row = self.newrow()
+        rows = self.dataclient.decode_readahead(
+            cursor, "k3", "k3", {"k2"}, {"k4": row}
+        )
+        self.assertEqual(set(rows), {"k1", "k4", "k5"})
+        self.assertIs(rows["k4"], row)
+
+    def test_019_get_record_count_001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"get_record_count\(\) takes 1 positional argument ",
+                    "but 2 were given",
+                )
+            ),
+            self.dataclient.get_record_count,
+            *(None,),
+        )
+
+    def test_019_get_record_count_002(self):
+        class Cursor(self.cursor):
+            counts = 0
+
+            def count_records(self):
+                self.counts += 1
+                return 5
+
+        class Datasource(self.datasource):
+            def record_count_key(self, partial):
+                return (self.dbset, self.dbname, partial)
+
+        self.dataclient.datasource = Datasource()
+        self.dataclient.cursor = Cursor()
+        self.assertEqual(self.dataclient.get_record_count(), 5)
+        self.assertEqual(self.dataclient.get_record_count(), 5)
+        self.assertEqual(self.dataclient.cursor.counts, 1)
+        self.assertEqual(
+            self.dataclient.record_counts, {(None, None, None): 5}
+        )
+
+    def test_019_get_record_count_003(self):
+        class Cursor(self.cursor):
+            counts = 0
+
+            def count_records(self):
+                self.counts += 1
+                return 5
+
+        class Datasource(self.datasource):
+            def record_count_key(self, partial):
+                return None
+
+        self.dataclient.datasource = Datasource()
+        self.dataclient.cursor = Cursor()
+        self.assertEqual(self.dataclient.get_record_count(), 5)
+        self.assertEqual(self.dataclient.get_record_count(), 5)
+        self.assertEqual(self.dataclient.cursor.counts, 2)
+        self.assertEqual(self.dataclient.record_counts, {})
+
+    def test_020_adjust_record_counts_001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"adjust_record_counts\(\) missing 1 required ",
+                    "positional argument: 'instance'",
+                )
+            ),
+            self.dataclient.adjust_record_counts,
+        )
+
+    def record_counts_datasource(self):
+        class Datasource(self.datasource):
+            def __init__(self):
+                super().__init__()
+                self.dbset = "dbset"
+                self.dbname = "dbname"
+
+            def record_count_key(self, partial):
+                return (self.dbset, self.dbname, partial)
+
+        self.dataclient.datasource = Datasource()
+        self.dataclient.record_counts.update(
+            {
+                ("dbset", "dbname", None): 10,
+                ("dbset", "dbname", "p"): 4,
+                ("dbset", "other", None): 7,
+                ("other", "dbname", None): 3,
+            }
+        )
+
+    def test_020_adjust_record_counts_002(self):
+        self.record_counts_datasource()
+        self.assertEqual(self.dataclient.adjust_record_counts(None), None)
+        self.assertEqual(self.dataclient.record_counts, {})
+
+    def test_020_adjust_record_counts_003(self):
+        class Instance:
+            def __init__(self, newrecord, keys):
+                self.newrecord = newrecord
+                self.keys = keys
+
+            def get_keys(self, datasource):
+                return self.keys
+
+        self.record_counts_datasource()
+        dataclient = self.dataclient
+        dataclient.adjust_record_counts(Instance(False, ["a", "b"]))
+        self.assertEqual(
+            dataclient.record_counts,
+            {
+                ("dbset", "dbname", None): 12,
+                ("dbset", "dbname", "p"): 4,
+                ("dbset", "other", None): 7,
+                ("other", "dbname", None): 3,
+            },
+        )
+        self.assertEqual(
+            list(dataclient._record_count_changes), [("dbset", "other", None)]
+        )
+        dataclient.adjust_record_counts(Instance(None, ["a"]))
+        self.assertEqual(
+            dataclient.record_counts[("dbset", "dbname", None)], 11
+        )
+        dataclient.adjust_record_counts(
+            Instance(Instance(None, ["a", "b", "c"]), ["a"])
+        )
+        self.assertEqual(
+            dataclient.record_counts[("dbset", "dbname", None)], 13
+        )
+
+    def test_020_adjust_record_counts_004(self):
+        class Instance:
+            newrecord = None
+
+            def get_keys(self, datasource):
+                raise KeyError
+
+        self.record_counts_datasource()
+        self.dataclient.adjust_record_counts(Instance())
+        self.assertEqual(
+            self.dataclient.record_counts,
+            {("dbset", "other", None): 7, ("other", "dbname", None): 3},
+        )
+
+    def test_020_adjust_record_counts_005(self):
+        class Instance:
+            def __init__(self, newrecord, keys):
+                self.newrecord = newrecord
+                self.keys = keys
+
+            def get_keys(self, datasource):
+                if datasource.dbname == "dbname":
+                    return self.keys
+                return [(k.upper(), 1) for k, v in self.keys]
+
+        self.record_counts_datasource()
+        dataclient = self.dataclient
+        dataclient.adjust_record_counts(
+            Instance(False, [("pa", 1), ("pb", 1), ("q", 1)])
+        )
+        dataclient.adjust_record_counts(Instance(None, [("pa", 1)]))
+        self.assertEqual(
+            dataclient.record_counts[("dbset", "dbname", None)], 12
+        )
+        self.assertEqual(dataclient.record_counts[("dbset", "dbname", "p")], 5)
+        self.assertEqual(dataclient.record_counts[("dbset", "other", None)], 7)
+
+        class Cursor(self.cursor):
+            def count_records(self):
+                raise AssertionError("count_records called")
+
+        dataclient.cursor = Cursor()
+        dataclient.datasource.dbname = "other"
+        self.assertEqual(dataclient.get_record_count(), 9)
+        self.assertEqual(dataclient.record_counts[("dbset", "other", None)], 9)
+        self.assertEqual(dataclient._record_count_changes, {})
+        dataclient.partial = "P"
+        dataclient.record_counts[("dbset", "other", "P")] = 2
+        dataclient.datasource.dbname = "dbname"
+        dataclient.adjust_record_counts(Instance(False, [("pc", 1)]))
+        dataclient.datasource.dbname = "other"
+        self.assertEqual(dataclient.get_record_count(), 3)
+
+    def test_020_adjust_record_counts_006(self):
+        class Instance:
+            newrecord = None
+
+            def get_keys(self, datasource):
+                if datasource.dbname == "dbname":
+                    return []
+                raise KeyError
+
+        class Cursor(self.cursor):
+            def count_records(self):
+                return 20
+
+        self.record_counts_datasource()
+        dataclient = self.dataclient
+        dataclient.adjust_record_counts(Instance())
+        dataclient.cursor = Cursor()
+        dataclient.datasource.dbname = "other"
+        self.assertEqual(dataclient.get_record_count(), 20)
+        self.assertEqual(
+            dataclient.record_counts[("dbset", "other", None)], 20
+        )
+
+    def test_021_get_visible_key_range_001(self):
+        self.assertEqual(self.dataclient.get_visible_key_range(), None)
+        self.dataclient.keys.extend([("a", 1), ("b", 2)])
+        self.assertEqual(self.dataclient.get_visible_key_range(), None)
+        self.dataclient.view_is_full = True
+        self.assertEqual(
+            self.dataclient.get_visible_key_range(), (None, ("a", 1), ("b", 2))
+        )
+
+
+class ActiveReads(unittest.TestCase):
+    def setUp(self):
+        class Dbhome:
+            transactions = 0
+
+            def start_read_only_transaction(self):
+                self.transactions += 1
+
+            def end_read_only_transaction(self):
+                self.transactions -= 1
+
+        self.dbhome = Dbhome()
+
+    def test_001_start_read_001(self):
+        self.assertEqual(dataclient.start_read(self.dbhome), None)
+        self.assertEqual(dataclient.start_read(self.dbhome), None)
+        self.assertEqual(self.dbhome.transactions, 1)
+        self.assertEqual(dataclient._active_reads[id(self.dbhome)], 2)
+        dataclient.end_read(self.dbhome)
+        dataclient.end_read(self.dbhome)
+
+    def test_002_end_read_001(self):
+        dataclient.start_read(self.dbhome)
+        dataclient.start_read(self.dbhome)
+        self.assertEqual(dataclient.end_read(self.dbhome), None)
+        self.assertEqual(self.dbhome.transactions, 1)
+        self.assertEqual(dataclient.end_read(self.dbhome), None)
+        self.assertEqual(self.dbhome.transactions, 0)
+        self.assertNotIn(id(self.dbhome), dataclient._active_reads)
+
 
 class DataLookup(_DataNotify):
     def setUp(self):
@@ -658,20 +1303,54 @@ class DataLookup(_DataNotify):
         self.datalookup.datasource = self.datasource()
         self.assertEqual(len(self.datalookup.cache), 0)
         self.assertEqual(self.datalookup.rowmax, 100)
-        self.assertEqual(self.datalookup.rowmin, 10)
-        for i in range(self.datalookup.rowmax + 2):
+        for i in range(self.datalookup.rowmax):
             self.datalookup.cache[i] = i
-            self.datalookup.keys.append(i)
+        self.assertIsInstance(self.datalookup.load_cache("k1"), self.newrow)
+        self.assertEqual(len(self.datalookup.cache), self.datalookup.rowmax)
+        self.assertEqual(bool(0 in self.datalookup.cache), False)
+        self.assertEqual(list(self.datalookup.cache)[-1], "k1")
+        self.assertEqual(self.datalookup.evictions, 1)
+
+    def test_003_load_cache_006(self):
+        class Database:
+            def get(self, key):
+                return key, "v" + key
+
+        self.datalookup.datasource = self.datasource()
+        self.datalookup.datasource.get_database = Database
+        self.datalookup.rowmax = 2
+        self.datalookup.load_cache("k1")
+        self.datalookup.load_cache("k2")
+        self.datalookup.load_cache("k1")
+        self.datalookup.load_cache("k3")
+        self.assertEqual(list(self.datalookup.cache), ["k1", "k3"])
         self.assertEqual(
-            bool(len(self.datalookup.keys) > self.datalookup.rowmax), True
+            self.datalookup.get_cache_statistics(),
+            dict(
+                entries=2,
+                bytes=self.datalookup.estimate_size(("k", "vk1")) * 2,
+                hits=1,
+                misses=3,
+                evictions=1,
+            ),
         )
-        self.assertEqual(len(self.datalookup.keys), len(self.datalookup.cache))
-        self.assertIsInstance(self.datalookup.load_cache("k1"), self.newrow)
-        self.assertEqual(len(self.datalookup.cache), self.datalookup.rowmin)
-        self.assertEqual(len(self.datalookup.keys), len(self.datalookup.cache))
-        self.assertEqual(len(self.datalookup.keys), self.datalookup.rowmin)
-        self.assertEqual(bool("k1" in self.datalookup.cache), True)
-        self.assertEqual(self.datalookup.keys[-1], "k1")
+
+    def test_003_load_cache_007(self):
+        self.datalookup.datasource = self.datasource()
+        self.datalookup.bytemax = self.datalookup.estimate_size(("k", "v1"))
+        self.datalookup.load_cache("k1")
+        self.datalookup.load_cache("k2")
+        self.assertEqual(list(self.datalookup.cache), ["k2"])
+        self.assertEqual(self.datalookup.evictions, 1)
+
+    def test_003_load_cache_008(self):
+        self.datalookup.datasource = self.datasource()
+        self.datalookup.ttl = -1
+        row = self.datalookup.load_cache("k1")
+        self.assertIsNot(self.datalookup.load_cache("k1"), row)
+        self.assertEqual(self.datalookup.misses, 2)
+        self.assertEqual(self.datalookup.hits, 0)
+        self.assertEqual(self.datalookup.evictions, 0)
 
     def test_004_on_data_change_001(self):
         self.assertRaisesRegex(
@@ -686,13 +1365,141 @@ class DataLookup(_DataNotify):
         )
 
     def test_004_on_data_change_002(self):
+        self.datalookup.datasource = self.datasource()
+        self.datalookup.load_cache("k1")
+        self.assertEqual(self.datalookup.on_data_change("k"), None)
+        self.assertEqual(len(self.datalookup.cache), 0)
+
+    def test_004_on_data_change_003(self):
+        class Record:
+            def __init__(self, keys, newrecord):
+                self.keys = keys
+                self.newrecord = newrecord
+
+            def get_keys(self, datasource):
+                return self.keys
+
+        self.datalookup.datasource = self.datasource()
+        self.datalookup.load_cache("k1")
+        self.datalookup.load_cache("k2")
+        self.datalookup.on_data_change(Record([("k1", "v1")], None))
+        self.assertEqual(list(self.datalookup.cache), ["k2"])
+        self.datalookup.load_cache("k1")
+        self.datalookup.on_data_change(
+            Record([("k3", "v3")], Record([("k2", "v2")], None))
+        )
+        self.assertEqual(list(self.datalookup.cache), ["k1"])
+        self.assertEqual(
+            self.datalookup.get_cache_statistics()["bytes"],
+            self.datalookup.estimate_size(("k", "v1")),
+        )
+
+    def test_004_on_data_change_004(self):
+        self.datalookup.datasource = self.datasource()
+        self.datalookup.load_cache("k1")
+        self.datalookup.on_data_change(None)
+        self.assertEqual(
+            self.datalookup.get_cache_statistics(),
+            dict(entries=0, bytes=0, hits=0, misses=1, evictions=0),
+        )
+
+    def test_005_estimate_size_001(self):
+        self.assertEqual(
+            self.datalookup.estimate_size(("k", "value")),
+            sys.getsizeof("value"),
+        )
+
+    def test_006_get_cache_statistics_001(self):
+        self.assertEqual(
+            self.datalookup.get_cache_statistics(),
+            dict(entries=0, bytes=0, hits=0, misses=0, evictions=0),
+        )
+
+    def test_007_discard_cache_entry_001(self):
+        self.datalookup.datasource = self.datasource()
+        self.datalookup.load_cache("k1")
+        self.assertEqual(self.datalookup.discard_cache_entry("k1"), None)
+        self.assertEqual(self.datalookup.discard_cache_entry("k1"), None)
+        self.assertEqual(
+            self.datalookup.get_cache_statistics(),
+            dict(entries=0, bytes=0, hits=0, misses=1, evictions=0),
+        )
+
+
+    def test_008_clear_cache_001(self):
+        self.datalookup.datasource = self.datasource()
+        self.datalookup.ttl = 10
+        self.datalookup.load_cache("k1")
+        self.assertEqual(self.datalookup.clear_cache(), None)
+        self.assertEqual(len(self.datalookup.cache), 0)
+        self.assertEqual(self.datalookup._cache_expiry, {})
+        self.assertEqual(self.datalookup.get_cache_statistics()["bytes"], 0)
+
+    def test_009_load_many_001(self):
         self.assertRaisesRegex(
-            RuntimeError,
-            "Not implemented",
-            self.datalookup.on_data_change,
-            *("k"),
+            TypeError,
+            "".join(
+                (
+                    r"load_many\(\) missing 1 required positional ",
+                    "argument: 'keys'",
+                )
+            ),
+            self.datalookup.load_many,
         )
 
+    def test_009_load_many_002(self):
+        keys = []
+
+        class Database:
+            def get(self, key):
+                keys.append(key)
+                if key == "k4":
+                    return None
+                return key, "v" + key
+
+        self.datalookup.datasource = self.datasource()
+        self.datalookup.datasource.dbhome = self.dbhome()
+        self.datalookup.datasource.get_database = Database
+        row = self.datalookup.load_cache("k2")
+        rows = self.datalookup.load_many(["k3", "k2", "k4", "k1", "k3"])
+        self.assertEqual(list(rows), ["k3", "k2", "k4", "k1"])
+        self.assertIs(rows["k2"], row)
+        self.assertEqual(rows["k4"], None)
+        self.assertIsInstance(rows["k1"], self.newrow)
+        self.assertEqual(keys, ["k2", "k1", "k3", "k4"])
+        self.assertEqual(self.datalookup.datasource.dbhome.transactions, 0)
+        self.assertEqual(list(self.datalookup.cache), ["k2", "k1", "k3"])
+        self.assertEqual(self.datalookup.hits, 1)
+        self.assertEqual(self.datalookup.misses, 4)
+
+    def test_009_load_many_003(self):
+        self.datalookup.datasource = self.datasource()
+        self.assertEqual(self.datalookup.load_many([]), {})
+
+    def test_009_load_many_004(self):
+        datasource = self.datasource()
+        datasource.dbhome = self.dbhome()
+        datasource.get_database = self.database
+        self.datalookup.datasource = datasource
+        client = dataclient.DataClient()
+        client.datasource = datasource
+        client.start_client_read()
+        rows = self.datalookup.load_many(["k1"])
+        self.assertIsInstance(rows["k1"], self.newrow)
+        self.assertEqual(datasource.dbhome.transactions, 1)
+        client.end_client_read()
+        self.assertEqual(datasource.dbhome.transactions, 0)
+        self.assertEqual(datasource.dbhome.starts, 1)
+
+    def test_010_is_cached_001(self):
+        self.datalookup.datasource = self.datasource()
+        self.assertEqual(self.datalookup.is_cached("k1"), False)
+        self.datalookup.load_cache("k1")
+        self.assertEqual(self.datalookup.is_cached("k1"), True)
+        self.datalookup._cache_expiry["k1"] = 0
+        self.assertEqual(self.datalookup.is_cached("k1"), False)
+        self.assertEqual(len(self.datalookup.cache), 0)
+
 
 class DataSource(unittest.TestCase):
     def setUp(self):
@@ -780,9 +1587,113 @@ class DataSource(unittest.TestCase):
         self.assertEqual(self.datasource.clients, {"client": f})
         self.datasource.refresh_widgets("instance")
 
+    def test_007_refresh_widgets_002(self):
+        calls = []
+        self.datasource.clients["client"] = calls.append
+        self.datasource.begin_batch()
+        self.datasource.refresh_widgets("i1")
+        self.datasource.refresh_widgets("i2")
+        self.assertEqual(calls, [])
+        self.datasource.end_batch()
+        self.assertEqual(calls, [None])
+
+    def test_007_refresh_widgets_003(self):
+        class Instance:
+            def get_keys(self, datasource):
+                return [("k", 1)]
+
+        class Client:
+            def __init__(self, key_range):
+                self.key_range = key_range
+                self.calls = []
+
+            def get_visible_key_range(self):
+                return self.key_range
+
+            def on_data_change(self, instance):
+                self.calls.append("full")
+
+            def on_data_change_out_of_view(self, instance):
+                self.calls.append("count")
+
+        inview = Client((None, ("a", 1), ("m", 1)))
+        outofview = Client((None, ("p", 1), ("z", 1)))
+        unknown = Client(None)
+        for client in inview, outofview, unknown:
+            self.datasource.register_in(client, client.on_data_change)
+        self.datasource.refresh_widgets(Instance())
+        self.assertEqual(inview.calls, ["full"])
+        self.assertEqual(outofview.calls, ["count"])
+        self.assertEqual(unknown.calls, ["full"])
+        self.datasource.refresh_widgets(None)
+        self.assertEqual(outofview.calls, ["count", "full"])
+
+    def test_010_get_notification_keys_001(self):
+        class Instance:
+            def __init__(self, keys, newrecord):
+                self.keys = keys
+                self.newrecord = newrecord
+
+            def get_keys(self, datasource):
+                return self.keys
+
+        self.assertEqual(self.datasource.get_notification_keys(None), [])
+        self.assertEqual(self.datasource.get_notification_keys("k"), [])
+        self.assertEqual(
+            self.datasource.get_notification_keys(
+                Instance([("a", 1)], Instance([("b", 1)], None))
+            ),
+            [("a", 1), ("b", 1)],
+        )
+
+    def test_011_is_update_in_view_001(self):
+        class Client:
+            key_range = ("k", ("ka", 1), ("kc", 2))
+
+            def get_visible_key_range(self):
+                return self.key_range
+
+        client = Client()
+        isv = self.datasource.is_update_in_view
+        self.assertEqual(isv(object(), [("a", 1)]), True)
+        self.assertEqual(isv(client, [("kb", 9)]), True)
+        self.assertEqual(isv(client, [("kc", 9)]), True)
+        self.assertEqual(isv(client, [("kd", 1)]), False)
+        self.assertEqual(isv(client, [("b", 1)]), False)
+        self.assertEqual(isv(client, [(1, 1)]), True)
+        client.key_range = None
+        self.assertEqual(isv(client, [("kd", 1)]), True)
+
+    def test_012_report_live_clients_001(self):
+        self.datasource.register_in("client", print)
+        self.assertEqual(self.datasource.report_live_clients(), {"str": 1})
+
+    def test_012_report_live_clients_002(self):
+        calls = []
+
+        class Client:
+            def on_data_change(self, instance):
+                calls.append(instance)
+
+        client = Client()
+        self.datasource.register_in(client, client.on_data_change)
+        self.datasource.refresh_widgets("i1")
+        self.assertEqual(self.datasource.report_live_clients(), {"Client": 1})
+        del client
+        gc.collect()
+        self.assertEqual(self.datasource.report_live_clients(), {})
+        self.assertEqual(len(self.datasource.clients), 0)
+        self.datasource.refresh_widgets("i2")
+        self.assertEqual(calls, ["i1"])
+
     def test_008_dbidentity_001(self):
         self.assertEqual(self.datasource.dbidentity, id(None))
 
+    def test_009_record_count_key_001(self):
+        self.assertEqual(
+            self.datasource.record_count_key("p"), ("dbset", "dbname", "p")
+        )
+
 
 if __name__ == "__main__":
     runner = unittest.TextTestRunner
@@ -790,5 +1701,6 @@ if __name__ == "__main__":
     runner().run(loader(DataNotify))
     runner().run(loader(_DataAccess))
     runner().run(loader(DataClient))
+    runner().run(loader(ActiveReads))
     runner().run(loader(DataLookup))
     runner().run(loader(DataSource))
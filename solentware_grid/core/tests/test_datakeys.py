@@ -0,0 +1,158 @@
+# test_datakeys.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""datakeys tests"""
+
+import unittest
+
+from .. import datakeys
+
+
+class DataKeys(unittest.TestCase):
+    def setUp(self):
+        self.datakeys = datakeys.DataKeys(["k1", "k2", "k3"])
+
+    def tearDown(self):
+        pass
+
+    def check_positions(self):
+        for index, key in enumerate(self.datakeys):
+            self.assertEqual(self.datakeys.index(key), index)
+            self.assertEqual(key in self.datakeys, True)
+        self.assertEqual(len(self.datakeys._positions), len(self.datakeys))
+
+    def test_001___init___001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"__init__\(\) takes from 1 to 2 positional arguments ",
+                    "but 3 were given",
+                )
+            ),
+            datakeys.DataKeys,
+            *(None, None),
+        )
+
+    def test_001___init___002(self):
+        self.assertEqual(self.datakeys, ["k1", "k2", "k3"])
+        self.assertIsInstance(self.datakeys, list)
+        self.check_positions()
+
+    def test_002___contains___001(self):
+        self.assertEqual("k2" in self.datakeys, True)
+        self.assertEqual("k4" in self.datakeys, False)
+        self.assertEqual([] in self.datakeys, False)
+
+    def test_003_index_001(self):
+        self.assertEqual(self.datakeys.index("k3"), 2)
+        self.assertEqual(self.datakeys.index("k3", 1), 2)
+        self.assertRaisesRegex(
+            ValueError,
+            "'k4' is not in list",
+            self.datakeys.index,
+            *("k4",),
+        )
+
+    def test_004_append_001(self):
+        self.datakeys.append("k4")
+        self.datakeys.extend(["k5", "k6"])
+        self.datakeys += ["k7"]
+        self.assertEqual(self.datakeys[-4:], ["k4", "k5", "k6", "k7"])
+        self.check_positions()
+
+    def test_005_insert_001(self):
+        self.datakeys.insert(0, "k0")
+        self.datakeys.insert(-10, "k-1")
+        self.datakeys.insert(10, "k4")
+        self.datakeys.insert(2, "k0.5")
+        self.assertEqual(
+            self.datakeys, ["k-1", "k0", "k0.5", "k1", "k2", "k3", "k4"]
+        )
+        self.check_positions()
+
+    def test_006_pop_001(self):
+        self.assertEqual(self.datakeys.pop(), "k3")
+        self.assertEqual(self.datakeys.pop(0), "k1")
+        self.assertEqual(self.datakeys, ["k2"])
+        self.check_positions()
+
+    def test_007_remove_001(self):
+        self.datakeys.remove("k2")
+        self.assertEqual(self.datakeys, ["k1", "k3"])
+        self.check_positions()
+        self.assertRaises(ValueError, self.datakeys.remove, *("k2",))
+
+    def test_008___delitem___001(self):
+        self.datakeys.extend(["k4", "k5", "k6"])
+        del self.datakeys[:2]
+        self.check_positions()
+        del self.datakeys[-2:]
+        self.check_positions()
+        del self.datakeys[1]
+        self.assertEqual(self.datakeys, ["k3"])
+        self.check_positions()
+
+    def test_009___setitem___001(self):
+        self.datakeys[1] = "kx"
+        self.check_positions()
+        self.datakeys[:] = []
+        self.assertEqual(self.datakeys, [])
+        self.check_positions()
+
+    def test_010_clear_001(self):
+        self.datakeys.clear()
+        self.assertEqual("k1" in self.datakeys, False)
+        self.check_positions()
+
+    def test_011_sort_001(self):
+        self.datakeys.reverse()
+        self.check_positions()
+        self.datakeys.sort()
+        self.assertEqual(self.datakeys, ["k1", "k2", "k3"])
+        self.check_positions()
+
+
+class SortedKeys(unittest.TestCase):
+    def setUp(self):
+        self.sortedkeys = datakeys.SortedKeys(["k3", "k1", "k2", "k1"])
+
+    def tearDown(self):
+        pass
+
+    def test_001___init___001(self):
+        self.assertEqual(self.sortedkeys, ["k1", "k2", "k3"])
+        self.assertIsInstance(self.sortedkeys, list)
+
+    def test_002_add_001(self):
+        self.sortedkeys.add("k0")
+        self.sortedkeys.append("k2")
+        self.sortedkeys.extend(["k5", "k4"])
+        self.assertEqual(self.sortedkeys, ["k0", "k1", "k2", "k3", "k4", "k5"])
+
+    def test_003___contains___001(self):
+        self.assertEqual("k2" in self.sortedkeys, True)
+        self.assertEqual("k4" in self.sortedkeys, False)
+        self.assertEqual(1 in self.sortedkeys, False)
+
+    def test_004_index_001(self):
+        self.assertEqual(self.sortedkeys.index("k3"), 2)
+        self.assertRaisesRegex(
+            ValueError,
+            "'k4' is not in list",
+            self.sortedkeys.index,
+            *("k4",),
+        )
+
+    def test_005_remove_001(self):
+        self.sortedkeys.remove("k2")
+        self.assertEqual(self.sortedkeys, ["k1", "k3"])
+        self.assertRaises(ValueError, self.sortedkeys.remove, *("k2",))
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+    runner().run(loader(DataKeys))
+    runner().run(loader(SortedKeys))
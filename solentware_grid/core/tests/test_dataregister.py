@@ -95,6 +95,23 @@ class DataRegister(unittest.TestCase):
             self.dataregister.refresh_after_update(None, None), None
         )
 
+    def test_003_refresh_after_update_004(self):
+        calls = []
+        self.dataregister.datasources = {self.key: {self.client: calls.append}}
+        self.dataregister.begin_batch()
+        self.dataregister.refresh_after_update(self.key, "i1")
+        self.assertEqual(calls, [])
+        self.dataregister.end_batch()
+        self.assertEqual(calls, ["i1"])
+
+    def test_006_report_live_clients_001(self):
+        self.dataregister.register_in(self.client, self.client.callback)
+        self.dataregister.datasources["empty"] = {}
+        self.assertEqual(
+            self.dataregister.report_live_clients(), {self.key: {"Client": 1}}
+        )
+        self.assertEqual(list(self.dataregister.datasources), [self.key])
+
     def test_004_register_in_001(self):
         self.assertRaisesRegex(
             TypeError,
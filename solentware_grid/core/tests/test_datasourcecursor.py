@@ -181,6 +181,9 @@ class DataSourceCursor(_DataSourceCursor):
             *(recordset,),
         )
 
+    def test_004_record_count_key_001(self):
+        self.assertEqual(self.datasourcecursor.record_count_key(None), None)
+
 
 if __name__ == "__main__":
     runner = unittest.TextTestRunner
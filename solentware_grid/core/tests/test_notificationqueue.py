@@ -0,0 +1,101 @@
+# test_notificationqueue.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""notificationqueue tests"""
+
+import unittest
+
+from .. import notificationqueue
+
+
+class NotificationQueue(unittest.TestCase):
+    def setUp(self):
+        class Client:
+            def __init__(self):
+                self.calls = []
+
+            def on_data_change(self, instance):
+                self.calls.append(instance)
+
+        class BatchClient(Client):
+            def on_data_changes(self, instances):
+                self.calls.append(tuple(instances))
+
+        self.Client = Client
+        self.BatchClient = BatchClient
+        self.queue = notificationqueue.NotificationQueue()
+
+    def tearDown(self):
+        pass
+
+    def notify(self, client, instance):
+        self.queue.queue_notification(client, client.on_data_change, instance)
+
+    def test_001___init___001(self):
+        self.assertEqual(self.queue.notification_delay, None)
+        self.assertEqual(self.queue.notification_after, None)
+        self.assertEqual(self.queue.is_coalescing(), False)
+
+    def test_002_queue_notification_001(self):
+        client = self.Client()
+        self.notify(client, "i1")
+        self.notify(client, "i2")
+        self.assertEqual(client.calls, ["i1", "i2"])
+
+    def test_002_queue_notification_002(self):
+        client = self.Client()
+        batchclient = self.BatchClient()
+        self.queue.begin_batch()
+        self.queue.begin_batch()
+        for instance in "i1", "i2":
+            self.notify(client, instance)
+            self.notify(batchclient, instance)
+        self.queue.end_batch()
+        self.assertEqual(client.calls, [])
+        self.queue.end_batch()
+        self.assertEqual(client.calls, [None])
+        self.assertEqual(batchclient.calls, [("i1", "i2")])
+        self.queue.end_batch()
+        self.assertEqual(self.queue.is_coalescing(), False)
+
+    def test_002_queue_notification_003(self):
+        client = self.BatchClient()
+        self.queue.begin_batch()
+        self.notify(client, "i1")
+        self.notify(client, None)
+        self.queue.end_batch()
+        self.assertEqual(client.calls, [None])
+
+    def test_003_set_notification_window_001(self):
+        scheduled = []
+        client = self.Client()
+        self.queue.set_notification_window(
+            delay=50, after=lambda d, f: scheduled.append((d, f))
+        )
+        self.assertEqual(self.queue.is_coalescing(), True)
+        self.notify(client, "i1")
+        self.notify(client, "i2")
+        self.assertEqual(len(scheduled), 1)
+        self.assertEqual(scheduled[0][0], 50)
+        self.assertEqual(client.calls, [])
+        scheduled[0][1]()
+        self.assertEqual(client.calls, [None])
+        self.notify(client, "i3")
+        self.assertEqual(len(scheduled), 2)
+        self.queue.flush_notifications()
+        self.assertEqual(client.calls, [None, "i3"])
+
+    def test_004_discard_notifications_001(self):
+        client = self.Client()
+        self.queue.begin_batch()
+        self.notify(client, "i1")
+        self.queue.discard_notifications(client)
+        self.queue.end_batch()
+        self.assertEqual(client.calls, [])
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+    runner().run(loader(NotificationQueue))
@@ -0,0 +1,223 @@
+# test_positionestimator.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""positionestimator tests"""
+
+import unittest
+
+from .. import positionestimator
+
+
+class PositionEstimator(unittest.TestCase):
+    def setUp(self):
+        class Cursor:
+            def __init__(self, records):
+                self.records = records
+                self.index = None
+
+            def count_records(self):
+                return len(self.records)
+
+            def first(self):
+                self.index = 0
+                return self.records[0] if self.records else None
+
+            def next(self):
+                self.index += 1
+                if self.index < len(self.records):
+                    return self.records[self.index]
+                return None
+
+            def setat(self, record):
+                if record not in self.records:
+                    return None
+                self.index = self.records.index(record)
+                return record
+
+        self.Cursor = Cursor
+        self.estimator = positionestimator.PositionEstimator(checkpoints=4)
+
+    def tearDown(self):
+        pass
+
+    def test_001___init___001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"__init__\(\) takes from 1 to 4 positional arguments ",
+                    "but 5 were given",
+                )
+            ),
+            positionestimator.PositionEstimator,
+            *(None, None, None, None),
+        )
+
+    def test_001___init___002(self):
+        estimator = positionestimator.PositionEstimator()
+        self.assertEqual(estimator.checkpoints, positionestimator.CHECKPOINTS)
+        self.assertEqual(
+            estimator.maximum_changes, positionestimator.MAXIMUM_CHANGES
+        )
+        self.assertEqual(estimator.refine, False)
+        self.assertEqual(estimator.positions, [])
+        self.assertEqual(estimator.records, [])
+        self.assertEqual(estimator.count, 0)
+        self.assertEqual(estimator.changes, 0)
+        self.assertEqual(estimator.source, None)
+
+    def test_002_build_001(self):
+        self.estimator.build(self.Cursor([(i, "v") for i in range(10)]), "s")
+        self.assertEqual(self.estimator.positions, [1, 3, 5, 7, 9, 10])
+        self.assertEqual(
+            [r[0] for r in self.estimator.records], [0, 2, 4, 6, 8, 9]
+        )
+        self.assertEqual(self.estimator.count, 10)
+        self.assertEqual(self.estimator.source, "s")
+
+    def test_002_build_002(self):
+        self.estimator.build(self.Cursor([]), "s")
+        self.assertEqual(self.estimator.positions, [])
+        self.assertEqual(self.estimator.count, 0)
+
+    def test_003_is_valid_001(self):
+        self.assertEqual(self.estimator.is_valid("s"), False)
+        self.estimator.build(self.Cursor([(1, "v")]), "s")
+        self.assertEqual(self.estimator.is_valid("s"), True)
+        self.assertEqual(self.estimator.is_valid("t"), False)
+
+    def test_004_note_change_001(self):
+        self.estimator.maximum_changes = 1
+        self.estimator.build(self.Cursor([(1, "v")]), "s")
+        self.estimator.note_change()
+        self.assertEqual(self.estimator.is_valid("s"), True)
+        self.estimator.note_change()
+        self.assertEqual(self.estimator.is_valid("s"), False)
+
+    def test_005_clear_001(self):
+        self.estimator.build(self.Cursor([(1, "v")]), "s")
+        self.estimator.note_change()
+        self.estimator.clear()
+        self.assertEqual(self.estimator.positions, [])
+        self.assertEqual(self.estimator.records, [])
+        self.assertEqual(self.estimator.changes, 0)
+        self.assertEqual(self.estimator.source, None)
+
+    def test_006_estimate_position_001(self):
+        self.assertEqual(self.estimator.estimate_position(None), 0)
+        self.assertEqual(self.estimator.estimate_position((1, "v")), None)
+
+    def test_006_estimate_position_002(self):
+        self.estimator.build(
+            self.Cursor([(i * 10, "v") for i in range(100)]), "s"
+        )
+        self.assertEqual(self.estimator.estimate_position((0, "v")), 1)
+        self.assertEqual(self.estimator.estimate_position((250, "v")), 26)
+        self.assertEqual(self.estimator.estimate_position((500, "v")), 51)
+        self.assertEqual(self.estimator.estimate_position((990, "v")), 100)
+        self.assertEqual(self.estimator.estimate_position((2000, "v")), 100)
+
+    def test_006_estimate_position_003(self):
+        self.estimator.build(
+            self.Cursor([("k" + str(i).zfill(3), 1) for i in range(100)]),
+            "s",
+        )
+        self.assertEqual(self.estimator.estimate_position(("k025", 1)), 26)
+        self.assertEqual(self.estimator.estimate_position(("k030", 1)), 38)
+
+    def test_006_estimate_position_004(self):
+        self.estimator.build(self.Cursor([("k", 1)]), "s")
+        self.assertEqual(self.estimator.estimate_position((1, 1)), None)
+
+    def test_007_estimate_record_001(self):
+        self.assertEqual(self.estimator.estimate_record(1), None)
+
+    def test_007_estimate_record_002(self):
+        self.estimator.build(self.Cursor([(i, "v") for i in range(100)]), "s")
+        self.assertEqual(self.estimator.estimate_record(1), (0, "v"))
+        self.assertEqual(self.estimator.estimate_record(30), (25, "v"))
+        self.assertEqual(self.estimator.estimate_record(45), (50, "v"))
+        self.assertEqual(self.estimator.estimate_record(-1), (99, "v"))
+        self.assertEqual(self.estimator.estimate_record(500), (99, "v"))
+
+    def test_008_is_building_001(self):
+        self.assertEqual(self.estimator.is_building("s"), False)
+        self.estimator.start_build(self.Cursor([(1, "v")]), "s")
+        self.assertEqual(self.estimator.is_building("s"), True)
+        self.assertEqual(self.estimator.is_building("t"), False)
+
+    def test_009_start_build_001(self):
+        self.estimator.build(self.Cursor([(1, "v")]), "s")
+        self.estimator.start_build(self.Cursor([(1, "v"), (2, "v")]), "t")
+        self.assertEqual(self.estimator.positions, [])
+        self.assertEqual(self.estimator.source, None)
+        self.assertEqual(self.estimator.is_valid("s"), False)
+
+    def test_010_continue_build_001(self):
+        self.assertEqual(
+            self.estimator.continue_build(self.Cursor([(1, "v")])), True
+        )
+        self.assertEqual(self.estimator.positions, [])
+
+    def test_010_continue_build_002(self):
+        records = [(i, "v") for i in range(10)]
+        self.estimator.start_build(self.Cursor(records), "s")
+        self.assertEqual(
+            self.estimator.continue_build(self.Cursor(records), steps=4),
+            False,
+        )
+        self.assertEqual(self.estimator.positions, [1, 3])
+        self.assertEqual(self.estimator.is_valid("s"), False)
+        self.assertEqual(
+            self.estimator.continue_build(self.Cursor(records), steps=4),
+            False,
+        )
+        self.assertEqual(
+            self.estimator.continue_build(self.Cursor(records), steps=4),
+            True,
+        )
+        self.assertEqual(self.estimator.positions, [1, 3, 5, 7, 9, 10])
+        self.assertEqual(self.estimator.count, 10)
+        self.assertEqual(self.estimator.is_valid("s"), True)
+        self.assertEqual(self.estimator.is_building("s"), False)
+
+    def test_010_continue_build_003(self):
+        records = [(i, "v") for i in range(10)]
+        self.estimator.start_build(self.Cursor(records), "s")
+        self.estimator.continue_build(self.Cursor(records), steps=4)
+        del records[3]
+        self.assertEqual(
+            self.estimator.continue_build(self.Cursor(records), steps=4),
+            False,
+        )
+        self.assertEqual(self.estimator.positions, [])
+        self.assertEqual(self.estimator.is_building("s"), True)
+        self.estimator.continue_build(self.Cursor(records), steps=None)
+        self.assertEqual(self.estimator.count, 9)
+        self.assertEqual(self.estimator.is_valid("s"), True)
+
+    def test_011_nearest_checkpoint_001(self):
+        self.assertEqual(self.estimator.nearest_checkpoint(1), (None, 0))
+
+    def test_011_nearest_checkpoint_002(self):
+        self.estimator.build(self.Cursor([(i, "v") for i in range(100)]), "s")
+        self.assertEqual(self.estimator.nearest_checkpoint(1), ((0, "v"), 0))
+        self.assertEqual(
+            self.estimator.nearest_checkpoint(30), ((25, "v"), 4)
+        )
+        self.assertEqual(
+            self.estimator.nearest_checkpoint(45), ((50, "v"), -6)
+        )
+        self.assertEqual(
+            self.estimator.nearest_checkpoint(-2), ((99, "v"), -1)
+        )
+        self.assertEqual(
+            self.estimator.nearest_checkpoint(500), ((99, "v"), 0)
+        )
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+    runner().run(loader(PositionEstimator))
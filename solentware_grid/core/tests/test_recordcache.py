@@ -0,0 +1,172 @@
+# test_recordcache.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""recordcache tests"""
+
+import unittest
+
+from .. import recordcache
+
+
+class RecordCache(unittest.TestCase):
+    def setUp(self):
+        class Datasource:
+            def __init__(self, dbname, primary):
+                self.dbidentity = 1
+                self.dbset = "dbset"
+                self.dbname = dbname
+                self.primary = primary
+                self.dbhome = object()
+
+        class Row:
+            def __init__(self, keys):
+                self.keys = keys
+
+            def get_keys(self, datasource):
+                if datasource.primary:
+                    return [self.keys[0]]
+                return [self.keys[1]]
+
+        class Value:
+            data = None
+
+        class Newrow:
+            loads = 0
+
+            def __init__(self):
+                self.value = Value()
+                self.widgets = []
+
+            def load_instance(self, database, dbset, dbname, record):
+                Newrow.loads += 1
+                self.database = database
+                self.record = record
+                self.value.data = [record]
+
+        self.Row = Row
+        self.Newrow = Newrow
+        self.primary = Datasource("dbset", True)
+        self.secondary = Datasource("index", False)
+        self.recordcache = recordcache.RecordCache(maximum_records=3)
+
+    def tearDown(self):
+        pass
+
+    def test_001___init___001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"__init__\(\) takes from 1 to 2 positional arguments ",
+                    "but 3 were given",
+                )
+            ),
+            recordcache.RecordCache,
+            *(None, None),
+        )
+
+    def test_001___init___002(self):
+        cache = recordcache.RecordCache()
+        self.assertEqual(cache.maximum_records, recordcache.MAXIMUM_RECORDS)
+        self.assertEqual(len(cache.records), 0)
+        self.assertEqual(
+            cache.get_statistics(),
+            dict(entries=0, hits=0, misses=0, evictions=0),
+        )
+
+    def test_002_load_row_001(self):
+        row = self.Newrow()
+        self.assertEqual(
+            self.recordcache.load_row(self.primary, (1, "v"), row), None
+        )
+        self.assertEqual(row.value.data, [(1, "v")])
+        copied = self.Newrow()
+        self.recordcache.load_row(self.primary, (1, "v"), copied)
+        self.assertEqual(self.Newrow.loads, 1)
+        self.assertEqual(copied.record, (1, "v"))
+        self.assertEqual(copied.value.data, [(1, "v")])
+        self.assertIsNot(copied.value, row.value)
+        self.assertIsNot(copied.widgets, row.widgets)
+        self.assertIs(copied.database, self.primary.dbhome)
+        copied.value.data.append("edited")
+        again = self.Newrow()
+        self.recordcache.load_row(self.primary, (1, "v"), again)
+        self.assertEqual(again.value.data, [(1, "v")])
+        self.assertEqual(
+            self.recordcache.get_statistics(),
+            dict(entries=1, hits=2, misses=1, evictions=0),
+        )
+
+    def test_002_load_row_002(self):
+        self.recordcache.load_row(self.primary, (1, "v"), self.Newrow())
+        self.recordcache.load_row(self.secondary, (1, "v"), self.Newrow())
+        row = self.Newrow()
+        self.recordcache.load_row(self.primary, [1], row)
+        self.assertEqual(row.record, [1])
+        self.assertEqual(self.Newrow.loads, 3)
+        self.assertEqual(
+            self.recordcache.get_statistics(),
+            dict(entries=2, hits=0, misses=2, evictions=0),
+        )
+
+    def test_002_load_row_003(self):
+        for key in range(4):
+            self.recordcache.load_row(self.primary, key, self.Newrow())
+        self.assertEqual([k[-1] for k in self.recordcache.records], [1, 2, 3])
+        self.assertEqual(self.recordcache.evictions, 1)
+
+    def test_004_clear_001(self):
+        self.recordcache.load_row(self.primary, 1, self.Newrow())
+        self.assertEqual(self.recordcache.clear(), None)
+        self.assertEqual(len(self.recordcache.records), 0)
+
+    def test_005_on_data_change_001(self):
+        row = self.Row(((1, "v"), ("a", 1)))
+        other = self.Row(((2, "w"), ("b", 2)))
+        for source, keys in ((self.primary, 0), (self.secondary, 1)):
+            self.recordcache.load_row(source, row.keys[keys], self.Newrow())
+            self.recordcache.load_row(
+                source, other.keys[keys], self.Newrow()
+            )
+        self.recordcache.maximum_records = 10
+        self.recordcache.load_row(self.secondary, ("b", 2), self.Newrow())
+        self.recordcache.on_data_change(self.primary, row)
+        self.assertEqual(
+            [k[-1] for k in self.recordcache.records], [(2, "w"), ("b", 2)]
+        )
+
+    def test_005_on_data_change_002(self):
+        row = self.Row(((1, "v"), ("a", 1)))
+        row.newrecord = self.Row(((1, "x"), ("c", 1)))
+        self.recordcache.load_row(self.primary, (1, "x"), self.Newrow())
+        self.recordcache.load_row(self.secondary, ("a", 1), self.Newrow())
+        self.recordcache.load_row(self.secondary, ("b", 2), self.Newrow())
+        self.recordcache.on_data_change(self.secondary, row)
+        self.assertEqual(
+            [k[-1] for k in self.recordcache.records], [("b", 2)]
+        )
+
+    def test_005_on_data_change_003(self):
+        self.recordcache.load_row(self.primary, (1, "v"), self.Newrow())
+        self.recordcache.on_data_change(self.primary, None)
+        self.assertEqual(len(self.recordcache.records), 0)
+
+    def test_005_on_data_change_004(self):
+        self.recordcache.load_row(self.primary, (1, "v"), self.Newrow())
+        self.recordcache.on_data_change(None, None)
+        self.assertEqual(len(self.recordcache.records), 0)
+
+
+class GetSharedRecordCache(unittest.TestCase):
+    def test_001_get_shared_record_cache_001(self):
+        cache = recordcache.get_shared_record_cache()
+        self.assertIsInstance(cache, recordcache.RecordCache)
+        self.assertIs(recordcache.get_shared_record_cache(), cache)
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+    runner().run(loader(RecordCache))
+    runner().run(loader(GetSharedRecordCache))
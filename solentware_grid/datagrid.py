@@ -5,13 +5,24 @@
 """Base classes for scrollable grids of rows from a database."""
 
 import tkinter
-from bisect import insort, bisect_left, bisect_right
+import time
+from bisect import bisect_left, bisect_right
 
 from solentware_bind.gui.bindings import Bindings
 
 from .gui.constants import SHIFTDOWN, CONTROLDOWN
 from .core.dataclient import DataClient
-from .gui.datarow import DataHeader
+from .core.datakeys import SortedKeys
+from .gui.datarow import (
+    DataHeader,
+    DataRow,
+    NULL_COLOUR,
+    SELECTION_COLOUR,
+    BOOKMARK_COLOUR,
+    SELECTION_CYCLE_COLOUR,
+    SELECTION_AND_BOOKMARK_COLOUR,
+    ROW_UNDER_POINTER_COLOUR,
+)
 from .gui.eventspec import EventSpec
 
 # DataGridBase.get_spare_row_widget is necessary in XP, but not W2000 or *nix,
@@ -44,13 +55,59 @@ from .gui.eventspec import EventSpec
 # the application on Windows 7 (Vista and XP also I assume).
 # The Microsoft Windows problem does not occur at Windows 10 with Python 3.9
 # or 3.10 which is fortunate because disabling the spare widget pool by
-# destroying the widget in method add_widget_to_spare_pool fixes the problem
+# destroying the widget in method add_widget_to_spare_pool fixed the problem
 # introduced by plugging the memory leak described in the tkinter.Misc.bind
 # docstring.  See methods make_header_widgets and make_row_widgets in the
 # gui.datarow module.  The problem is highlighting apparently random cells
 # in the datagrid when the pointer is over a header row: it is assumed the
 # highlighted cells were all in the same row before the application was
 # resized.
+# The highlighting problem is caused by the <Enter> and <Leave> bindings of
+# the row which last displayed a widget surviving the widget's return to the
+# spare widget pool: DataHeader.make_header_widgets does not remove them, and
+# DataRow.make_row_widgets removes them only via it's own register of
+# bindings, so a reused widget kept calling the highlight methods of a row no
+# longer displayed.  The spare widget pool is enabled again with each row's
+# bindings removed, by DataRow.unbind_row_widgets, before the row's widgets
+# are put in the pool; and the pool widgets are reset to the configuration
+# of a new widget of their class.  The size of the pool for each widget
+# class is limited by SPARE_WIDGET_POOL_SIZE: extra widgets are destroyed.
+# The click and pointer crossing bindings of row widgets made on each fill
+# of the grid call Tcl commands created once per grid, by method
+# DataGridBase.get_handler_script, rather than a new Tcl command for each
+# binding: the commands are deleted when the grid is destroyed.
+
+# Maximum number of unused widgets of a class kept for reuse by a grid.
+SPARE_WIDGET_POOL_SIZE = 1000
+
+# Maximum number of records noted for slider positions while dragging the
+# slider, after which the noted records are discarded.
+SLIDER_POSITION_CACHE_SIZE = 1000
+
+# Maximum number of records whose row heights are noted, after which the
+# noted heights are discarded.
+ROW_HEIGHT_CACHE_SIZE = 10000
+
+# Number of grid rows the data rows may move, while scrolling one line at a
+# time, before they are gridded again.  Data rows are gridded from half this
+# number of grid rows below the header rows so there is room to scroll in
+# either direction: the empty grid rows between take no space.
+GRID_ROW_OFFSET_LIMIT = 1000
+
+# Row background colour for each row state used by set_keys_properties.
+# The DataRow method which sets the colour is 'set_background_<state>'.
+_ROW_STATE_BACKGROUNDS = {
+    "bookmarked_selection": SELECTION_AND_BOOKMARK_COLOUR,
+    "selection_cycle": SELECTION_CYCLE_COLOUR,
+    "selection": SELECTION_COLOUR,
+    "bookmark": BOOKMARK_COLOUR,
+    "normal": NULL_COLOUR,
+}
+
+# Widget options which can be set only when the widget is created.
+_CREATION_ONLY_OPTIONS = frozenset(
+    ("class", "colormap", "container", "screen", "use", "visual")
+)
 
 
 class GridBaseError(Exception):
@@ -87,14 +144,81 @@ class DataGridBase(DataClient, Bindings):
         # _spare_rows use becomes uncertain in presence of gridrows_for_key
         # per class dictionary of unused widgets for constructing rows
         self._spare_rows = dict()
+        # per class configuration of a new widget used to reset spare widgets
+        self._fresh_widget_configuration = dict()
         # gridrows_for_keys added so that the Frame for each key can be
         # removed allowing -uniform attribute for grid geometry manager
         # to arrange data into neat columns.
         # the grid rows used for key item in self.keys (DataClient)
         self.gridrows_for_key = dict()  # {key: set([gridrow, ...,], ...)
+        # Number of grid rows used by header widgets: the data rows follow.
+        self._header_row_count = 0
+        # Header rows returned by header_maker at last fill, and their
+        # height.  The header widgets stay gridded while header_maker
+        # returns the same rows, so fills do not build them again.
+        self._header_rows = None
+        self._header_height = 0
+        # Grid row of first data row, and number of grid rows used by data
+        # rows.  Scrolling one line grids the new row next to the others
+        # without moving them, so the first data row may be below the
+        # header rows.
+        self._data_row_base = 0
+        self._data_row_span = 0
+        # Identifier of pending after_idle call of fill_readahead.
+        self._fill_readahead_pending = None
         # Count of scrollable records.  Maintained so the slider gives a
         # reasonable idea of the number of records available.
         self.record_count = None
+        # A core.positionestimator.PositionEstimator instance, or similar,
+        # estimates positions for the scrollbar rather than asking the
+        # cursor for exact positions if set.
+        self.position_estimator = None
+        self._refine_yscrollbar_pending = None
+        # Identifier of pending after_idle call to take the next
+        # position_estimator checkpoints.
+        self._build_position_estimator_pending = None
+        # Milliseconds between fills of the grid at the slider position
+        # while the slider is dragged.  None means fill on release only.
+        self.slider_preview_interval = None
+        self._slider_preview_pending = None
+        self._slider_preview_position = None
+        self._slider_position_keys = dict()
+        self._slider_position_source = None
+        # Refill of grid after database updates is deferred while grid is
+        # not viewable if defer_refresh_while_hidden is True.  dirty_since
+        # is time.monotonic() at first deferred refill, and
+        # _deferred_refresh is the method to call when grid becomes
+        # viewable.  Not all window systems send the events which say the
+        # grid is viewable again, so deferral is off by default.
+        self.defer_refresh_while_hidden = False
+        self.dirty_since = None
+        self._deferred_refresh = None
+        # All rows made by a row class with a font have the same height if
+        # fixed_row_height is True, so the rows which fit the canvas are
+        # calculated from the first row rather than by asking Tk for the
+        # height of every row.  {(row class, font): height, ...}
+        self.fixed_row_height = False
+        self._fixed_row_heights = dict()
+        # Row heights measured by _fill_down and _fill_up, used to avoid
+        # measuring rows again and to predict rows which would not fit.
+        # {key: {(row class, font): height, ...}, ...}
+        self._row_heights = dict()
+        # The widgets of header and data rows share one bindtag, rather than
+        # each widget having it's own bindings, if delegate_row_events is
+        # True.  The row for a widget is found in _widget_keys, and the row
+        # under the pointer from the row bands, (tops, bottoms, keys), which
+        # are measured once after the rows are gridded.
+        self.delegate_row_events = False
+        self.row_bindtag = "".join(("DataGridRows", str(id(self))))
+        self._widget_keys = dict()
+        self._row_bands = None
+        # Handlers, and Tcl scripts calling them, bound to the widgets of
+        # rows.  Each handler's Tcl command is created once per grid by
+        # get_handler_script and deleted when the grid is destroyed.
+        # {function: handler, ...}
+        # {function: (Tcl command name, Tcl script), ...}
+        self._handlers = dict()
+        self._handler_scripts = dict()
 
         # Top frame for grid widget.
         self.frame = tkinter.Frame(parent, takefocus=1, highlightthickness=1)
@@ -113,6 +237,7 @@ class DataGridBase(DataClient, Bindings):
         # Canvas for header and data rows.
         self.gcanvas = tkinter.Canvas(self.frame)
         self.gcanvas.grid(column=0, row=0, sticky=tkinter.NSEW, rowspan=2)
+        self.bind(self.frame, "<Destroy>", function=self.on_destroy_grid)
         self.__bind_on()
 
         # Top frame for header and data rows.
@@ -153,7 +278,7 @@ class DataGridBase(DataClient, Bindings):
         self.selection = []
 
         # Keys marked while current selection (???).
-        self.bookmarks = []
+        self.bookmarks = SortedKeys()
 
         # Current key for bottom row.
         # Used as a base point for scrolling.
@@ -210,7 +335,7 @@ class DataGridBase(DataClient, Bindings):
     def add_bookmark(self, key):
         """Add key to bookmarks."""
         if key not in self.bookmarks:
-            insort(self.bookmarks, key)
+            self.bookmarks.add(key)
             if key not in self.keys:
                 self.fill_view_from_record(key)
             else:
@@ -285,20 +410,59 @@ class DataGridBase(DataClient, Bindings):
     def add_widget_to_spare_pool(self, widget):
         """Return widget to the pool of discarded grid cell widgets.
 
-        This method is a hack to make mouse-drag resizing of the toplevel
-        widget of the application work on XP.  See comments at top of
-        datagrid.py
+        The widget is reset to the configuration of a new widget of the
+        same class, or destroyed if the pool for the class is full.
+
+        Bindings made by the row which displayed the widget must have been
+        removed already.  See comments at top of datagrid.py
+
+        """
+        pool = self._spare_rows.setdefault(widget.__class__, set())
+        if len(pool) >= SPARE_WIDGET_POOL_SIZE:
+            widget.destroy()
+            return
+        widget.configure(**self._get_fresh_widget_configuration(widget))
+        pool.add(widget)
+
+    def add_row_to_spare_pool(self, row):
+        """Remove row bindings and return widgets in row to spare pool.
+
+        row - a row, usually a DataRow instance, returned by make_row.
 
         """
-        # try:
-        #     self._spare_rows[widget.__class__].add(widget)
-        # except KeyError:
-        #     self._spare_rows[widget.__class__] = {widget}
-        widget.destroy()
+        widgets = [widget[0] for gridrow in row() for widget in gridrow]
+        row.unbind_row_widgets()
+        for widget in widgets:
+            widget.grid_forget()
+            self.add_widget_to_spare_pool(widget)
+
+    def after_cancel_client_read(self, identifier):
+        """Cancel close of read scheduled by after_client_read."""
+        self.frame.after_cancel(identifier)
+
+    def after_client_read(self, delay, callback):
+        """Schedule callback to close read after delay milliseconds."""
+        return self.frame.after(
+            delay, self.try_command(callback, self.frame)
+        )
+
+    def bind_handler(self, widget, sequence, function):
+        """Bind sequence for widget to Tcl script calling function.
+
+        The Tcl command calling function is shared by all widgets bound to
+        function, so rows made for each fill of the grid do not create Tcl
+        commands.  Bind sequence to the empty string to remove the binding.
+
+        """
+        widget.bind(sequence, self.get_handler_script(function))
 
     def bind_off(self):
         """Disable all bindings."""
         self.bind(self.gcanvas, "<Configure>", function="")
+        self.bind(self.frame, "<Map>", function="")
+        self.bind(self.frame, "<Visibility>", function="")
+        self.bind(self.gcanvas, "<Expose>", function="")
+        self._unbind_row_bindtag()
 
     def bind_on(self):
         """Enable all bindings."""
@@ -309,6 +473,34 @@ class DataGridBase(DataClient, Bindings):
         self.bind(
             self.gcanvas, "<Configure>", function=self.on_configure_canvas
         )
+        # Hiding an ancestor, a notebook tab for example, does not send an
+        # <Unmap> event to self.frame but redisplay may send <Visibility>,
+        # which is not sent on all window systems, or <Expose>.
+        self.bind(self.frame, "<Map>", function=self.on_map_grid)
+        self.bind(self.frame, "<Visibility>", function=self.on_map_grid)
+        self.bind(self.gcanvas, "<Expose>", function=self.on_map_grid)
+        self._bind_row_bindtag()
+
+    def _get_row_bindtag_handlers(self):
+        """Return (sequence, function) pairs bound to row_bindtag."""
+        return (
+            (EventSpec.give_focus_to_datagridbase, self.focus_set_frame),
+            (EventSpec.select_row_in_datagridbase, self.select_row_by_click),
+            ("<Enter>", self.on_pointer_enter_row_widget),
+            ("<Leave>", self.on_pointer_leave_row_widget),
+        )
+
+    def _bind_row_bindtag(self):
+        """Bind the events of all row widgets to row_bindtag."""
+        for sequence, function in self._get_row_bindtag_handlers():
+            self.frame.bind_class(
+                self.row_bindtag, sequence, self.get_handler_script(function)
+            )
+
+    def _unbind_row_bindtag(self):
+        """Remove the bindings to row_bindtag."""
+        for sequence, function in self._get_row_bindtag_handlers():
+            self.frame.unbind_class(self.row_bindtag, sequence)
 
     def bookmark_down(self):
         """Select first bookmark after current selection."""
@@ -352,8 +544,7 @@ class DataGridBase(DataClient, Bindings):
         if self.selection[0] not in self.keys:
             self.fill_view(currentkey=self.selection[0], exclude=False)
         else:
-            self.set_properties(oldselection)
-            self.set_properties(self.selection[0])
+            self.set_keys_properties((oldselection, self.selection[0]))
 
     def bookmark_up(self):
         """Select first bookmark before current selection."""
@@ -401,8 +592,7 @@ class DataGridBase(DataClient, Bindings):
                 currentkey=self.selection[0], down=False, exclude=False
             )
         else:
-            self.set_properties(oldselection)
-            self.set_properties(self.selection[0])
+            self.set_keys_properties((oldselection, self.selection[0]))
 
     def cancel_selection_bookmark(self):
         """Cancel selection from bookmarks."""
@@ -433,20 +623,24 @@ class DataGridBase(DataClient, Bindings):
 
     def clear_bookmarks(self):
         """Clear bookmarks and remove actual visible indicators."""
-        for key in self.bookmarks:
-            if key in self.keys:
-                self.set_properties(key)
-        self.bookmarks = []
+        bookmarks = self.bookmarks
+        self.bookmarks = SortedKeys()
+        self.set_keys_properties(bookmarks)
 
     def clear_selections(self):
         """Clear selections and remove actual visible indicators."""
-        for key in self.selection:
-            if key in self.keys:
-                self.set_properties(key)
+        selection = self.selection
         self.selection = []
+        self.set_keys_properties(selection)
 
     def clear_client_keys(self):
-        """Extend to set background for listed items if re-listed."""
+        """Extend to remove row bindings from widgets before clearing keys.
+
+        The widgets can then be put in the spare widget pool for reuse.
+
+        """
+        for row in self.objects.values():
+            row.unbind_row_widgets()
         super().clear_client_keys()
 
     def clear_grid_description(self):
@@ -454,10 +648,80 @@ class DataGridBase(DataClient, Bindings):
         self.clear_client_keys()
         self.gridrows_for_key = dict()
 
+    def clear_fixed_row_heights(self):
+        """Discard row heights noted when fixed_row_height is True.
+
+        Call this method after changing the fonts used to display rows.
+
+        """
+        self._fixed_row_heights.clear()
+
+    def clear_row_heights(self):
+        """Discard all noted row heights.
+
+        Call this method after changing the fonts used to display rows.
+
+        """
+        self._row_heights.clear()
+        self.clear_fixed_row_heights()
+
+    def delete_handler_scripts(self):
+        """Delete the Tcl commands created by get_handler_script.
+
+        Widgets must not be bound to the deleted scripts.
+
+        """
+        for funcid, script in self._handler_scripts.values():
+            self.frame.deletecommand(funcid)
+        self._handler_scripts.clear()
+
+    def discard_changed_keys(self, instance):
+        """Discard bookmarks and selections of keys removed by update.
+
+        The keys of instance not in it's newrecord attribute are removed,
+        or all keys of instance if newrecord is None or absent.  Nothing
+        is removed if instance is None or newrecord is False.
+
+        """
+        if instance is None:
+            return
+        newrecord = instance.__dict__.get("newrecord")
+        if newrecord is False:
+            return
+        oldkeys = instance.get_keys(self.datasource)
+        if newrecord is not None:
+            newkeyset = set(newrecord.get_keys(self.datasource))
+            oldkeys = [o for o in oldkeys if o not in newkeyset]
+        for key in oldkeys:
+            if key in self.bookmarks:
+                self.bookmarks.remove(key)
+        self.selection = [s for s in self.selection if s not in oldkeys]
+
+    def discard_row_heights(self, instance):
+        """Discard noted row heights for records changed by update.
+
+        All noted heights are discarded if instance is None or the keys of
+        instance, and of it's newrecord attribute, cannot be found.
+
+        """
+        if instance is None:
+            self._row_heights.clear()
+            return
+        try:
+            records = [instance]
+            newrecord = instance.__dict__.get("newrecord")
+            if newrecord:
+                records.append(newrecord)
+            for record in records:
+                for key in record.get_keys(self.datasource):
+                    self._row_heights.pop(key, None)
+        except Exception:
+            self._row_heights.clear()
+
     def clear_grid_keys(self):
         """Clear grid selections and description and keys."""
         self.selection = []
-        self.bookmarks = []
+        self.bookmarks = SortedKeys()
         self.topkey = None
         self.bottomkey = None
         self.currentkey = False
@@ -471,19 +735,21 @@ class DataGridBase(DataClient, Bindings):
         The row that is not completely visible is removed.
 
         """
-        # forget widgets currently gridded and put in spare widget pool.
-        for widget in self.data.grid_slaves():
+        # forget widgets currently gridded, except the header widgets, and
+        # put in spare widget pool.
+        header_widgets = self._get_header_widgets(self._header_rows)
+        for widget in self._get_gridded_widgets():
+            if widget in header_widgets:
+                continue
             widget.grid_forget()
             self.add_widget_to_spare_pool(widget)
-        cheight = 0
-        # build widgets for header rows but do not grid them.
+        self.view_is_full = False
+        # header widgets are built, and gridded, only if header_maker
+        # returns rows other than those displayed.
         headers = self.header_maker(self.get_spare_row_widget, self.data)
-        cheight += self._get_row_reqheight(headers)
-        for hrow in headers:
-            for wspec in hrow:
-                self.focus_set_grid_on_click_child_widget(wspec[0])
-        # align vertical scrollbar with data rows.
-        self.frame.grid_rowconfigure(0, minsize=cheight)
+        if headers is not self._header_rows:
+            self._grid_header_rows(headers, header_widgets)
+        cheight = self._header_height
         # build widgets for data rows but do not grid them.
         rows = []
         if self.partial is False:
@@ -495,7 +761,7 @@ class DataGridBase(DataClient, Bindings):
                 self.reverse_add_record_direction()
                 cheight = self._fill_up(rows, cheight)
             for k in self.keys[len(rows) :]:
-                del self.objects[k]
+                self.objects.pop(k).unbind_row_widgets()
                 del self.gridrows_for_key[k]
             del self.keys[len(rows) :]
         else:
@@ -504,31 +770,110 @@ class DataGridBase(DataClient, Bindings):
                 self.reverse_add_record_direction()
                 cheight = self._fill_down(rows, cheight)
             for k in self.keys[: -len(rows)]:
-                del self.objects[k]
+                self.objects.pop(k).unbind_row_widgets()
                 del self.gridrows_for_key[k]
             del self.keys[: -len(rows)]
         # assume one grid row per record.
         # assume all configuration done except for row and column.
-        # grid the new header widgets.
-        baserow = 0
+        # grid the new data widgets.
+        self._grid_data_rows()
+        self._set_scrollregion()
+        self._schedule_fill_readahead()
+
+    def _grid_header_rows(self, headers, header_widgets):
+        """Grid widgets for headers, replacing header_widgets, in grid.
+
+        headers - the rows returned by header_maker.
+        header_widgets - widgets of the header rows displayed previously.
+
+        """
+        new_header_widgets = self._get_header_widgets(headers)
+        for widget in header_widgets:
+            if widget not in new_header_widgets:
+                widget.grid_forget()
+                self.add_widget_to_spare_pool(widget)
+        self._header_rows = headers
+        self._header_height = self._get_row_reqheight(headers)
+        for hrow in headers:
+            for wspec in hrow:
+                self._bind_row_widget(wspec[0])
+        # align vertical scrollbar with data rows.
+        self.frame.grid_rowconfigure(0, minsize=self._header_height)
+        # assume all configuration done except for row and column.
         for row, gridrow in enumerate(headers):
             for column, widget in enumerate(gridrow):
                 widget[0].grid_configure(
-                    row=row + baserow,
+                    row=row,
                     column=column,
                     sticky=widget[1]["sticky"],
                 )
-        # grid the new data widgets.
-        baserow += len(headers)
+        self._header_row_count = len(headers)
+
+    def _get_header_widgets(self, headers):
+        """Return set of widgets in headers, which may be None."""
+        if headers is None:
+            return set()
+        return {wspec[0] for hrow in headers for wspec in hrow}
+
+    def _grid_data_rows(self):
+        """Grid widgets for rows in self.keys below the header rows."""
+        baserow = self._header_row_count + GRID_ROW_OFFSET_LIMIT // 2
+        self._widget_keys.clear()
+        self._row_bands = None
+        self._data_row_base = baserow
         for key in self.keys:
-            for row, gridrow in enumerate(self.gridrows_for_key[key]()):
-                for column, widget in enumerate(gridrow):
-                    widget[0].grid_configure(
-                        row=row + baserow,
-                        column=column,
-                        sticky=widget[1]["sticky"],
-                    )
-            baserow += len(self.gridrows_for_key[key]())
+            baserow += self._grid_data_row(key, baserow)
+        self._data_row_span = baserow - self._data_row_base
+        self._layout_grid()
+
+    def _grid_data_row(self, key, baserow):
+        """Grid widgets for row for key from baserow and return row count."""
+        widget_keys = self._widget_keys
+        gridrows = self.gridrows_for_key[key]()
+        for row, gridrow in enumerate(gridrows):
+            for column, widget in enumerate(gridrow):
+                widget[0].grid_configure(
+                    row=row + baserow,
+                    column=column,
+                    sticky=widget[1]["sticky"],
+                )
+                widget_keys[widget[0]] = key
+        return len(gridrows)
+
+    def _shift_data_rows(self, key, old_span, down):
+        """Grid row for key in place of removed row of old_span grid rows.
+
+        The rows kept stay in their grid rows so only the widgets of the
+        new row are gridded.  All rows are gridded again if the new row
+        does not fit between the header rows and the top row, or the rows
+        have moved more than GRID_ROW_OFFSET_LIMIT grid rows below the
+        header rows.
+
+        """
+        new_span = len(self.gridrows_for_key[key]())
+        if down:
+            baserow = self._data_row_base + self._data_row_span
+            self._data_row_base += old_span
+        else:
+            baserow = self._data_row_base - new_span
+            self._data_row_base = baserow
+        self._data_row_span += new_span - old_span
+        header_row_count = self._header_row_count
+        if (
+            baserow < header_row_count
+            or self._data_row_base - header_row_count > GRID_ROW_OFFSET_LIMIT
+        ):
+            self._grid_data_rows()
+            return
+        self._grid_data_row(key, baserow)
+        self._row_bands = None
+        self._layout_grid()
+
+    def _layout_grid(self):
+        """Do nothing.  Subclasses may override to lay out gridded rows."""
+
+    def _set_scrollregion(self):
+        """Set canvas scrollregion and schedule vertical scrollbar setting."""
         # Ref: Pract. Prog. in Tcl and Tk (4th ed) Canvas widget Window Items.
         # There is a suggestion that a wait_visibility() call on one of the
         # self.data.grid_slaves() widgets is necessary at this point to
@@ -544,7 +889,7 @@ class DataGridBase(DataClient, Bindings):
                 (
                     "0",
                     "0",
-                    str(self.data.winfo_reqwidth()),
+                    str(self._get_scrollregion_width()),
                     str(self.gcanvas.winfo_height()),
                 )
             )
@@ -570,8 +915,7 @@ class DataGridBase(DataClient, Bindings):
         fill the grid, reset the scrollbar, and close cursor.
 
         """
-        self.datasource.dbhome.start_read_only_transaction()
-        self.make_client_cursor()
+        self.start_client_read()
         try:
             self.set_fill_parameters(
                 currentkey=currentkey,
@@ -582,8 +926,7 @@ class DataGridBase(DataClient, Bindings):
             self.clear_grid_description()
             self.fill_data_grid()
         finally:
-            self.close_client_cursor()
-            self.datasource.dbhome.end_read_only_transaction()
+            self.end_client_read()
 
     def fill_view_from_bottom(self):
         """Load view starting at self.bottomkey."""
@@ -595,13 +938,11 @@ class DataGridBase(DataClient, Bindings):
 
     def fill_view_from_position(self, position):
         """Load view starting at position."""
-        self.datasource.dbhome.start_read_only_transaction()
-        self.make_client_cursor()
+        self.start_client_read()
         try:
             key = self.cursor.get_record_at_position(position)
         finally:
-            self.close_client_cursor()
-            self.datasource.dbhome.end_read_only_transaction()
+            self.end_client_read()
         self.fill_view(currentkey=key, exclude=False)
 
     def fill_view_from_record(self, record):
@@ -622,11 +963,11 @@ class DataGridBase(DataClient, Bindings):
 
     def fill_view_to_position(self, position):
         """Load view ending at position."""
-        self.make_client_cursor()
+        self.start_client_read()
         try:
             key = self.cursor.get_record_at_position(position)
         finally:
-            self.close_client_cursor()
+            self.end_client_read()
         self.fill_view(currentkey=key, down=False)
 
     def fill_view_to_record(self, record):
@@ -638,37 +979,140 @@ class DataGridBase(DataClient, Bindings):
         self.fill_view(currentkey=False, down=False)
 
     def focus_set_frame(self, event=None):
-        """Give grid the focus."""
+        """Give grid the focus after doing any deferred refresh."""
+        self.on_map_grid()
         self.frame.focus_set()
 
     def focus_set_grid_on_click_child_widget(self, widget):
         """Bind button1 to focus_set_frame for widget and all child widgets."""
-        self.bind(
+        self.bind_handler(
             widget,
             EventSpec.give_focus_to_datagridbase,
-            function=self.focus_set_frame,
+            self.focus_set_frame,
         )
-        self.bind(
+        self.bind_handler(
             widget,
             EventSpec.select_row_in_datagridbase,
-            function=self.select_row_by_click,
+            self.select_row_by_click,
         )
         for child in widget.winfo_children():
             self.focus_set_grid_on_click_child_widget(child)
 
+    def add_row_bindtag(self, widget):
+        """Add row_bindtag to bindtags of widget and all child widgets.
+
+        The row_bindtag follows the widget's own bindtag, where the bindings
+        made by focus_set_grid_on_click_child_widget would be.
+
+        """
+        bindtags = widget.bindtags()
+        if self.row_bindtag not in bindtags:
+            widget.bindtags(bindtags[:1] + (self.row_bindtag,) + bindtags[1:])
+        for child in widget.winfo_children():
+            self.add_row_bindtag(child)
+
+    def _bind_row_widget(self, widget):
+        """Bind click to give focus and select row for widget in a row."""
+        if self._is_row_event_delegation_used():
+            self.add_row_bindtag(widget)
+        else:
+            self.focus_set_grid_on_click_child_widget(widget)
+
+    def _is_row_event_delegation_used(self):
+        """Return True if row widgets share the row_bindtag bindings."""
+        return self.delegate_row_events
+
+    def get_handler(self, function):
+        """Return function wrapped by try_event, wrapping it once."""
+        handler = self._handlers.get(function)
+        if handler is None:
+            handler = self.try_event(function)
+            self._handlers[function] = handler
+        return handler
+
+    def get_handler_script(self, function):
+        """Return Tcl script calling function, creating Tcl command once.
+
+        The script is built like the one tkinter's Misc._bind builds, so it
+        depends on the tkinter internals Misc._substitute and
+        Misc._subst_format_str: test_datagrid checks these still exist.
+
+        """
+        handler = self._handler_scripts.get(function)
+        if handler is None:
+            frame = self.frame
+            funcid = frame.register(
+                self.get_handler(function), frame._substitute
+            )
+            handler = (
+                funcid,
+                "".join(
+                    (
+                        'if {"[',
+                        funcid,
+                        " ",
+                        frame._subst_format_str,
+                        ']" == "break"} break\n',
+                    )
+                ),
+            )
+            self._handler_scripts[function] = handler
+        return handler[1]
+
     def get_client_item_and_record_counts(self):
         """Return scrollbar slider positioning information."""
         items = self.get_client_item_count()
-        self.datasource.dbhome.start_read_only_transaction()
-        self.make_client_cursor()
+        self.start_client_read()
         try:
             if self.record_count is None:
-                self.record_count = self.cursor.count_records()
-            position = self.cursor.get_position_of_record(record=self.topkey)
+                self.record_count = self.get_record_count()
+            if self.position_estimator is None:
+                position = self.cursor.get_position_of_record(
+                    record=self.topkey
+                )
+            else:
+                position = self.estimate_position_of_record(self.topkey)
             return self.record_count, items, position
         finally:
-            self.close_client_cursor()
-            self.datasource.dbhome.end_read_only_transaction()
+            self.end_client_read()
+
+    def estimate_position_of_record(self, record):
+        """Return position of record estimated by position_estimator.
+
+        The exact position is returned if no estimate can be made, which
+        includes while stale checkpoints are rebuilt when idle.  A read
+        must be active.
+
+        """
+        if self._validate_position_estimator():
+            position = self.position_estimator.estimate_position(record)
+            if position is not None:
+                return position
+        return self.cursor.get_position_of_record(record=record)
+
+    def estimate_record_at_position(self, position):
+        """Return record at position found from position_estimator.
+
+        The cursor is moved to position from the nearest checkpoint.  None
+        is returned if the checkpoints are stale, while they are rebuilt
+        when idle.  A read must be active.
+
+        """
+        if not self._validate_position_estimator():
+            return None
+        record, offset = self.position_estimator.nearest_checkpoint(position)
+        if record is None or self.cursor.setat(record) is None:
+            return None
+        if offset < 0:
+            step = self.cursor.prev
+        else:
+            step = self.cursor.next
+        for i in range(abs(offset)):
+            key = step()
+            if key is None:
+                break
+            record = key
+        return record
 
     def get_client_item_count(self):
         """Return grid item count."""
@@ -708,9 +1152,8 @@ class DataGridBase(DataClient, Bindings):
     def get_spare_row_widget(self, widget_type=tkinter.Label):
         """Return a widget from the pool of discarded grid cell widgets.
 
-        This method is a hack to make mouse-drag resizing of the toplevel
-        widget of the application work on XP.  See comments at top of
-        datagrid.py
+        None is returned if the pool has no widgets of class widget_type.
+        See comments at top of datagrid.py
 
         """
         swt = self._spare_rows.get(widget_type)
@@ -718,6 +1161,26 @@ class DataGridBase(DataClient, Bindings):
             return swt.pop()
         return None
 
+    def _get_fresh_widget_configuration(self, widget):
+        """Return configuration of a new widget of same class as widget.
+
+        The configuration is noted on first use for each class so option
+        database settings for the grid apply when reusing widgets.
+
+        """
+        widget_class = widget.__class__
+        configuration = self._fresh_widget_configuration.get(widget_class)
+        if configuration is None:
+            probe = widget_class(master=widget.master)
+            configuration = {
+                option: value[-1]
+                for option, value in probe.configure().items()
+                if len(value) == 5 and option not in _CREATION_ONLY_OPTIONS
+            }
+            probe.destroy()
+            self._fresh_widget_configuration[widget_class] = configuration
+        return configuration
+
     def get_vertical_scrollbar(self):
         """Return the vertical scrollbar widget."""
         return self.vsbar
@@ -741,6 +1204,18 @@ class DataGridBase(DataClient, Bindings):
                 return self.selection[0]
         return None
 
+    def highlight_row_of_widget_on_pointer_enter(self, event=None):
+        """Highlight row containing widget when pointer enters widget."""
+        key = self._get_widget_row_key(event.widget)
+        if key in self.objects:
+            self.objects[key].highlight_row_on_pointer_enter(event)
+
+    def highlight_row_of_widget_on_pointer_leave(self, event=None):
+        """Remove highlight from row containing widget when pointer leaves."""
+        key = self._get_widget_row_key(event.widget)
+        if key in self.objects:
+            self.objects[key].highlight_row_on_pointer_leave(event)
+
     def is_load_direction_down(self):
         """Return current load direction."""
         return self.down
@@ -771,51 +1246,65 @@ class DataGridBase(DataClient, Bindings):
                 keys = sorted(oldkeys[:])
                 self.fill_view_from_record(keys[0])
                 self.set_selection(keys[0])
-                self.set_properties(oldselection)
-                self.set_properties(keys[0])
+                self.set_keys_properties((oldselection, keys[0]))
         else:
-            for key in [o for o in oldkeys if o not in newkeys]:
+            newkeyset = set(newkeys)
+            oldkeyset = set(oldkeys)
+            for key in [o for o in oldkeys if o not in newkeyset]:
                 if key in self.bookmarks:
                     self.bookmarks.remove(key)
-            if oldselection in newkeys:
+            if oldselection in newkeyset:
                 self.fill_view_from_item_index(0)
                 self.set_selection(oldselection)
             else:
-                keys = [n for n in newkeys if n not in oldkeys]
+                keys = [n for n in newkeys if n not in oldkeyset]
                 if len(keys):
                     keys.sort()
                     self.fill_view_from_record(keys[0])
                     self.set_selection(keys[0])
-                    self.set_properties(oldselection)
-                    self.set_properties(keys[0])
+                    self.set_keys_properties((oldselection, keys[0]))
                 else:
                     self.fill_view_from_top()
 
     def load_new_index(self):
-        """Clear selection and reload grid after changing index."""
+        """Clear selection and reload grid after changing index.
+
+        The reload is deferred if the grid is not viewable.
+
+        """
+        if self._defer_refresh(self.load_new_index):
+            return
         self.record_count = None
-        self.datasource.dbhome.start_read_only_transaction()
-        self.make_client_cursor()
+        self._row_heights.clear()
+        self.start_client_read()
         try:
             self.clear_grid_keys()
+            self.clear_readahead()
             self.fill_data_grid()
         finally:
-            self.close_client_cursor()
-            self.datasource.dbhome.end_read_only_transaction()
+            self.end_client_read()
 
     def load_new_partial_key(self, key):
         """Clear selection and reload grid after changing partial key."""
         self.record_count = None
         self.set_partial_key(key)
         # Presumably to avoid calling a subclass' load_new_index() method.
-        self.datasource.dbhome.start_read_only_transaction()
-        self.make_client_cursor()
+        self.start_client_read()
         try:
             self.clear_grid_keys()
             self.fill_data_grid()
         finally:
-            self.close_client_cursor()
-            self.datasource.dbhome.end_read_only_transaction()
+            self.end_client_read()
+
+    def load_object(self, key):
+        """Extend to leave pointer highlight of row to the grid's bindings.
+
+        The row does not bind <Enter> and <Leave> for it's widgets: the grid
+        binds them to handlers shared by all rows.
+
+        """
+        super().load_object(key)
+        self.objects[key].bind_pointer_crossing = False
 
     def make_header(self, specification):
         """Set header_maker as callback to create, and return, header widget.
@@ -847,37 +1336,79 @@ class DataGridBase(DataClient, Bindings):
         )
         for gridrow in newrow():
             for row in gridrow:
-                self.focus_set_grid_on_click_child_widget(row[0])
+                self._bind_row_widget(row[0])
+                if not self._is_row_event_delegation_used():
+                    self.bind_handler(
+                        row[0],
+                        "<Enter>",
+                        self.highlight_row_of_widget_on_pointer_enter,
+                    )
+                    self.bind_handler(
+                        row[0],
+                        "<Leave>",
+                        self.highlight_row_of_widget_on_pointer_leave,
+                    )
         return newrow
 
     def move_slider(self, event=None):
         """Move slider on release of button at end of motion."""
+        if self._slider_preview_pending is not None:
+            self.frame.after_cancel(self._slider_preview_pending)
+            self._slider_preview_pending = None
+        previewed = self._slider_preview_position
+        self._slider_preview_position = None
         if self.vsbar_number is None:
             return
         number = float(self.vsbar_number)
         self.vsbar_number = None
-        if number < 0:
-            number = 0
-        elif number > 1:
-            number = 1
-        if self.record_count is None:
-            self.make_client_cursor()
+        position = self._get_slider_position(number)
+        if position == previewed:
+            return
+        record_count = self.record_count
+        if self.position_estimator is not None:
+            self.start_client_read()
             try:
-                self.record_count = self.cursor.count_records()
+                key = self.estimate_record_at_position(position + 1)
             finally:
-                self.close_client_cursor()
-        record_count = self.record_count
-        position = int(record_count * number)
-        if position < 0:
-            position = 0
-        elif position >= record_count:
-            position = record_count - 1
+                self.end_client_read()
+            if key is not None:
+                self.fill_view(currentkey=key, exclude=False)
+                return
         if self.partial is not None:
             pass
         elif position > record_count // 2:
             position = position - record_count
         self.fill_view_from_position(position)
 
+    def preview_slider(self):
+        """Fill grid at slider position while slider is dragged.
+
+        Positions passed by set_yview since the previous fill are ignored
+        except the most recent.  Records found for positions are noted so
+        dragging back and forth does not repeat the search.
+
+        """
+        self._slider_preview_pending = None
+        if self.vsbar_number is None:
+            return
+        position = self._get_slider_position(float(self.vsbar_number))
+        if position == self._slider_preview_position:
+            return
+        source = (self.datasource, self.partial, self.record_count)
+        if source != self._slider_position_source:
+            self._slider_position_keys.clear()
+            self._slider_position_source = source
+        keys = self._slider_position_keys
+        if position in keys:
+            key = keys[position]
+        else:
+            key = self._get_record_at_slider_position(position)
+            if len(keys) >= SLIDER_POSITION_CACHE_SIZE:
+                keys.clear()
+            keys[position] = key
+        self._slider_preview_position = position
+        self.fill_view(currentkey=key, exclude=False)
+
     def encode_navigate_grid_key(self, key, encoding="utf8"):
         """Encode string for find nearest in database index.
 
@@ -907,27 +1438,31 @@ class DataGridBase(DataClient, Bindings):
 
     def move_to_row_in_grid(self, key):
         """Navigate grid to nearest row starting with key."""
-        self.datasource.dbhome.start_read_only_transaction()
-        cursor = self.datasource.get_cursor()
+        self.start_client_read()
         try:
-            cursor.set_partial_key(self.partial)
-            row = cursor.nearest(self.encode_navigate_grid_key(key))
+            row = self.cursor.nearest(self.encode_navigate_grid_key(key))
         finally:
-            cursor.close()
-            self.datasource.dbhome.end_read_only_transaction()
+            self.end_client_read()
         self.fill_view(currentkey=row, exclude=False)
 
     def on_configure_canvas(self, event=None):
-        """Populate grid for a <Configure> event (resize)."""
-        self.datasource.dbhome.start_read_only_transaction()
-        self.make_client_cursor()
+        """Populate grid for a <Configure> event (resize).
+
+        A refresh deferred while the grid was not viewable is done instead,
+        because it populates the grid too.
+
+        """
+        if self._deferred_refresh is not None:
+            if self.frame.winfo_viewable():
+                self.on_map_grid()
+                return
+        self.start_client_read()
         try:
             self.set_fill_parameters(currentkey=False)
             self.clear_grid_description()
             self.fill_data_grid()
         finally:
-            self.close_client_cursor()
-            self.datasource.dbhome.end_read_only_transaction()
+            self.end_client_read()
 
     def on_data_change(self, instance):
         """Refresh data control after database update for instance.
@@ -939,24 +1474,23 @@ class DataGridBase(DataClient, Bindings):
         Exact behaviour depends on use of set_data_source method.
 
         """
+        self.adjust_record_counts(instance)
+        self.discard_row_heights(instance)
         self.record_count = None
+        self._slider_position_keys.clear()
+        self._slider_preview_position = None
+        if self.position_estimator is not None:
+            if instance is None:
+                self.position_estimator.clear()
+            else:
+                self.position_estimator.note_change()
         self.refresh_cursor(instance)
+        if self._defer_refresh(self._refill_after_data_change):
+            # The refill does not know which keys the update removed.
+            self.discard_changed_keys(instance)
+            return
         if instance is None:
-            if len(self.keys) == 0:
-                self.fill_view_from_top()
-                return
-            # does self.fill_view_from_top() do this as well? if so use it!
-            self.datasource.dbhome.start_read_only_transaction()
-            record = self.make_client_cursor(self.keys[0])
-            try:
-                if record is None:
-                    record = self.cursor.nearest(self.keys[0][0])
-                self.set_fill_parameters(currentkey=record, exclude=False)
-                self.clear_client_keys()
-                self.fill_data_grid()
-            finally:
-                self.close_client_cursor()
-                self.datasource.dbhome.end_read_only_transaction()
+            self._refill_after_data_change()
             return
 
         oldkeys = instance.get_keys(self.datasource)
@@ -975,6 +1509,131 @@ class DataGridBase(DataClient, Bindings):
             newkeys = None  # newobject.get_keys(self.datasource)
         self.load_data_change(oldkeys, newkeys)
 
+    def on_data_changes(self, instances):
+        """Refresh data control once after database updates for instances.
+
+        Called instead of on_data_change for each instance when update
+        notifications are coalesced.  Record counts, the position
+        estimator, the cursor, bookmarks and selection, are adjusted for
+        each instance before the control is refreshed as close as possible
+        to existing display.
+
+        """
+        for instance in instances:
+            self.adjust_record_counts(instance)
+            self.discard_changed_keys(instance)
+            self.discard_row_heights(instance)
+            if self.position_estimator is not None:
+                self.position_estimator.note_change()
+            self.refresh_cursor(instance)
+        self.record_count = None
+        self._slider_position_keys.clear()
+        self._slider_preview_position = None
+        if self._defer_refresh(self._refill_after_data_change):
+            return
+        self._refill_after_data_change()
+
+    def on_map_grid(self, event=None):
+        """Do refresh deferred while grid was not viewable."""
+        if self._deferred_refresh is None:
+            return
+        if not self.frame.winfo_viewable():
+            return
+        refresh = self._deferred_refresh
+        self._deferred_refresh = None
+        self.dirty_since = None
+        refresh()
+
+    def on_destroy_grid(self, event=None):
+        """Delete row_bindtag bindings and Tcl commands shared by rows."""
+        self._unbind_row_bindtag()
+        self.delete_handler_scripts()
+
+    def on_pointer_enter_row_widget(self, event=None):
+        """Highlight row under pointer when pointer enters a row widget."""
+        key = self._get_row_key_at_y(event.y_root - self.data.winfo_rooty())
+        if key in self.objects:
+            self.objects[key].highlight_row_on_pointer_enter(event)
+
+    def on_pointer_leave_row_widget(self, event=None):
+        """Remove highlight from row when pointer leaves the row."""
+        key = self._get_widget_row_key(event.widget)
+        if key not in self.objects:
+            return
+        try:
+            widget = self.data.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            # Pointer is over a widget not created by tkinter.
+            widget = None
+        if self._get_widget_row_key(widget) != key:
+            self.objects[key].highlight_row_on_pointer_leave(event)
+
+    def _defer_refresh(self, refresh):
+        """Return True if refresh is deferred because grid is not viewable.
+
+        A deferred load_new_index is not replaced by a later deferred
+        refill because reloading the grid includes the refill.  A deferred
+        refresh is discarded, or done instead of refresh, if the grid is
+        viewable but on_map_grid has not been called yet.
+
+        """
+        if not self.defer_refresh_while_hidden:
+            return False
+        deferred = self._deferred_refresh
+        if self.frame.winfo_viewable():
+            if deferred is None:
+                return False
+            self._deferred_refresh = None
+            self.dirty_since = None
+            if deferred == self.load_new_index and refresh != deferred:
+                deferred()
+                return True
+            return False
+        if deferred is None:
+            self.dirty_since = time.monotonic()
+        if deferred != self.load_new_index:
+            self._deferred_refresh = refresh
+        return True
+
+    def on_data_change_out_of_view(self, instance):
+        """Adjust for database update for instance not changing display.
+
+        Called by DataSource.refresh_widgets instead of on_data_change when
+        none of the keys of instance are in the range of keys displayed.
+        Record counts, the position estimator, the cursor, bookmarks and
+        selection, are adjusted and the vertical scrollbar is set, but the
+        grid is not refilled.
+
+        """
+        self.adjust_record_counts(instance)
+        self.discard_changed_keys(instance)
+        self.discard_row_heights(instance)
+        self.record_count = None
+        self._slider_position_keys.clear()
+        self._slider_preview_position = None
+        if self.position_estimator is not None:
+            self.position_estimator.note_change()
+        self.refresh_cursor(instance)
+        self.frame.after_idle(
+            self.try_command(self.set_yscrollbar, self.frame)
+        )
+
+    def _refill_after_data_change(self):
+        """Fill grid from record nearest current top row after updates."""
+        if len(self.keys) == 0:
+            self.fill_view_from_top()
+            return
+        # does self.fill_view_from_top() do this as well? if so use it!
+        record = self.start_client_read(self.keys[0])
+        try:
+            if record is None:
+                record = self.cursor.nearest(self.keys[0][0])
+            self.set_fill_parameters(currentkey=record, exclude=False)
+            self.clear_client_keys()
+            self.fill_data_grid()
+        finally:
+            self.end_client_read()
+
     def reverse_add_record_direction(self):
         """Add records to opposite end of self.keys in future."""
         if self.down:
@@ -991,11 +1650,78 @@ class DataGridBase(DataClient, Bindings):
 
     def scroll_grid_down_one_line(self):
         """Scroll grid retaining displayed versions of existing rows."""
-        self.fill_view_from_top()
+        if not self._scroll_grid_one_line(down=True):
+            self.fill_view_from_top()
 
     def scroll_grid_up_one_line(self):
         """Scroll grid retaining displayed versions of existing rows."""
-        self.fill_view(currentkey=self.bottomkey, down=False)
+        if not self._scroll_grid_one_line(down=False):
+            self.fill_view(currentkey=self.bottomkey, down=False)
+
+    def _scroll_grid_one_line(self, down=True):
+        """Return True if grid is scrolled one line by shifting existing rows.
+
+        down - True adds the record after bottom row and removes top row,
+        False adds the record before top row and removes bottom row.
+
+        The existing rows keep their grid rows: only the new row is
+        gridded.  False is returned, and the grid is not changed, if there
+        is no record to add or the new row is not the same height as the
+        removed row: the caller should fill the grid to scroll it in these
+        cases.  The row heights noted by _get_key_row_height are used.
+
+        """
+        if len(self.keys) < 2:
+            return False
+        self.start_client_read()
+        try:
+            if down:
+                self.currentkey = self.cursor.setat(self.bottomkey)
+            else:
+                self.currentkey = self.cursor.setat(self.topkey)
+            if not self.currentkey:
+                return False
+            topkey, bottomkey = self.topkey, self.bottomkey
+            self.down = down
+            key = self._add_record_to_view()
+            if key is None:
+                self.topkey, self.bottomkey = topkey, bottomkey
+                return False
+            record = self.set_row(key)
+            row = self.make_row(record)
+            if down:
+                oldkey = self.keys[0]
+            else:
+                oldkey = self.keys[-1]
+            oldgridrows = self.gridrows_for_key[oldkey]
+            if self._get_key_row_height(
+                key, record, row
+            ) != self._get_key_row_height(
+                oldkey, self.set_row(oldkey), oldgridrows
+            ):
+                self.add_row_to_spare_pool(row)
+                self.keys.remove(key)
+                del self.objects[key]
+                self.topkey, self.bottomkey = topkey, bottomkey
+                return False
+            old_span = len(oldgridrows())
+            for gridrow in oldgridrows():
+                for widget in gridrow:
+                    self._widget_keys.pop(widget[0], None)
+            self.keys.remove(oldkey)
+            oldrow = self.objects.pop(oldkey)
+            self.add_row_to_spare_pool(self.gridrows_for_key.pop(oldkey))
+            if self.readahead:
+                self.readahead_objects[oldkey] = oldrow
+            self.gridrows_for_key[key] = row
+            self.topkey = self.keys[0]
+            self.bottomkey = self.keys[-1]
+            self._shift_data_rows(key, old_span, down)
+            self._set_scrollregion()
+            self._schedule_fill_readahead()
+            return True
+        finally:
+            self.end_client_read()
 
     def select_cycle_down(self):
         """Select row in current selection by next key."""
@@ -1008,8 +1734,7 @@ class DataGridBase(DataClient, Bindings):
         selected = self.selection[0]
         if selected not in self.keys:
             self.fill_view_from_record(selected)
-        self.set_properties(oldselection)
-        self.set_properties(selected)
+        self.set_keys_properties((oldselection, selected))
 
     def select_cycle_up(self):
         """Select row in current selection by previous key."""
@@ -1022,8 +1747,7 @@ class DataGridBase(DataClient, Bindings):
         selected = self.selection[0]
         if selected not in self.keys:
             self.fill_view_to_record(selected)
-        self.set_properties(oldselection)
-        self.set_properties(selected)
+        self.set_keys_properties((oldselection, selected))
 
     def select_down(self):
         """Select row after current selection."""
@@ -1043,8 +1767,7 @@ class DataGridBase(DataClient, Bindings):
             return
         else:
             self.set_selection(self.keys[self.keys.index(oldselection) + 1])
-        self.set_properties(oldselection)
-        self.set_properties(self.selection[0])
+        self.set_keys_properties((oldselection, self.selection[0]))
 
     def select_up(self):
         """Select row before current selection."""
@@ -1064,8 +1787,7 @@ class DataGridBase(DataClient, Bindings):
             return
         else:
             self.set_selection(self.keys[self.keys.index(oldselection) - 1])
-        self.set_properties(oldselection)
-        self.set_properties(self.selection[0])
+        self.set_keys_properties((oldselection, self.selection[0]))
 
     def set_data_header(self, header=None):
         """Set current dataheader generator.
@@ -1139,8 +1861,83 @@ class DataGridBase(DataClient, Bindings):
         This method does not refresh the displayed data from the database.
 
         """
-        for key in self.keys:
-            self.set_properties(key)
+        self.set_keys_properties(self.keys)
+
+    def set_keys_properties(self, keys):
+        """Set row properties for all keys in keys which are in grid.
+
+        The state of each row is decided before any widgets are changed and
+        the pointer position is found once.  Rows using the DataRow methods
+        to set colours are not changed if already painted in the colour for
+        their state, and their changes are sent to Tk in one script.  Rows
+        overriding the set_background_<state> method always get a call.
+
+        Subclasses which override set_properties, or the
+        set_row_under_pointer_background method it calls, get one
+        set_properties call per key instead.
+
+        """
+        displayed = self.keys
+        keys = [key for key in dict.fromkeys(keys) if key in displayed]
+        if not keys:
+            return
+        if not self._uses_default_set_properties():
+            for key in keys:
+                self.set_properties(key)
+            return
+        if self.selection:
+            selection = self.selection[0]
+            last_selection = self.selection[-1]
+        else:
+            selection = None
+            last_selection = None
+        bookmarks = self.bookmarks
+        key_under_pointer = self._get_key_under_pointer(keys)
+        script = []
+        for key in keys:
+            if key == selection:
+                if key in bookmarks:
+                    state = "bookmarked_selection"
+                elif key != last_selection:
+                    state = "selection_cycle"
+                else:
+                    state = "selection"
+            elif key in bookmarks:
+                state = "bookmark"
+            else:
+                state = "normal"
+            background = _ROW_STATE_BACKGROUNDS[state]
+            if key == key_under_pointer:
+                paint = ROW_UNDER_POINTER_COLOUR
+            else:
+                paint = background
+            row = self.objects[key]
+            if not _uses_datarow_backgrounds(row, state):
+                # The overriding method may not note the colour it sets.
+                row.set_painted_background(None)
+                widgets = self.get_row_widgets(key)
+                getattr(row, "set_background_" + state)(widgets)
+                if key == key_under_pointer:
+                    row.set_background_row_under_pointer(widgets)
+                continue
+            row.set_current_row_background(background)
+            if row.is_background_painted(paint):
+                continue
+            widgets = self.get_row_widgets(key)
+            row.set_painted_background(paint)
+            for widget in widgets:
+                script.append(self._get_background_script(widget[0], paint))
+        if script:
+            self.data.tk.eval("\n".join(script))
+
+    def _uses_default_set_properties(self):
+        """Return True if set_properties is not overridden in subclass."""
+        gridclass = type(self)
+        return (
+            gridclass.set_properties is DataGridBase.set_properties
+            and gridclass.set_row_under_pointer_background
+            is DataGridBase.set_row_under_pointer_background
+        )
 
     def set_properties(self, key, dodefaultaction=True):
         """Set row properties and return True if settings for key are done.
@@ -1283,7 +2080,35 @@ class DataGridBase(DataClient, Bindings):
 
         if self.datasource is None:
             return
-        count, items, position = self.get_client_item_and_record_counts()
+        self._set_yscrollbar_slider(*self.get_client_item_and_record_counts())
+        if self.position_estimator is not None:
+            if self.position_estimator.refine:
+                if self._refine_yscrollbar_pending is None:
+                    self._refine_yscrollbar_pending = self.frame.after_idle(
+                        self.try_command(self.refine_yscrollbar, self.frame)
+                    )
+
+    def refine_yscrollbar(self):
+        """Set Y scrollbar using exact position of top record in file.
+
+        Used when idle to correct a slider placed by position_estimator.
+
+        """
+        self._refine_yscrollbar_pending = None
+        if self.datasource is None:
+            return
+        items = self.get_client_item_count()
+        self.start_client_read()
+        try:
+            if self.record_count is None:
+                self.record_count = self.get_record_count()
+            position = self.cursor.get_position_of_record(record=self.topkey)
+        finally:
+            self.end_client_read()
+        self._set_yscrollbar_slider(self.record_count, items, position)
+
+    def _set_yscrollbar_slider(self, count, items, position):
+        """Set Y scrollbar slider for items rows from position in count."""
         # There may be not enough records to fill the widget; and position
         # is counted from 1 while slider position calculation needs a
         # position counted from 0 (zero).
@@ -1307,7 +2132,8 @@ class DataGridBase(DataClient, Bindings):
         """Adjust datagrid on vertical scrollbar action.
 
         moveto disabled in Berkeley DB because it takes too long to
-        maintain reliable record counts.
+        maintain reliable record counts.  Setting position_estimator makes
+        moveto usable by estimating positions rather than counting them.
 
         """
         if self.get_client_item_count():
@@ -1329,19 +2155,23 @@ class DataGridBase(DataClient, Bindings):
                         self.fill_view_to_item_index(-1)
             elif scroll == "moveto":
                 self.vsbar_number = number
-                # movement done by move_slider() method on button release.
+                # movement done by move_slider() method on button release,
+                # and by preview_slider() method while dragging if enabled.
+                if self.slider_preview_interval is None:
+                    return
+                if self._slider_preview_pending is None:
+                    self._slider_preview_pending = self.frame.after(
+                        self.slider_preview_interval,
+                        self.try_command(self.preview_slider, self.frame),
+                    )
 
     def select_row_by_click(self, event=None):
         """Select row clicked by button-3 (right)."""
         self.pointer_popup_selection = None
-        event_wigdet = event.widget
-        for k, row in self.gridrows_for_key.items():
-            for item in row():
-                for widget, i in item:
-                    if widget == event_wigdet:
-                        self.pointer_popup_selection = k
-                        self.show_popup_menu()
-                        return
+        key = self._get_widget_row_key(event.widget)
+        if key is not None:
+            self.pointer_popup_selection = key
+            self.show_popup_menu()
 
     def show_popup_menu(self):
         """Show the popup menu for the grid over a row.
@@ -1414,8 +2244,7 @@ class DataGridBase(DataClient, Bindings):
             oldselection = None
         self.set_selection(self.pointer_popup_selection)
         self.pointer_popup_selection = None
-        self.set_properties(oldselection)
-        self.set_properties(self.selection[0])
+        self.set_keys_properties((oldselection, self.selection[0]))
 
     def exit_popup(self, event=None):
         """Reset the colour of popup row to the current normal colour."""
@@ -1453,15 +2282,18 @@ class DataGridBase(DataClient, Bindings):
 
     def _fill_down(self, rows, cheight):
         """Put rows in grid until added row is not completely visible."""
+        if self.fixed_row_height:
+            return self._fill_fixed_height(rows, cheight, True)
         # should setting self.topkey and self.bottomkey be job of caller?
+        height = None
         while True:
             if cheight > self.gcanvas.winfo_height():
+                self.view_is_full = True
                 if len(rows) > 1:
-                    cheight -= self._get_row_reqheight(rows[-1]())
-                    for k in rows.pop()():
-                        for j in k:
-                            j[0].grid_forget()
-                            self.add_widget_to_spare_pool(j[0])
+                    if height is None:
+                        height = self._get_row_reqheight(rows[-1]())
+                    cheight -= height
+                    self.add_row_to_spare_pool(rows.pop())
                     try:
                         del self.objects[self.keys[-1]]
                         del self.gridrows_for_key[self.keys[-1]]
@@ -1477,8 +2309,13 @@ class DataGridBase(DataClient, Bindings):
                 key = self._add_record_to_view()
             if key is None:
                 break
-            rows.append(self.make_row(self.set_row(key)))
-            cheight += self._get_row_reqheight(rows[-1]())
+            record = self.set_row(key)
+            if self._is_noted_row_too_high(key, record, rows, cheight):
+                self._discard_unbuilt_row_key(key, True)
+                break
+            rows.append(self.make_row(record))
+            height = self._get_key_row_height(key, record, rows[-1])
+            cheight += height
             self.gridrows_for_key[key] = rows[-1]
 
         try:
@@ -1489,15 +2326,18 @@ class DataGridBase(DataClient, Bindings):
 
     def _fill_up(self, rows, cheight):
         """Put rows in grid until added row is not completely visible."""
+        if self.fixed_row_height:
+            return self._fill_fixed_height(rows, cheight, False)
         # should setting self.topkey and self.bottomkey be job of caller?
+        height = None
         while True:
             if cheight > self.gcanvas.winfo_height():
+                self.view_is_full = True
                 if len(rows) > 1:
-                    cheight -= self._get_row_reqheight(rows[-1]())
-                    for k in rows.pop(0)():
-                        for j in k:
-                            j[0].grid_forget()
-                            self.add_widget_to_spare_pool(j[0])
+                    if height is None:
+                        height = self._get_row_reqheight(rows[0]())
+                    cheight -= height
+                    self.add_row_to_spare_pool(rows.pop(0))
                     try:
                         del self.objects[self.keys[0]]
                         del self.gridrows_for_key[self.keys[0]]
@@ -1513,8 +2353,13 @@ class DataGridBase(DataClient, Bindings):
                 key = self._add_record_to_view()
             if key is None:
                 break
-            rows.insert(0, self.make_row(self.set_row(key)))
-            cheight += self._get_row_reqheight(rows[-1]())
+            record = self.set_row(key)
+            if self._is_noted_row_too_high(key, record, rows, cheight):
+                self._discard_unbuilt_row_key(key, False)
+                break
+            rows.insert(0, self.make_row(record))
+            height = self._get_key_row_height(key, record, rows[0])
+            cheight += height
             self.gridrows_for_key[key] = rows[0]
 
         try:
@@ -1523,6 +2368,334 @@ class DataGridBase(DataClient, Bindings):
             pass
         return cheight
 
+    def _fill_fixed_height(self, rows, cheight, down):
+        """Put rows which are completely visible in grid and return height.
+
+        The first row is measured, unless a row of the same class and font
+        has been measured already, and the keys for the number of rows of
+        that height which fit are fetched together before making the rows.
+
+        """
+        canvas_height = self.gcanvas.winfo_height()
+        height = None
+        wanted = 1
+        while wanted > 0:
+            keys = []
+            while len(keys) < wanted:
+                key = self._get_next_fill_key(len(rows) + len(keys), down)
+                if key is None:
+                    break
+                keys.append(key)
+            for key in keys:
+                record = self.set_row(key)
+                row = self.make_row(record)
+                if down:
+                    rows.append(row)
+                else:
+                    rows.insert(0, row)
+                self.gridrows_for_key[key] = row
+                if height is None:
+                    height = self._get_fixed_row_height(row, record)
+            if keys:
+                cheight += height * len(keys)
+            if cheight > canvas_height:
+                self.view_is_full = True
+                if keys and len(rows) > 1:
+                    cheight -= height
+                    if down:
+                        self.add_row_to_spare_pool(rows.pop())
+                        del self.objects[self.keys[-1]]
+                        del self.gridrows_for_key[self.keys[-1]]
+                        del self.keys[-1]
+                        self.bottomkey = self.keys[-1]
+                    else:
+                        self.add_row_to_spare_pool(rows.pop(0))
+                        del self.objects[self.keys[0]]
+                        del self.gridrows_for_key[self.keys[0]]
+                        del self.keys[0]
+                        self.topkey = self.keys[0]
+                break
+            if len(keys) < wanted:
+                break
+            if height > 0:
+                wanted = (canvas_height - cheight) // height
+            else:
+                wanted = 1
+            if wanted < 1:
+                self.view_is_full = True
+        if self.keys:
+            if down:
+                self.topkey = self.keys[0]
+            else:
+                self.bottomkey = self.keys[-1]
+        return cheight
+
+    def _get_fixed_row_height(self, row, record):
+        """Return height of rows of same class and font as row.
+
+        The height is measured if no row of the class and font has been
+        measured since clear_fixed_row_heights was called.
+
+        """
+        key = (row.__class__, str(record[2].get("font")))
+        height = self._fixed_row_heights.get(key)
+        if height is None:
+            height = self._get_row_reqheight(row())
+            self._fixed_row_heights[key] = height
+        return height
+
+    def _get_key_row_height(self, key, record, row):
+        """Return height of row for key, measuring row if not noted."""
+        heights = self._row_heights.get(key)
+        if heights is None:
+            if len(self._row_heights) >= ROW_HEIGHT_CACHE_SIZE:
+                self._row_heights.clear()
+            heights = self._row_heights[key] = dict()
+        specification = self._get_row_height_specification(key, record)
+        height = heights.get(specification)
+        if height is None:
+            height = self._get_row_reqheight(row())
+            heights[specification] = height
+        return height
+
+    def _get_row_height_specification(self, key, record):
+        """Return (row class, font) for row displaying key from record."""
+        return (self.objects[key].__class__, str(record[2].get("font")))
+
+    def _is_noted_row_too_high(self, key, record, rows, cheight):
+        """Return True if noted height of row for key will not fit in grid.
+
+        False is returned if rows is empty, because at least one row is
+        displayed, or if the height of the row for key is not noted.
+
+        """
+        if not rows:
+            return False
+        heights = self._row_heights.get(key)
+        if heights is None:
+            return False
+        height = heights.get(self._get_row_height_specification(key, record))
+        if height is None:
+            return False
+        if cheight + height <= self.gcanvas.winfo_height():
+            return False
+        self.view_is_full = True
+        return True
+
+    def _discard_unbuilt_row_key(self, key, down):
+        """Remove key, whose row will not fit, if added for this fill.
+
+        Keys displayed before the fill are left for fill_data_grid to
+        remove with the other keys not displayed.
+
+        """
+        if key in self.gridrows_for_key:
+            return
+        del self.objects[key]
+        if down:
+            del self.keys[-1]
+            self.bottomkey = self.keys[-1]
+        else:
+            del self.keys[0]
+            self.topkey = self.keys[0]
+
+    def _get_next_fill_key(self, index, down):
+        """Return key for row index from top, or bottom, of rows in grid.
+
+        Keys already in self.keys are used before reading the cursor.
+
+        """
+        if len(self.keys) > index:
+            if down:
+                key = self.bottomkey = self.keys[index]
+            else:
+                key = self.topkey = self.keys[-index - 1]
+            return key
+        return self._add_record_to_view()
+
+    def _schedule_fill_readahead(self):
+        """Start readahead fill, done in steps when idle, if readahead set.
+
+        A fill in progress is replaced by one for the current grid rows.
+
+        """
+        if not self.readahead:
+            return
+        self.start_readahead()
+        if self._fill_readahead_pending is None:
+            self._fill_readahead_pending = self.frame.after_idle(
+                self.try_command(self._fill_readahead_when_idle, self.frame)
+            )
+
+    def _fill_readahead_when_idle(self):
+        """Decode a few records either side of grid rows for scrolling.
+
+        The next step is scheduled when idle again so events are handled
+        between steps.
+
+        """
+        self._fill_readahead_pending = None
+        if not self.continue_readahead():
+            self._fill_readahead_pending = self.frame.after_idle(
+                self.try_command(self._fill_readahead_when_idle, self.frame)
+            )
+
+    def _get_slider_position(self, number):
+        """Return position, counted from 0, of record at slider number."""
+        if number < 0:
+            number = 0
+        elif number > 1:
+            number = 1
+        if self.record_count is None:
+            self.start_client_read()
+            try:
+                self.record_count = self.get_record_count()
+            finally:
+                self.end_client_read()
+        record_count = self.record_count
+        position = int(record_count * number)
+        if position < 0:
+            position = 0
+        elif position >= record_count:
+            position = record_count - 1
+        return position
+
+    def _get_record_at_slider_position(self, position):
+        """Return record at position, counted from 0, found by cursor.
+
+        The position_estimator is used if set.  Otherwise the cursor
+        counts from the nearer end of the records if not restricted to a
+        partial key.
+
+        """
+        self.start_client_read()
+        try:
+            if self.position_estimator is not None:
+                key = self.estimate_record_at_position(position + 1)
+                if key is not None:
+                    return key
+            if self.partial is None and position > self.record_count // 2:
+                position -= self.record_count
+            return self.cursor.get_record_at_position(position)
+        finally:
+            self.end_client_read()
+
+    def _validate_position_estimator(self):
+        """Return True if position_estimator checkpoints are usable.
+
+        Otherwise schedule a rebuild of the checkpoints when idle and
+        return False.
+
+        """
+        if self.position_estimator.is_valid((self.datasource, self.partial)):
+            return True
+        if self._build_position_estimator_pending is None:
+            self._build_position_estimator_pending = self.frame.after_idle(
+                self.try_command(
+                    self._build_position_estimator_when_idle, self.frame
+                )
+            )
+        return False
+
+    def _build_position_estimator_when_idle(self):
+        """Take the next position_estimator checkpoints using new cursor.
+
+        The estimator is given a cursor of it's own so the position of the
+        grid's cursor is not disturbed.  Another call is scheduled when idle
+        until all the checkpoints are taken, so the walk through every
+        record does not block the user interface.
+
+        """
+        self._build_position_estimator_pending = None
+        estimator = self.position_estimator
+        if estimator is None or self.datasource is None:
+            return
+        source = (self.datasource, self.partial)
+        if estimator.is_valid(source):
+            return
+        self.start_client_read()
+        try:
+            cursor = self.datasource.get_cursor()
+            try:
+                cursor.set_partial_key(self.partial)
+                if not estimator.is_building(source):
+                    estimator.start_build(cursor, source)
+                if estimator.continue_build(cursor):
+                    return
+            finally:
+                cursor.close()
+        finally:
+            self.end_client_read()
+        self._build_position_estimator_pending = self.frame.after_idle(
+            self.try_command(
+                self._build_position_estimator_when_idle, self.frame
+            )
+        )
+
+    def _get_background_script(self, widget, background):
+        """Return Tcl command to set background colour of row widget."""
+        return "".join(
+            (str(widget), " configure -background {", background, "}")
+        )
+
+    def _get_gridded_widgets(self):
+        """Return widgets gridded in the data frame."""
+        return self.data.grid_slaves()
+
+    def _get_scrollregion_width(self):
+        """Return width of header and data rows for canvas scrollregion."""
+        return self.data.winfo_reqwidth()
+
+    def _get_key_under_pointer(self, keys):
+        """Return key in keys of row under pointer or None."""
+        try:
+            widget = self.data.winfo_containing(*self.get_pointerxy())
+        except KeyError:
+            # Pointer is over a widget not created by tkinter.
+            return None
+        if widget is None:
+            return None
+        for key in keys:
+            for row_widget in self.get_row_widgets(key):
+                if row_widget[0] is widget:
+                    return key
+        return None
+
+    def _get_widget_row_key(self, widget):
+        """Return key of row containing widget or None."""
+        widget_keys = self._widget_keys
+        while widget is not None and widget is not self.data:
+            if widget in widget_keys:
+                return widget_keys[widget]
+            widget = getattr(widget, "master", None)
+        return None
+
+    def _get_row_bands(self):
+        """Return (tops, bottoms, keys) of data rows in the data frame."""
+        if self._row_bands is None:
+            tops = []
+            bottoms = []
+            keys = []
+            for key in self.keys:
+                gridrows = self.gridrows_for_key[key]()
+                if not gridrows or not gridrows[0]:
+                    continue
+                first = gridrows[0][0][0]
+                last = gridrows[-1][0][0]
+                tops.append(first.winfo_y())
+                bottoms.append(last.winfo_y() + last.winfo_height())
+                keys.append(key)
+            self._row_bands = tops, bottoms, keys
+        return self._row_bands
+
+    def _get_row_key_at_y(self, y):
+        """Return key of row at y in the data frame or None."""
+        tops, bottoms, keys = self._get_row_bands()
+        index = bisect_right(tops, y) - 1
+        if index < 0 or y >= bottoms[index]:
+            return None
+        return keys[index]
+
     def _get_row_reqheight(self, rows):
         """Return sum of maximum reqheight of widgets in each row in rows."""
         return sum([max([w[0].winfo_reqheight() for w in r]) for r in rows])
@@ -1921,6 +3094,7 @@ class DataGrid(DataGridReadOnly):
         launch_... methods are extended.
 
         """
+        self.close_client_read()
         # need to make dialog modal if requested {dialog.grab_set() sequence}.
         dialog = tkinter.Toplevel(master=self.parent)
         dialog.wm_title(title)
@@ -1945,6 +3119,7 @@ class DataGrid(DataGridReadOnly):
         launch_... methods are extended.
 
         """
+        self.close_client_read()
         # need to make dialog modal if requested {dialog.grab_set() sequence}.
         dialog = tkinter.Toplevel(master=self.parent)
         dialog.wm_title(title)
@@ -2076,3 +3251,15 @@ class DataGrid(DataGridReadOnly):
         self.create_edit_dialog(
             instance, newobject, None, False, modal, title="New Record"
         )
+
+
+def _uses_datarow_backgrounds(row, state):
+    """Return True if row sets colours for state with DataRow methods."""
+    rowclass = type(row)
+    name = "set_background_" + state
+    return (
+        getattr(rowclass, "set_background", None) is DataRow.set_background
+        and getattr(rowclass, name, None) is getattr(DataRow, name)
+        and getattr(rowclass, "set_background_row_under_pointer", None)
+        is DataRow.set_background_row_under_pointer
+    )
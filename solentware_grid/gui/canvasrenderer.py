@@ -0,0 +1,483 @@
+# canvasrenderer.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Draw the cells of a datagrid as items on the grid's canvas.
+
+DataGridBase displays each cell in a Label widget gridded in a Frame on
+it's canvas.  Every cell is a Tk widget with it's own bindings, and Tk
+geometry management is done for each page of rows.
+
+The CanvasRenderer mixin draws each cell as a rectangle item and a text
+item on the canvas instead.  The CanvasCell class provides the methods
+of Label widgets used by DataRow, DataHeader, and DataGridBase, so row
+classes which display text in Label widgets, by the DataRow grid_row and
+make_row_widgets methods, are displayed without change.  Cells are kept
+in a pool and reused, so paging changes the text and colour of existing
+items.
+
+Row classes which use other widgets, Text widgets for example, or which
+call widget methods other than configure and cget, are not supported.
+
+Typical use is
+class FooGrid(CanvasRenderer, solentware_grid.datagrid.DataGrid):
+    ...
+
+"""
+
+import tkinter
+import tkinter.font
+
+from .datarow import NULL_COLOUR
+
+# Label option defaults used to calculate the size of a cell.
+_LABEL_DEFAULTS = {
+    "anchor": tkinter.CENTER,
+    "borderwidth": 1,
+    "font": "TkDefaultFont",
+    "foreground": "black",
+    "justify": tkinter.CENTER,
+    "padx": 1,
+    "pady": 1,
+    "width": 0,
+}
+
+# Abbreviations allowed for Label options.
+_OPTION_SYNONYMS = {
+    "bd": "borderwidth",
+    "bg": "background",
+    "fg": "foreground",
+}
+
+# Options which change the size of a cell.
+_SIZE_OPTIONS = frozenset(
+    ("text", "font", "borderwidth", "padx", "pady", "width")
+)
+
+# Number of cells kept for reuse by default.
+CELL_POOL_SIZE = 1000
+
+
+class CanvasCell:
+    """Grid cell drawn as a rectangle and a text item on a canvas.
+
+    renderer - the CanvasRenderer instance which lays out the cell.
+
+    The rectangle item has the cell's background colour and receives
+    events for the cell: the text item is disabled so the rectangle is the
+    current item when the pointer is over the cell.
+
+    """
+
+    def __init__(self, renderer):
+        """Create hidden rectangle and text items for the cell."""
+        super().__init__()
+        self.renderer = renderer
+        canvas = renderer.gcanvas
+        self.canvas = canvas
+        self.tag = "".join(("cell", str(id(self))))
+        self.rectangle = canvas.create_rectangle(
+            0,
+            0,
+            0,
+            0,
+            fill=NULL_COLOUR,
+            outline="",
+            state=tkinter.HIDDEN,
+            tags=(self.tag,),
+        )
+        self.text = canvas.create_text(
+            0,
+            0,
+            font=_LABEL_DEFAULTS["font"],
+            state=tkinter.HIDDEN,
+            tags=(self.tag,),
+        )
+        self.options = {}
+        self.grid_info = None
+        self.box = (0, 0, 0, 0)
+        self._reqsize = None
+        # {sequence: (func, funcid), ...} for bindings not added to others.
+        self._bound = {}
+
+    def bind(self, sequence=None, func=None, add=None):
+        """Bind sequence to func for the cell's items and return identifier.
+
+        The widget attribute of events given to func is set to the cell.
+
+        The existing binding is kept if sequence is bound to func already,
+        so the cell does not create a Tcl command each time the grid binds
+        sequence again.
+
+        """
+        if not add:
+            bound = self._bound.pop(sequence, None)
+            if bound is not None:
+                if bound[0] is func:
+                    self._bound[sequence] = bound
+                    return bound[1]
+                self.canvas.tag_unbind(self.tag, sequence, bound[1])
+
+        def cell_event(event):
+            event.widget = self
+            return func(event)
+
+        funcid = self.canvas.tag_bind(self.tag, sequence, cell_event, add)
+        if not add:
+            self._bound[sequence] = (func, funcid)
+        return funcid
+
+    def unbind(self, sequence, funcid=None):
+        """Remove binding of sequence identified by funcid."""
+        bound = self._bound.get(sequence)
+        if bound is not None and bound[1] == funcid:
+            del self._bound[sequence]
+        self.canvas.tag_unbind(self.tag, sequence, funcid)
+
+    def cget(self, key):
+        """Return value of option key."""
+        key = _OPTION_SYNONYMS.get(key, key)
+        if key in self.options:
+            return self.options[key]
+        if key == "background":
+            return NULL_COLOUR
+        return _LABEL_DEFAULTS.get(key, "")
+
+    def configure(self, cnf=None, **kw):
+        """Set options for the cell like tkinter.Label.configure."""
+        if cnf:
+            kw = dict(cnf, **kw)
+        options = self.options
+        itemconfigure = self.canvas.itemconfigure
+        for key, value in kw.items():
+            key = _OPTION_SYNONYMS.get(key, key)
+            options[key] = value
+            if key in _SIZE_OPTIONS:
+                self._reqsize = None
+            if key == "background":
+                itemconfigure(self.rectangle, fill=value)
+            elif key == "foreground":
+                itemconfigure(self.text, fill=value)
+            elif key == "font":
+                itemconfigure(self.text, font=value)
+            elif key == "justify":
+                itemconfigure(self.text, justify=value)
+
+    config = configure
+
+    def destroy(self):
+        """Delete the cell's items and bindings."""
+        for sequence, bound in self._bound.items():
+            self.canvas.tag_unbind(self.tag, sequence, bound[1])
+        self._bound.clear()
+        self.canvas.delete(self.tag)
+        self.grid_info = None
+
+    def grid_configure(self, cnf=None, **kw):
+        """Note grid options for cell for next layout of grid."""
+        if cnf:
+            kw = dict(cnf, **kw)
+        if self.grid_info is None:
+            self.grid_info = kw
+        else:
+            self.grid_info.update(kw)
+        self.renderer.note_gridded_cell(self)
+
+    def grid_forget(self):
+        """Hide cell and remove it from layout of grid."""
+        self.grid_info = None
+        self.canvas.itemconfigure(self.tag, state=tkinter.HIDDEN)
+        self.renderer.note_forgotten_cell(self)
+
+    def reset(self):
+        """Hide cell and set options to those of a new cell."""
+        self.grid_info = None
+        self.options.clear()
+        self._reqsize = None
+        canvas = self.canvas
+        canvas.itemconfigure(self.tag, state=tkinter.HIDDEN)
+        canvas.itemconfigure(self.rectangle, fill=NULL_COLOUR)
+        canvas.itemconfigure(
+            self.text,
+            text="",
+            fill=_LABEL_DEFAULTS["foreground"],
+            font=_LABEL_DEFAULTS["font"],
+            justify=_LABEL_DEFAULTS["justify"],
+        )
+
+    def place_cell(self, x, y, width, height):
+        """Draw the cell in box with top left corner at x, y."""
+        canvas = self.canvas
+        self.box = (x, y, width, height)
+        canvas.coords(self.rectangle, x, y, x + width, y + height)
+        anchor = str(self.cget("anchor"))
+        padx, pady = self._get_padding()
+        if "w" in anchor:
+            textx = x + padx
+        elif "e" in anchor:
+            textx = x + width - padx
+        else:
+            textx = x + width // 2
+        if "n" in anchor:
+            texty = y + pady
+        elif "s" in anchor:
+            texty = y + height - pady
+        else:
+            texty = y + height // 2
+        text = self.renderer.clip_text(
+            str(self.cget("text")), self.cget("font"), width - 2 * padx
+        )
+        canvas.coords(self.text, textx, texty)
+        canvas.itemconfigure(self.text, text=text, anchor=anchor)
+        canvas.itemconfigure(self.rectangle, state=tkinter.NORMAL)
+        canvas.itemconfigure(self.text, state=tkinter.DISABLED)
+
+    def _get_padding(self):
+        """Return horizontal and vertical padding, including border."""
+        pixels = self.canvas.winfo_pixels
+        border = pixels(self.cget("borderwidth"))
+        return (
+            pixels(self.cget("padx")) + border,
+            pixels(self.cget("pady")) + border,
+        )
+
+    def _get_reqsize(self):
+        """Return width and height the cell needs to show it's text."""
+        if self._reqsize is None:
+            font = self.renderer.get_font(self.cget("font"))
+            lines = str(self.cget("text")).split("\n")
+            padx, pady = self._get_padding()
+            width = int(self.cget("width") or 0)
+            if width:
+                width *= font.measure("0")
+            else:
+                width = max(font.measure(line) for line in lines)
+            self._reqsize = (
+                width + 2 * padx,
+                font.metrics("linespace") * len(lines) + 2 * pady,
+            )
+        return self._reqsize
+
+    def winfo_children(self):
+        """Return empty list: a cell has no child widgets."""
+        return []
+
+    def winfo_height(self):
+        """Return height of cell in last layout."""
+        return self.box[3]
+
+    def winfo_reqheight(self):
+        """Return height the cell needs to show it's text."""
+        return self._get_reqsize()[1]
+
+    def winfo_reqwidth(self):
+        """Return width the cell needs to show it's text."""
+        return self._get_reqsize()[0]
+
+    def winfo_pointerxy(self):
+        """Return x and y coordinates of pointer on the screen."""
+        return self.canvas.winfo_pointerxy()
+
+    def winfo_rootx(self):
+        """Return x-coordinate of cell's left edge on the screen."""
+        canvas = self.canvas
+        return canvas.winfo_rootx() + int(self.box[0] - canvas.canvasx(0))
+
+    def winfo_rooty(self):
+        """Return y-coordinate of cell's top edge on the screen."""
+        canvas = self.canvas
+        return canvas.winfo_rooty() + int(self.box[1] - canvas.canvasy(0))
+
+    def winfo_width(self):
+        """Return width of cell in last layout."""
+        return self.box[2]
+
+
+class CanvasRenderer:
+    """Mixin for DataGridBase subclasses to draw cells on the grid canvas.
+
+    The Frame for row widgets used by DataGridBase is removed from the
+    canvas.  maximum_column_width, if not None, limits the width of the
+    columns: text which does not fit is clipped.
+
+    """
+
+    def __init__(self, **kwargs):
+        """Extend to draw header and data rows on canvas."""
+        super().__init__(**kwargs)
+        self.maximum_column_width = None
+        self.cell_pool_size = CELL_POOL_SIZE
+        self._gridded_cells = dict()
+        self._cell_pool = []
+        self._fonts = dict()
+        self._layout_width = 0
+        canvas = self.gcanvas
+        for item in canvas.find_all():
+            if canvas.type(item) == "window":
+                canvas.delete(item)
+
+    def add_widget_to_spare_pool(self, widget):
+        """Extend to keep cells for reuse, or delete them if pool is full."""
+        if not isinstance(widget, CanvasCell):
+            super().add_widget_to_spare_pool(widget)
+            return
+        self._gridded_cells.pop(widget, None)
+        if len(self._cell_pool) >= self.cell_pool_size:
+            widget.destroy()
+            return
+        widget.reset()
+        self._cell_pool.append(widget)
+
+    def bind_handler(self, widget, sequence, function):
+        """Override to bind sequence for cells to the grid's handler.
+
+        Cells call Python functions rather than Tcl scripts.
+
+        """
+        if not isinstance(widget, CanvasCell):
+            super().bind_handler(widget, sequence, function)
+            return
+        widget.bind(sequence=sequence, func=self.get_handler(function))
+
+    def clip_text(self, text, font, width):
+        """Return longest leading part of text which fits in width pixels."""
+        font = self.get_font(font)
+        if self.maximum_column_width is None or font.measure(text) <= width:
+            return text
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if font.measure(text[:middle]) <= width:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low]
+
+    def get_font(self, font):
+        """Return tkinter.font.Font for font description, noted for reuse."""
+        try:
+            return self._fonts[font]
+        except TypeError:
+            return tkinter.font.Font(root=self.gcanvas, font=font)
+        except KeyError:
+            pass
+        self._fonts[font] = tkinter.font.Font(root=self.gcanvas, font=font)
+        return self._fonts[font]
+
+    def get_spare_row_widget(self, widget_type=tkinter.Label):
+        """Return a cell from the pool, or a new cell if pool is empty.
+
+        A cell is returned whatever widget_type is given.
+
+        """
+        if self._cell_pool:
+            return self._cell_pool.pop()
+        return CanvasCell(self)
+
+    def layout_cells(self):
+        """Draw gridded cells in rows and columns sized to fit their text."""
+        heights = {}
+        widths = {}
+        cells = []
+        for cell in self._gridded_cells:
+            row = cell.grid_info.get("row", 0)
+            column = cell.grid_info.get("column", 0)
+            cells.append((cell, row, column))
+            heights[row] = max(heights.get(row, 0), cell.winfo_reqheight())
+            widths[column] = max(widths.get(column, 0), cell.winfo_reqwidth())
+        if self.maximum_column_width is not None:
+            for column, width in widths.items():
+                widths[column] = min(width, self.maximum_column_width)
+        rowy = {}
+        offset = 0
+        for row in sorted(heights):
+            rowy[row] = offset
+            offset += heights[row]
+        columnx = {}
+        offset = 0
+        for column in sorted(widths):
+            columnx[column] = offset
+            offset += widths[column]
+        self._layout_width = offset
+        for cell, row, column in cells:
+            cell.place_cell(
+                columnx[column], rowy[row], widths[column], heights[row]
+            )
+
+    def note_forgotten_cell(self, cell):
+        """Remove cell from cells drawn by layout_cells."""
+        self._gridded_cells.pop(cell, None)
+
+    def note_gridded_cell(self, cell):
+        """Add cell to cells drawn by layout_cells."""
+        self._gridded_cells[cell] = None
+
+    def show_popup_menu_no_row(self, event=None):
+        """Extend to ignore events on the canvas over a cell.
+
+        Events on a cell are seen by the cell's bindings and then by the
+        canvas bindings.
+
+        """
+        if self.gcanvas.find_withtag(tkinter.CURRENT):
+            return
+        super().show_popup_menu_no_row(event=event)
+
+    def _get_background_script(self, widget, background):
+        """Override to return Tcl command to set background of a cell."""
+        if not isinstance(widget, CanvasCell):
+            return super()._get_background_script(widget, background)
+        widget.options["background"] = background
+        return "".join(
+            (
+                str(self.gcanvas),
+                " itemconfigure ",
+                str(widget.rectangle),
+                " -fill {",
+                background,
+                "}",
+            )
+        )
+
+    def _get_gridded_widgets(self):
+        """Override to return gridded cells."""
+        return list(self._gridded_cells)
+
+    def _get_key_under_pointer(self, keys):
+        """Override to return key in keys of row with cell under pointer."""
+        canvas = self.gcanvas
+        pointerx, pointery = self.get_pointerxy()
+        try:
+            widget = canvas.winfo_containing(pointerx, pointery)
+        except KeyError:
+            return None
+        if widget is not canvas:
+            return None
+        x = canvas.canvasx(pointerx - canvas.winfo_rootx())
+        y = canvas.canvasy(pointery - canvas.winfo_rooty())
+        items = set(canvas.find_overlapping(x, y, x, y))
+        if not items:
+            return None
+        for key in keys:
+            for row_widget in self.get_row_widgets(key):
+                cell = row_widget[0]
+                if isinstance(cell, CanvasCell) and cell.rectangle in items:
+                    return key
+        return None
+
+    def _get_scrollregion_width(self):
+        """Override to return width of cells in last layout."""
+        return self._layout_width
+
+    def _is_row_event_delegation_used(self):
+        """Override to return False because cells do not have bindtags.
+
+        Each cell is bound by bind_handler whatever the value of the
+        delegate_row_events attribute.
+
+        """
+        return False
+
+    def _layout_grid(self):
+        """Override to draw the header and data cells after gridding."""
+        self.layout_cells()
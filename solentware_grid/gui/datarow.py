@@ -34,6 +34,10 @@ class DataHeader(Bindings):
         """Delegate to superclass then define an empty header row."""
         super().__init__()
         self.header_specification = ()
+        # The header row made by make_header_widgets, kept for later calls,
+        # and it's parent.
+        self._header_row = None
+        self._header_parent = None
 
     # Not necessarily best but minimum change to get this out of DataRow.
     # Now we are there: is this method needed at all?
@@ -45,10 +49,19 @@ class DataHeader(Bindings):
         The master widget for the header row widget is not known when header
         is created so return the method to create the header row widget.
 
+        The header row made for a previous specification is discarded.
+
         """
+        if specification != self.header_specification:
+            self.clear_header_widgets()
         self.header_specification = specification
         return self.make_header_widgets
 
+    def clear_header_widgets(self):
+        """Discard the header row kept by make_header_widgets."""
+        self._header_row = None
+        self._header_parent = None
+
     def make_header_widgets(self, widgetpool, parent):
         """Return row of populated widgets with grid configuration arguments.
 
@@ -63,7 +76,12 @@ class DataHeader(Bindings):
         when moving from Windows 2000 to XP.  Details in comments at top of
         solentware_grid.datagrid module.
 
+        The header row is made on the first call for parent and returned
+        by later calls, so the grid does not rebuild it on each fill.
+
         """
+        if self._header_row is not None and self._header_parent is parent:
+            return self._header_row
         # Maybe return dictionary of widgets with (row, col) as keys?
         # If spec per instance set spec[TEXT] in grid_row() call?
         row = []
@@ -80,7 +98,9 @@ class DataHeader(Bindings):
                 spec[GRID_CONFIGURE]["column"], spec[GRID_COLUMNCONFIGURE]
             )
             row.append((widget, spec[GRID_CONFIGURE]))
-        return (row,)
+        self._header_row = (row,)
+        self._header_parent = parent
+        return self._header_row
 
 
 class DataRow(Bindings):
@@ -105,12 +125,30 @@ class DataRow(Bindings):
         super().__init__()
         self._row_widgets = ()
         self._current_row_background = NULL_COLOUR
+        self._painted_background = None
         self._pointer_popup_active = False
+        # The grid displaying the row sets bind_pointer_crossing False when
+        # it highlights the row under the pointer from bindings shared by
+        # the widgets of all rows.
+        self.bind_pointer_crossing = True
 
     def set_current_row_background(self, value):
         """Set colour used to set backgound colour for a row to value."""
         self._current_row_background = value
 
+    def is_background_painted(self, background):
+        """Return True if background is colour last set for row widgets."""
+        return background == self._painted_background
+
+    def set_painted_background(self, background):
+        """Note background as colour last set for row widgets.
+
+        DataGrid instances call this method after setting the colour of
+        row widgets without using set_background.
+
+        """
+        self._painted_background = background
+
     def set_background(self, widgets, background):
         """Set background colour of widgets.
 
@@ -124,6 +162,7 @@ class DataRow(Bindings):
         """
         for widget in widgets:
             widget[0].configure(background=background)
+        self._painted_background = background
 
     def set_background_bookmark(self, widgets):
         """Set background colour of widgets to BOOKMARK_COLOUR."""
@@ -227,20 +266,40 @@ class DataRow(Bindings):
             widget = widgetpool(spec[WIDGET])
             if widget is None:
                 widget = spec[WIDGET](master=parent)
-            self.bind(
-                widget, "<Enter>", function=self.highlight_row_on_pointer_enter
-            )
-            self.bind(
-                widget, "<Leave>", function=self.highlight_row_on_pointer_leave
-            )
+            if self.bind_pointer_crossing:
+                self.bind(
+                    widget,
+                    "<Enter>",
+                    function=self.highlight_row_on_pointer_enter,
+                )
+                self.bind(
+                    widget,
+                    "<Leave>",
+                    function=self.highlight_row_on_pointer_leave,
+                )
             # populate_widget is Tkinter.Label.configure by default
             # Typical subclass override is populate and format the Text widget
             # passed as widget argument from the item passed as text argument.
             self.populate_widget(widget, text=item, **wconf)
             row.append((widget, spec[GRID_CONFIGURE]))
         self._row_widgets = row
+        self._painted_background = None
         return self
 
+    def unbind_row_widgets(self):
+        """Remove bindings made by make_row_widgets and forget row widgets.
+
+        The DataGrid instance displaying the row calls this method before
+        putting the widgets in it's spare widget pool for reuse.
+
+        """
+        if self.bind_pointer_crossing:
+            for widget in self._row_widgets:
+                self.bind(widget[0], "<Enter>")
+                self.bind(widget[0], "<Leave>")
+        self._row_widgets = ()
+        self._painted_background = None
+
     def populate_widget(self, widget, cnf=None, text=None, **kw):
         """Delegate to widget's configure method."""
         # Replaces the class attribute set by
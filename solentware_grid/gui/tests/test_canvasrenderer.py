@@ -0,0 +1,383 @@
+# test_canvasrenderer.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""canvasrenderer tests"""
+
+import unittest
+
+from .. import canvasrenderer
+from ..datarow import NULL_COLOUR
+
+
+class _Canvas:
+    def __init__(self):
+        self.items = {}
+        self.coordinates = {}
+        self.tags = {}
+        self.deleted = []
+        self.window = None
+
+    def create_item(self, kind, tags=(), **kw):
+        item = len(self.items) + 1
+        self.items[item] = dict(kw, kind=kind)
+        for tag in tags:
+            self.tags.setdefault(tag, []).append(item)
+        return item
+
+    def create_rectangle(self, *a, **kw):
+        return self.create_item("rectangle", **kw)
+
+    def create_text(self, *a, **kw):
+        return self.create_item("text", **kw)
+
+    def find_all(self):
+        return [self.window] if self.window else []
+
+    def type(self, item):
+        return "window"
+
+    def itemconfigure(self, item, **kw):
+        for item in self.tags.get(item, [item]):
+            self.items[item].update(kw)
+
+    def coords(self, item, *a):
+        self.coordinates[item] = a
+
+    def delete(self, item):
+        self.deleted.append(item)
+
+    def tag_bind(self, tag, sequence, func, add):
+        self.bound = (tag, sequence, func, add)
+        self.funcids = getattr(self, "funcids", 0) + 1
+        if self.funcids == 1:
+            return "funcid"
+        return "funcid" + str(self.funcids)
+
+    def tag_unbind(self, tag, sequence, funcid):
+        self.unbound = (tag, sequence, funcid)
+
+    def winfo_pixels(self, value):
+        return int(value)
+
+    def canvasx(self, x):
+        return x + 10
+
+    def canvasy(self, y):
+        return y + 20
+
+    def winfo_rootx(self):
+        return 100
+
+    def winfo_rooty(self):
+        return 200
+
+
+class _Font:
+    def measure(self, text):
+        return 5 * len(text)
+
+    def metrics(self, option):
+        return 12
+
+
+class _Base:
+    def __init__(self, **kwargs):
+        self.gcanvas = _Canvas()
+        self.gcanvas.window = 99
+        self.pooled = []
+        self.gridded = False
+        self.bound = []
+
+    def bind_handler(self, widget, sequence, function):
+        self.bound.append((widget, sequence, function))
+
+    def get_handler(self, function):
+        return function
+
+    def add_widget_to_spare_pool(self, widget):
+        self.pooled.append(widget)
+
+
+class _Renderer(canvasrenderer.CanvasRenderer, _Base):
+    def get_font(self, font):
+        return _Font()
+
+
+class ModuleConstants(unittest.TestCase):
+    def test_001_constants_001(self):
+        self.assertEqual(
+            sorted(
+                k
+                for k in dir(canvasrenderer)
+                if k.isupper() and not k.startswith("_")
+            ),
+            ["CELL_POOL_SIZE", "NULL_COLOUR"],
+        )
+        self.assertEqual(canvasrenderer.CELL_POOL_SIZE, 1000)
+
+
+class CanvasCell(unittest.TestCase):
+    def setUp(self):
+        self.renderer = _Renderer()
+        self.cell = canvasrenderer.CanvasCell(self.renderer)
+        self.canvas = self.renderer.gcanvas
+
+    def tearDown(self):
+        pass
+
+    def test_001___init___001(self):
+        cell = self.cell
+        self.assertEqual(cell.renderer, self.renderer)
+        self.assertEqual(cell.canvas, self.canvas)
+        self.assertEqual(cell.rectangle, 1)
+        self.assertEqual(cell.text, 2)
+        self.assertEqual(self.canvas.tags[cell.tag], [1, 2])
+        self.assertEqual(self.canvas.items[1]["fill"], NULL_COLOUR)
+        self.assertEqual(self.canvas.items[1]["state"], "hidden")
+        self.assertEqual(self.canvas.items[2]["state"], "hidden")
+        self.assertEqual(cell.options, {})
+        self.assertEqual(cell.grid_info, None)
+        self.assertEqual(cell.box, (0, 0, 0, 0))
+
+    def test_002_configure_001(self):
+        self.cell.configure(text="abc", bg="red", fg="blue", justify="left")
+        self.assertEqual(
+            self.cell.options,
+            dict(
+                text="abc", background="red", foreground="blue", justify="left"
+            ),
+        )
+        self.assertEqual(self.canvas.items[1]["fill"], "red")
+        self.assertEqual(self.canvas.items[2]["fill"], "blue")
+        self.assertEqual(self.canvas.items[2]["justify"], "left")
+
+    def test_002_configure_002(self):
+        self.cell.configure(cnf={"text": "a"}, font="f")
+        self.assertEqual(self.cell.cget("text"), "a")
+        self.assertEqual(self.canvas.items[2]["font"], "f")
+
+    def test_003_cget_001(self):
+        self.assertEqual(self.cell.cget("bg"), NULL_COLOUR)
+        self.assertEqual(self.cell.cget("anchor"), "center")
+        self.assertEqual(self.cell.cget("text"), "")
+
+    def test_004_bind_001(self):
+        calls = []
+        self.assertEqual(
+            self.cell.bind(sequence="<Enter>", func=calls.append), "funcid"
+        )
+        tag, sequence, func, add = self.canvas.bound
+        self.assertEqual(
+            (tag, sequence, add), (self.cell.tag, "<Enter>", None)
+        )
+
+        class Event:
+            widget = None
+
+        func(Event())
+        self.assertIs(calls[0].widget, self.cell)
+
+    def test_004_bind_002(self):
+        self.assertEqual(
+            self.cell.bind(sequence="<Enter>", func=len), "funcid"
+        )
+        self.assertEqual(
+            self.cell.bind(sequence="<Enter>", func=len), "funcid"
+        )
+        self.assertEqual(self.canvas.funcids, 1)
+        self.assertEqual(
+            self.cell.bind(sequence="<Enter>", func=str), "funcid2"
+        )
+        self.assertEqual(
+            self.canvas.unbound, (self.cell.tag, "<Enter>", "funcid")
+        )
+        self.assertEqual(self.cell._bound, {"<Enter>": (str, "funcid2")})
+        self.cell.unbind("<Enter>", funcid="funcid2")
+        self.assertEqual(self.cell._bound, {})
+
+    def test_005_unbind_001(self):
+        self.cell.unbind("<Enter>", funcid="funcid")
+        self.assertEqual(
+            self.canvas.unbound, (self.cell.tag, "<Enter>", "funcid")
+        )
+
+    def test_006_grid_configure_001(self):
+        self.cell.grid_configure({"column": 1}, row=2)
+        self.assertEqual(self.cell.grid_info, {"column": 1, "row": 2})
+        self.assertEqual(self.renderer._get_gridded_widgets(), [self.cell])
+
+    def test_007_grid_forget_001(self):
+        self.cell.grid_configure(row=2)
+        self.cell.grid_forget()
+        self.assertEqual(self.cell.grid_info, None)
+        self.assertEqual(self.renderer._get_gridded_widgets(), [])
+        self.assertEqual(self.canvas.items[1]["state"], "hidden")
+
+    def test_008_reset_001(self):
+        self.cell.configure(text="abc", background="red")
+        self.cell.reset()
+        self.assertEqual(self.cell.options, {})
+        self.assertEqual(self.canvas.items[1]["fill"], NULL_COLOUR)
+        self.assertEqual(self.canvas.items[2]["text"], "")
+
+    def test_009_winfo_reqheight_001(self):
+        self.assertEqual(self.cell.winfo_reqheight(), 16)
+        self.cell.configure(text="a\nb", pady=3)
+        self.assertEqual(self.cell.winfo_reqheight(), 32)
+
+    def test_010_winfo_reqwidth_001(self):
+        self.cell.configure(text="abc")
+        self.assertEqual(self.cell.winfo_reqwidth(), 19)
+        self.cell.configure(width=6, bd=0)
+        self.assertEqual(self.cell.winfo_reqwidth(), 32)
+
+    def test_011_place_cell_001(self):
+        self.cell.configure(text="abc", anchor="w")
+        self.cell.place_cell(10, 20, 30, 16)
+        self.assertEqual(self.cell.box, (10, 20, 30, 16))
+        self.assertEqual(self.canvas.coordinates[1], (10, 20, 40, 36))
+        self.assertEqual(self.canvas.coordinates[2], (12, 28))
+        self.assertEqual(self.canvas.items[2]["text"], "abc")
+        self.assertEqual(self.canvas.items[1]["state"], "normal")
+        self.assertEqual(self.canvas.items[2]["state"], "disabled")
+
+    def test_011_place_cell_002(self):
+        self.cell.configure(text="abc", anchor="se")
+        self.cell.place_cell(10, 20, 30, 16)
+        self.assertEqual(self.canvas.coordinates[2], (38, 34))
+
+    def test_012_winfo_001(self):
+        self.cell.place_cell(10, 20, 30, 16)
+        self.assertEqual(self.cell.winfo_rootx(), 100)
+        self.assertEqual(self.cell.winfo_rooty(), 200)
+        self.assertEqual(self.cell.winfo_width(), 30)
+        self.assertEqual(self.cell.winfo_height(), 16)
+        self.assertEqual(self.cell.winfo_children(), [])
+
+    def test_013_destroy_001(self):
+        self.cell.destroy()
+        self.assertEqual(self.canvas.deleted[-1], self.cell.tag)
+
+    def test_013_destroy_002(self):
+        self.cell.bind(sequence="<Enter>", func=len)
+        self.cell.destroy()
+        self.assertEqual(
+            self.canvas.unbound, (self.cell.tag, "<Enter>", "funcid")
+        )
+        self.assertEqual(self.cell._bound, {})
+
+
+class CanvasRenderer(unittest.TestCase):
+    def setUp(self):
+        self.renderer = _Renderer()
+        self.canvas = self.renderer.gcanvas
+
+    def tearDown(self):
+        pass
+
+    def test_001___init___001(self):
+        renderer = self.renderer
+        self.assertEqual(renderer.maximum_column_width, None)
+        self.assertEqual(renderer.cell_pool_size, 1000)
+        self.assertEqual(renderer._gridded_cells, {})
+        self.assertEqual(renderer._cell_pool, [])
+        self.assertEqual(renderer._layout_width, 0)
+        self.assertEqual(self.canvas.deleted, [99])
+
+    def test_002_get_spare_row_widget_001(self):
+        cell = self.renderer.get_spare_row_widget()
+        self.assertIsInstance(cell, canvasrenderer.CanvasCell)
+        self.renderer.add_widget_to_spare_pool(cell)
+        self.assertIs(self.renderer.get_spare_row_widget(object), cell)
+
+    def test_003_add_widget_to_spare_pool_001(self):
+        cell = self.renderer.get_spare_row_widget()
+        cell.grid_configure(row=0)
+        self.renderer.add_widget_to_spare_pool(cell)
+        self.assertEqual(self.renderer._cell_pool, [cell])
+        self.assertEqual(self.renderer._gridded_cells, {})
+
+    def test_003_add_widget_to_spare_pool_002(self):
+        self.renderer.cell_pool_size = 0
+        cell = self.renderer.get_spare_row_widget()
+        self.renderer.add_widget_to_spare_pool(cell)
+        self.assertEqual(self.renderer._cell_pool, [])
+        self.assertEqual(self.canvas.deleted[-1], cell.tag)
+
+    def test_003_add_widget_to_spare_pool_003(self):
+        widget = object()
+        self.renderer.add_widget_to_spare_pool(widget)
+        self.assertEqual(self.renderer.pooled, [widget])
+
+    def test_004_clip_text_001(self):
+        self.assertEqual(self.renderer.clip_text("abcdef", "f", 12), "abcdef")
+        self.renderer.maximum_column_width = 12
+        self.assertEqual(self.renderer.clip_text("abcdef", "f", 12), "ab")
+        self.assertEqual(self.renderer.clip_text("ab", "f", 12), "ab")
+
+    def test_005_layout_cells_001(self):
+        cells = []
+        for row, column, text in ((0, 0, "a"), (0, 1, "bbb"), (1, 0, "cc")):
+            cell = self.renderer.get_spare_row_widget()
+            cell.configure(text=text)
+            cell.grid_configure(row=row, column=column)
+            cells.append(cell)
+        self.renderer.layout_cells()
+        self.assertEqual(
+            [c.box for c in cells],
+            [(0, 0, 14, 16), (14, 0, 19, 16), (0, 16, 14, 16)],
+        )
+        self.assertEqual(self.renderer._get_scrollregion_width(), 33)
+
+    def test_005_layout_cells_002(self):
+        self.renderer.maximum_column_width = 10
+        cell = self.renderer.get_spare_row_widget()
+        cell.configure(text="abcdef")
+        cell.grid_configure(row=0, column=0)
+        self.renderer.layout_cells()
+        self.assertEqual(cell.box, (0, 0, 10, 16))
+        self.assertEqual(self.canvas.items[cell.text]["text"], "a")
+
+    def test_006__layout_grid_001(self):
+        cell = self.renderer.get_spare_row_widget()
+        cell.grid_configure(row=0, column=0)
+        self.renderer._layout_grid()
+        self.assertEqual(cell.box, (0, 0, 4, 16))
+
+    def test_007__get_background_script_001(self):
+        cell = self.renderer.get_spare_row_widget()
+        self.assertEqual(
+            self.renderer._get_background_script(cell, "red"),
+            "".join(
+                (
+                    str(self.canvas),
+                    " itemconfigure ",
+                    str(cell.rectangle),
+                    " -fill {red}",
+                )
+            ),
+        )
+        self.assertEqual(cell.cget("background"), "red")
+
+    def test_008_bind_handler_001(self):
+        cell = self.renderer.get_spare_row_widget()
+        self.renderer.bind_handler(cell, "<Enter>", len)
+        self.assertEqual(cell._bound, {"<Enter>": (len, "funcid")})
+        widget = object()
+        self.renderer.bind_handler(widget, "<Enter>", len)
+        self.assertEqual(self.renderer.bound, [(widget, "<Enter>", len)])
+
+    def test_009__is_row_event_delegation_used_001(self):
+        self.renderer.delegate_row_events = True
+        self.assertEqual(
+            self.renderer._is_row_event_delegation_used(), False
+        )
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+    runner().run(loader(ModuleConstants))
+    runner().run(loader(CanvasCell))
+    runner().run(loader(CanvasRenderer))
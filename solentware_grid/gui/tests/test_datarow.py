@@ -139,6 +139,47 @@ class DataHeader(unittest.TestCase):
             row[0][0][1], self.specification[0][datarow.GRID_CONFIGURE]
         )
 
+    def test_003_make_header_widgets_004(self):
+        def widgetpool(spec):
+            return None
+
+        parent = self.Widget()
+        self.dataheader.grid_header_row(self.specification)
+        row = self.dataheader.make_header_widgets(widgetpool, parent)
+        self.assertIs(self.dataheader.make_header_widgets(None, parent), row)
+        self.assertIsNot(
+            self.dataheader.make_header_widgets(widgetpool, self.Widget()),
+            row,
+        )
+
+    def test_003_make_header_widgets_005(self):
+        def widgetpool(spec):
+            return None
+
+        parent = self.Widget()
+        self.dataheader.grid_header_row(self.specification)
+        row = self.dataheader.make_header_widgets(widgetpool, parent)
+        self.dataheader.grid_header_row(self.specification)
+        self.assertIs(self.dataheader.make_header_widgets(None, parent), row)
+        self.dataheader.grid_header_row(())
+        self.assertEqual(
+            self.dataheader.make_header_widgets(widgetpool, parent), ([],)
+        )
+
+    def test_004_clear_header_widgets_001(self):
+        def widgetpool(spec):
+            return None
+
+        parent = self.Widget()
+        self.dataheader.header_specification = self.specification
+        row = self.dataheader.make_header_widgets(widgetpool, parent)
+        self.dataheader.clear_header_widgets()
+        self.assertEqual(self.dataheader._header_row, None)
+        self.assertEqual(self.dataheader._header_parent, None)
+        self.assertIsNot(
+            self.dataheader.make_header_widgets(widgetpool, parent), row
+        )
+
 
 class DataRow(unittest.TestCase):
     def setUp(self):
@@ -150,6 +191,7 @@ class DataRow(unittest.TestCase):
                 pass
 
             configure = bind
+            unbind = bind
             grid_configure = bind
             grid_columnconfigure = bind
 
@@ -210,6 +252,11 @@ class DataRow(unittest.TestCase):
             self.datarow.set_background([(self.Widget(), None)], None), None
         )
 
+    def test_002_set_background_003(self):
+        self.assertEqual(self.datarow.is_background_painted("red"), False)
+        self.datarow.set_background([(self.Widget(), None)], "red")
+        self.assertEqual(self.datarow.is_background_painted("red"), True)
+
     def test_003_set_background_bookmark_001(self):
         self.assertRaisesRegex(
             TypeError,
@@ -652,6 +699,84 @@ class DataRow(unittest.TestCase):
         self.datarow._row_widgets = [[self.Widget()]]
         self.assertEqual(self.datarow.is_row_under_pointer(110, 155), True)
 
+    def test_024_unbind_row_widgets_001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"unbind_row_widgets\(\) takes 1 ",
+                    "positional argument but 2 were given",
+                )
+            ),
+            self.datarow.unbind_row_widgets,
+            *(None,),
+        )
+
+    def test_024_unbind_row_widgets_002(self):
+        def widgetpool(spec):
+            return None
+
+        self.datarow.row_specification = self.specification
+        self.datarow.make_row_widgets(widgetpool, self.Widget(), self.items)
+        self.assertEqual(len(self.datarow._row_widgets), 1)
+        self.assertEqual(len(self.datarow._binding), 2)
+        self.assertEqual(self.datarow.unbind_row_widgets(), None)
+        self.assertEqual(len(self.datarow._row_widgets), 0)
+        for function_ids in self.datarow._binding.values():
+            self.assertEqual(len(function_ids), 0)
+
+    def test_024_unbind_row_widgets_003(self):
+        self.datarow.set_painted_background("red")
+        self.datarow.unbind_row_widgets()
+        self.assertEqual(self.datarow.is_background_painted("red"), False)
+
+    def test_024_unbind_row_widgets_004(self):
+        def widgetpool(spec):
+            return None
+
+        self.assertEqual(self.datarow.bind_pointer_crossing, True)
+        self.datarow.bind_pointer_crossing = False
+        self.datarow.row_specification = self.specification
+        self.datarow.make_row_widgets(widgetpool, self.Widget(), self.items)
+        self.assertEqual(len(self.datarow._row_widgets), 1)
+        self.assertEqual(len(self.datarow._binding), 0)
+        self.assertEqual(self.datarow.unbind_row_widgets(), None)
+        self.assertEqual(len(self.datarow._row_widgets), 0)
+
+    def test_025_is_background_painted_001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"is_background_painted\(\) missing 1 required ",
+                    "positional argument: 'background'",
+                )
+            ),
+            self.datarow.is_background_painted,
+        )
+
+    def test_025_is_background_painted_002(self):
+        self.assertEqual(self.datarow.is_background_painted(None), True)
+        self.assertEqual(
+            self.datarow.is_background_painted(datarow.NULL_COLOUR), False
+        )
+
+    def test_026_set_painted_background_001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"set_painted_background\(\) missing 1 required ",
+                    "positional argument: 'background'",
+                )
+            ),
+            self.datarow.set_painted_background,
+        )
+
+    def test_026_set_painted_background_002(self):
+        self.assertEqual(self.datarow.set_painted_background("red"), None)
+        self.assertEqual(self.datarow.is_background_painted("red"), True)
+
 
 if __name__ == "__main__":
     runner = unittest.TextTestRunner
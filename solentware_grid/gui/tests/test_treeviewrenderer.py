@@ -0,0 +1,496 @@
+# test_treeviewrenderer.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""treeviewrenderer tests"""
+
+import unittest
+
+from .. import treeviewrenderer
+from ..datarow import NULL_COLOUR
+
+
+class _Canvas:
+    def __init__(self):
+        self.deleted = []
+        self.windows = []
+        self.configured = None
+
+    def find_all(self):
+        return [99]
+
+    def type(self, item):
+        return "window"
+
+    def delete(self, item):
+        self.deleted.append(item)
+
+    def create_window(self, *a, **kw):
+        self.windows.append(kw["window"])
+        return 100
+
+    def itemconfigure(self, item, **kw):
+        self.configured = (item, kw)
+
+    def winfo_width(self):
+        return 50
+
+    def winfo_height(self):
+        return 80
+
+    def __str__(self):
+        return ".canvas"
+
+
+class _Tree:
+    def __init__(self):
+        self.tags = {}
+        self.items = {}
+        self.moved = []
+        self.detached = []
+        self.columns = {}
+        self.headings = {}
+        self.options = {}
+        self.region = "cell"
+        self.pointer_row = "I1"
+        self.pointer_column = "#1"
+
+    def bindtags(self, tags=None):
+        if tags is None:
+            return (".tree", "Treeview", ".", "all")
+        self.bound_tags = tags
+        return None
+
+    def tag_configure(self, tag, **kw):
+        self.tags[tag] = kw
+
+    def insert(self, parent, index):
+        item = "".join(("I", str(len(self.items) + 1)))
+        self.items[item] = {}
+        return item
+
+    def item(self, item, **kw):
+        self.items[item].update(kw)
+
+    def set(self, item, column=None, value=None):
+        self.items[item][column] = value
+
+    def move(self, item, parent, index):
+        self.moved.append((item, index))
+
+    def detach(self, *items):
+        self.detached.extend(items)
+
+    def configure(self, **kw):
+        self.options.update(kw)
+
+    def column(self, column, **kw):
+        self.columns[column] = kw
+
+    def heading(self, column, **kw):
+        self.headings[column] = kw
+
+    def bbox(self, item, column=None):
+        return (10, 20, 30, 16)
+
+    def identify_region(self, x, y):
+        return self.region
+
+    def identify_row(self, y):
+        return self.pointer_row
+
+    def identify_column(self, x):
+        return self.pointer_column
+
+    def winfo_pixels(self, value):
+        return int(value)
+
+    def winfo_rootx(self):
+        return 100
+
+    def winfo_rooty(self):
+        return 200
+
+    def __str__(self):
+        return ".tree"
+
+
+class _Font:
+    def measure(self, text):
+        return 5 * len(text)
+
+
+class _Base:
+    def __init__(self, **kwargs):
+        self.gcanvas = _Canvas()
+        self.pooled = []
+        self.gridded = False
+        self.bound = []
+        self._header_row_count = 1
+
+    def bind(self, widget, sequence, function=None, add=None):
+        self.bound.append((widget, sequence, function, add))
+
+    def bind_handler(self, widget, sequence, function):
+        self.bound.append((widget, sequence, function, "script"))
+
+    def get_handler(self, function):
+        return function
+
+    def add_widget_to_spare_pool(self, widget):
+        self.pooled.append(widget)
+
+
+class _Renderer(treeviewrenderer.TreeviewRenderer, _Base):
+    def make_treeview(self):
+        return _Tree()
+
+    def get_font(self):
+        return _Font()
+
+    def get_row_height(self):
+        return 20
+
+
+class _Event:
+    x = 1
+    y = 2
+    widget = None
+
+
+class ModuleConstants(unittest.TestCase):
+    def test_001_constants_001(self):
+        self.assertEqual(
+            sorted(
+                k
+                for k in dir(treeviewrenderer)
+                if k.isupper() and not k.startswith("_")
+            ),
+            ["CELL_POOL_SIZE", "NULL_COLOUR"],
+        )
+        self.assertEqual(treeviewrenderer.CELL_POOL_SIZE, 1000)
+
+    def test_002__column_id_001(self):
+        self.assertEqual(treeviewrenderer._column_id(3), "column3")
+
+
+class TreeviewCell(unittest.TestCase):
+    def setUp(self):
+        self.renderer = _Renderer()
+        self.cell = treeviewrenderer.TreeviewCell(self.renderer)
+        self.tree = self.renderer.tree
+
+    def tearDown(self):
+        pass
+
+    def test_001___init___001(self):
+        cell = self.cell
+        self.assertEqual(cell.renderer, self.renderer)
+        self.assertEqual(cell.options, {})
+        self.assertEqual(cell.bindings, {})
+        self.assertEqual(cell.grid_info, None)
+        self.assertEqual(cell.item, None)
+        self.assertEqual(cell.column, None)
+
+    def test_002_bind_001(self):
+        self.assertEqual(self.cell.bind(sequence="<1>", func=len), "cell0")
+        self.assertEqual(
+            self.cell.bind(sequence="<1>", func=str, add=True), "cell1"
+        )
+        self.assertEqual(
+            self.cell.bindings, {"<1>": {"cell0": len, "cell1": str}}
+        )
+        self.assertEqual(self.renderer._tree_sequences, {"<1>"})
+        self.assertEqual(self.cell.bind(sequence="<1>", func=len), "cell2")
+        self.assertEqual(self.cell.bindings, {"<1>": {"cell2": len}})
+
+    def test_002_bind_002(self):
+        self.cell.bind(sequence="<Enter>", func=len)
+        self.assertEqual(self.renderer._tree_sequences, set())
+
+    def test_003_unbind_001(self):
+        self.cell.bind(sequence="<1>", func=len)
+        self.cell.bind(sequence="<1>", func=str, add=True)
+        self.cell.unbind("<1>", funcid="cell0")
+        self.assertEqual(self.cell.bindings, {"<1>": {"cell1": str}})
+        self.cell.unbind("<1>")
+        self.assertEqual(self.cell.bindings, {})
+
+    def test_004_configure_001(self):
+        self.cell.configure(text="abc", bg="red")
+        self.assertEqual(
+            self.cell.options, {"text": "abc", "background": "red"}
+        )
+        self.assertEqual(self.cell.cget("bg"), "red")
+        self.assertEqual(self.tree.items, {})
+
+    def test_004_configure_002(self):
+        item = self.tree.insert("", "end")
+        self.cell.item = item
+        self.cell.column = 2
+        self.cell.configure(cnf={"text": "abc"}, background="red")
+        self.assertEqual(self.tree.items[item]["column2"], "abc")
+        self.assertEqual(self.tree.items[item]["tags"], ("background0",))
+        self.assertEqual(
+            self.tree.tags, {"background0": {"background": "red"}}
+        )
+
+    def test_005_cget_001(self):
+        self.assertEqual(self.cell.cget("background"), NULL_COLOUR)
+        self.assertEqual(self.cell.cget("padx"), 1)
+        self.assertEqual(self.cell.cget("text"), "")
+
+    def test_006_grid_configure_001(self):
+        self.cell.grid_configure({"column": 1}, row=2)
+        self.assertEqual(self.cell.grid_info, {"column": 1, "row": 2})
+        self.assertEqual(self.renderer._get_gridded_widgets(), [self.cell])
+
+    def test_007_grid_forget_001(self):
+        self.cell.grid_configure(row=2)
+        self.cell.item = "I1"
+        self.cell.grid_forget()
+        self.assertEqual(self.cell.grid_info, None)
+        self.assertEqual(self.cell.item, None)
+        self.assertEqual(self.renderer._get_gridded_widgets(), [])
+
+    def test_008_reset_001(self):
+        self.cell.configure(text="abc")
+        self.cell.bind(sequence="<1>", func=len)
+        self.cell.reset()
+        self.assertEqual(self.cell.options, {})
+        self.assertEqual(self.cell.bindings, {})
+
+    def test_009_winfo_reqheight_001(self):
+        self.assertEqual(self.cell.winfo_reqheight(), 20)
+
+    def test_010_winfo_reqwidth_001(self):
+        self.cell.configure(text="abc\na")
+        self.assertEqual(self.cell.winfo_reqwidth(), 19)
+        self.cell.configure(width=6, bd=0)
+        self.assertEqual(self.cell.winfo_reqwidth(), 32)
+
+    def test_011_winfo_001(self):
+        self.assertEqual(self.cell.winfo_width(), 0)
+        self.cell.item = "I1"
+        self.cell.column = 0
+        self.assertEqual(self.cell.winfo_rootx(), 110)
+        self.assertEqual(self.cell.winfo_rooty(), 220)
+        self.assertEqual(self.cell.winfo_width(), 30)
+        self.assertEqual(self.cell.winfo_height(), 16)
+        self.assertEqual(self.cell.winfo_children(), [])
+
+    def test_012_destroy_001(self):
+        self.cell.bind(sequence="<1>", func=len)
+        self.cell.destroy()
+        self.assertEqual(self.cell.bindings, {})
+
+
+class TreeviewRenderer(unittest.TestCase):
+    def setUp(self):
+        self.renderer = _Renderer()
+        self.tree = self.renderer.tree
+        self.canvas = self.renderer.gcanvas
+
+    def tearDown(self):
+        pass
+
+    def _grid_cells(self, rows):
+        cells = []
+        for row, texts in enumerate(rows):
+            for column, text in enumerate(texts):
+                cell = self.renderer.get_spare_row_widget()
+                cell.configure(text=text)
+                cell.grid_configure(row=row, column=column)
+                cells.append(cell)
+        return cells
+
+    def test_001___init___001(self):
+        renderer = self.renderer
+        self.assertEqual(renderer.cell_pool_size, 1000)
+        self.assertEqual(renderer._gridded_cells, {})
+        self.assertEqual(renderer._cell_pool, [])
+        self.assertEqual(renderer._row_items, [])
+        self.assertEqual(renderer._layout_width, 0)
+        self.assertEqual(self.canvas.deleted, [99])
+        self.assertEqual(self.canvas.windows, [self.tree])
+        self.assertEqual(renderer._tree_window, 100)
+        self.assertEqual(
+            self.tree.bound_tags, ("Treeview", ".tree", ".canvas", ".", "all")
+        )
+        self.assertEqual(
+            [b[:2] for b in renderer.bound],
+            [(self.tree, "<Motion>"), (self.tree, "<Leave>")],
+        )
+
+    def test_002_get_spare_row_widget_001(self):
+        cell = self.renderer.get_spare_row_widget()
+        self.assertIsInstance(cell, treeviewrenderer.TreeviewCell)
+        self.renderer.add_widget_to_spare_pool(cell)
+        self.assertIs(self.renderer.get_spare_row_widget(object), cell)
+
+    def test_003_add_widget_to_spare_pool_001(self):
+        self.renderer.cell_pool_size = 0
+        cell = self.renderer.get_spare_row_widget()
+        self.renderer.add_widget_to_spare_pool(cell)
+        self.assertEqual(self.renderer._cell_pool, [])
+
+    def test_003_add_widget_to_spare_pool_002(self):
+        widget = object()
+        self.renderer.add_widget_to_spare_pool(widget)
+        self.assertEqual(self.renderer.pooled, [widget])
+
+    def test_004_bind_tree_sequence_001(self):
+        self.renderer.bind_tree_sequence("<3>")
+        self.renderer.bind_tree_sequence("<3>")
+        self.renderer.bind_tree_sequence("<Leave>")
+        self.assertEqual(self.renderer._tree_sequences, {"<3>"})
+        self.assertEqual(len(self.renderer.bound), 3)
+        self.assertEqual(self.renderer.bound[-1][3], True)
+
+    def test_005_get_background_tag_001(self):
+        get_background_tag = self.renderer.get_background_tag
+        self.assertEqual(get_background_tag("red"), "background0")
+        self.assertEqual(get_background_tag("blue"), "background1")
+        self.assertEqual(get_background_tag("red"), "background0")
+        self.assertEqual(len(self.tree.tags), 2)
+
+    def test_006_layout_cells_001(self):
+        cells = self._grid_cells((("h0", "h1"), ("a", "bbb"), ("cc", "d")))
+        self.renderer.layout_cells()
+        self.assertEqual(
+            self.tree.options,
+            dict(
+                columns=["column0", "column1"],
+                displaycolumns=["column0", "column1"],
+            ),
+        )
+        self.assertEqual(
+            self.tree.columns,
+            {
+                "column0": dict(width=14, stretch=False),
+                "column1": dict(width=19, stretch=False),
+            },
+        )
+        self.assertEqual(self.tree.headings["column1"], dict(text="h1"))
+        self.assertEqual(
+            self.tree.items,
+            {
+                "I1": dict(values=["a", "bbb"], tags=("background0",)),
+                "I2": dict(values=["cc", "d"], tags=("background0",)),
+            },
+        )
+        self.assertEqual(self.tree.moved, [("I1", 0), ("I2", 1)])
+        self.assertEqual(
+            [c.item for c in cells], [None, None, "I1", "I1", "I2", "I2"]
+        )
+        self.assertEqual(self.renderer._get_scrollregion_width(), 33)
+        self.assertEqual(
+            self.canvas.configured, (100, dict(width=50, height=80))
+        )
+
+    def test_006_layout_cells_002(self):
+        cells = self._grid_cells((("h0",), ("a",), ("b",)))
+        self.renderer.layout_cells()
+        for cell in cells:
+            cell.grid_forget()
+            self.renderer.add_widget_to_spare_pool(cell)
+        self._grid_cells((("h0",), ("c",)))
+        self.renderer.layout_cells()
+        self.assertEqual(self.tree.moved, [("I1", 0), ("I2", 1)])
+        self.assertEqual(self.tree.detached, ["I2"])
+        self.assertEqual(self.tree.items["I1"]["values"], ["c"])
+
+    def test_007__layout_grid_001(self):
+        self._grid_cells((("h0",), ("a",)))
+        self.renderer._layout_grid()
+        self.assertEqual(self.renderer._row_items, ["I1"])
+
+    def test_008__dispatch_event_001(self):
+        cells = self._grid_cells((("h0", "h1"), ("a", "b")))
+        self.renderer.layout_cells()
+        events = []
+        cells[3].bind(sequence="<3>", func=events.append)
+        self.tree.pointer_column = "#2"
+        self.assertEqual(self.renderer._dispatch_event("<3>", _Event()), None)
+        self.assertIs(events[0].widget, cells[3])
+        self.tree.pointer_column = "#3"
+        self.assertEqual(self.renderer._dispatch_event("<3>", _Event()), None)
+        self.assertEqual(len(events), 1)
+
+    def test_008__dispatch_event_002(self):
+        cells = self._grid_cells((("h0", "h1"), ("a", "b")))
+        self.renderer.layout_cells()
+        cells[0].bind(sequence="<3>", func=lambda event: "break")
+        self.tree.region = "heading"
+        self.assertEqual(
+            self.renderer._dispatch_event("<3>", _Event()), "break"
+        )
+
+    def test_009__track_pointer_item_001(self):
+        cells = self._grid_cells((("h0",), ("a",), ("b",)))
+        self.renderer.layout_cells()
+        events = []
+        for cell in cells[1:]:
+            cell.bind(
+                sequence="<Enter>",
+                func=lambda e, c=cell: events.append(("enter", c)),
+            )
+            cell.bind(
+                sequence="<Leave>",
+                func=lambda e, c=cell: events.append(("leave", c)),
+            )
+        self.renderer._track_pointer_item(_Event())
+        self.renderer._track_pointer_item(_Event())
+        self.tree.pointer_row = "I2"
+        self.renderer._track_pointer_item(_Event())
+        self.renderer._leave_tree(_Event())
+        self.assertEqual(
+            events,
+            [
+                ("enter", cells[1]),
+                ("leave", cells[1]),
+                ("enter", cells[2]),
+                ("leave", cells[2]),
+            ],
+        )
+
+    def test_010__get_background_script_001(self):
+        cells = self._grid_cells((("h0", "h1"), ("a", "b")))
+        self.renderer.layout_cells()
+        self.assertEqual(
+            self.renderer._get_background_script(cells[2], "red"),
+            ".tree item I1 -tags {background1}",
+        )
+        self.assertEqual(
+            self.renderer._get_background_script(cells[3], "red"), ""
+        )
+        self.assertEqual(
+            self.renderer._get_background_script(cells[0], "red"), ""
+        )
+        self.assertEqual(cells[3].cget("background"), "red")
+
+    def test_011_bind_handler_001(self):
+        cell = self.renderer.get_spare_row_widget()
+        self.renderer.bind_handler(cell, "<1>", len)
+        self.assertEqual(list(cell.bindings["<1>"].values()), [len])
+        self.renderer.bind_handler(cell, "<1>", len)
+        self.assertEqual(list(cell.bindings["<1>"].values()), [len])
+        widget = object()
+        self.renderer.bind_handler(widget, "<1>", len)
+        self.assertEqual(
+            self.renderer.bound[-1], (widget, "<1>", len, "script")
+        )
+
+    def test_012__is_row_event_delegation_used_001(self):
+        self.renderer.delegate_row_events = True
+        self.assertEqual(
+            self.renderer._is_row_event_delegation_used(), False
+        )
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner
+    loader = unittest.defaultTestLoader.loadTestsFromTestCase
+    runner().run(loader(ModuleConstants))
+    runner().run(loader(TreeviewCell))
+    runner().run(loader(TreeviewRenderer))
@@ -0,0 +1,567 @@
+# treeviewrenderer.py
+# Copyright 2026 Roger Marsh
+# Licence: See LICENCE (BSD licence)
+
+"""Display the rows of a datagrid in a ttk.Treeview widget.
+
+DataGridBase displays each cell in a Label widget gridded in a Frame on
+it's canvas, so filling a page of rows and changing the colour of the
+selected row cost several Tcl calls per cell.
+
+The TreeviewRenderer mixin displays the header row as the headings, and
+the data rows as items, of a ttk.Treeview which does row layout itself.
+The TreeviewCell class provides the methods of Label widgets used by
+DataRow, DataHeader, and DataGridBase, so row classes which display text
+in Label widgets, by the DataRow grid_row and make_row_widgets methods,
+are displayed without change.  The values of a row are set in one item
+command on a reused item, and row background colours, for selection and
+bookmarks for example, are Treeview tags configured once per colour.
+
+Only the first header row is displayed.  Row classes which use other
+widgets, Text widgets for example, or which call widget methods other
+than configure and cget, are not supported.
+
+Typical use is
+class FooGrid(TreeviewRenderer, solentware_grid.datagrid.DataGrid):
+    ...
+
+"""
+
+import functools
+import itertools
+import tkinter
+import tkinter.font
+import tkinter.ttk
+
+from .datarow import NULL_COLOUR
+
+# Label option defaults used to calculate the width of a cell.
+_LABEL_DEFAULTS = {
+    "anchor": tkinter.CENTER,
+    "borderwidth": 1,
+    "padx": 1,
+    "width": 0,
+}
+
+# Abbreviations allowed for Label options.
+_OPTION_SYNONYMS = {
+    "bd": "borderwidth",
+    "bg": "background",
+    "fg": "foreground",
+}
+
+# Pointer crossing events are derived from motion over the Treeview items.
+_CROSSING_SEQUENCES = frozenset(("<Enter>", "<Leave>"))
+
+# Number of cells kept for reuse by default.
+CELL_POOL_SIZE = 1000
+
+
+class TreeviewCell:
+    """Grid cell displayed as a column value of a ttk.Treeview item.
+
+    renderer - the TreeviewRenderer instance which displays the cell.
+
+    Bindings are held by the cell and called by the renderer for events
+    on the item and column displaying the cell.
+
+    """
+
+    def __init__(self, renderer):
+        """Create cell not displayed in the Treeview."""
+        super().__init__()
+        self.renderer = renderer
+        self.options = {}
+        self.bindings = {}
+        self.grid_info = None
+        self.item = None
+        self.column = None
+
+    def bind(self, sequence=None, func=None, add=None):
+        """Bind sequence to func for the cell and return identifier.
+
+        The widget attribute of events given to func is set to the cell.
+
+        """
+        if not add:
+            self.bindings[sequence] = {}
+        funcid = self.renderer.get_cell_funcid()
+        self.bindings.setdefault(sequence, {})[funcid] = func
+        self.renderer.bind_tree_sequence(sequence)
+        return funcid
+
+    def unbind(self, sequence, funcid=None):
+        """Remove binding of sequence identified by funcid."""
+        if funcid is None:
+            self.bindings.pop(sequence, None)
+        else:
+            self.bindings.get(sequence, {}).pop(funcid, None)
+
+    def cget(self, key):
+        """Return value of option key."""
+        key = _OPTION_SYNONYMS.get(key, key)
+        if key in self.options:
+            return self.options[key]
+        if key == "background":
+            return NULL_COLOUR
+        return _LABEL_DEFAULTS.get(key, "")
+
+    def configure(self, cnf=None, **kw):
+        """Set options for the cell like tkinter.Label.configure."""
+        if cnf:
+            kw = dict(cnf, **kw)
+        options = self.options
+        for key, value in kw.items():
+            options[_OPTION_SYNONYMS.get(key, key)] = value
+        if self.item is None:
+            return
+        if "text" in kw:
+            self.renderer.set_cell_text(self)
+        if "background" in options and ("background" in kw or "bg" in kw):
+            self.renderer.set_cell_background(self)
+
+    config = configure
+
+    def destroy(self):
+        """Discard the cell's bindings."""
+        self.bindings.clear()
+        self.grid_info = None
+        self.item = None
+
+    def grid_configure(self, cnf=None, **kw):
+        """Note grid options for cell for next layout of grid."""
+        if cnf:
+            kw = dict(cnf, **kw)
+        if self.grid_info is None:
+            self.grid_info = kw
+        else:
+            self.grid_info.update(kw)
+        self.renderer.note_gridded_cell(self)
+
+    def grid_forget(self):
+        """Remove cell from layout of grid."""
+        self.grid_info = None
+        self.item = None
+        self.renderer.note_forgotten_cell(self)
+
+    def reset(self):
+        """Set options and bindings to those of a new cell."""
+        self.options.clear()
+        self.bindings.clear()
+        self.grid_info = None
+        self.item = None
+        self.column = None
+
+    def _get_bbox(self):
+        """Return x, y, width, and height, of cell in the Treeview."""
+        return self.renderer.get_cell_bbox(self)
+
+    def winfo_children(self):
+        """Return empty list: a cell has no child widgets."""
+        return []
+
+    def winfo_height(self):
+        """Return height of cell in Treeview."""
+        return self._get_bbox()[3]
+
+    def winfo_pointerxy(self):
+        """Return x and y coordinates of pointer on the screen."""
+        return self.renderer.tree.winfo_pointerxy()
+
+    def winfo_reqheight(self):
+        """Return height of a Treeview row."""
+        return self.renderer.get_row_height()
+
+    def winfo_reqwidth(self):
+        """Return width the cell needs to show it's text."""
+        font = self.renderer.get_font()
+        pixels = self.renderer.tree.winfo_pixels
+        width = int(self.cget("width") or 0)
+        if width:
+            width *= font.measure("0")
+        else:
+            lines = str(self.cget("text")).split("\n")
+            width = max(font.measure(line) for line in lines)
+        padx = pixels(self.cget("padx")) + pixels(self.cget("borderwidth"))
+        return width + 2 * padx
+
+    def winfo_rootx(self):
+        """Return x-coordinate of cell's left edge on the screen."""
+        return self.renderer.tree.winfo_rootx() + self._get_bbox()[0]
+
+    def winfo_rooty(self):
+        """Return y-coordinate of cell's top edge on the screen."""
+        return self.renderer.tree.winfo_rooty() + self._get_bbox()[1]
+
+    def winfo_width(self):
+        """Return width of cell in Treeview."""
+        return self._get_bbox()[2]
+
+
+class TreeviewRenderer:
+    """Mixin for DataGridBase subclasses to display rows in a ttk.Treeview.
+
+    The Frame for row widgets used by DataGridBase is replaced on the
+    canvas by a Treeview, in the tree attribute, sized to the canvas.
+
+    """
+
+    def __init__(self, **kwargs):
+        """Extend to display header and data rows in a ttk.Treeview."""
+        super().__init__(**kwargs)
+        self.cell_pool_size = CELL_POOL_SIZE
+        self._gridded_cells = dict()
+        self._cell_pool = []
+        self._font = None
+        self._row_height = None
+        self._layout_width = 0
+        self._columns = ()
+        self._heading_cells = {}
+        self._cells_by_item = {}
+        self._row_items = []
+        self._attached_items = 0
+        self._background_tags = {}
+        self._tree_sequences = set()
+        self._pointer_item = None
+        self._funcids = itertools.count()
+        canvas = self.gcanvas
+        for item in canvas.find_all():
+            if canvas.type(item) == "window":
+                canvas.delete(item)
+        self.tree = self.make_treeview()
+        self._tree_window = canvas.create_window(
+            0, 0, window=self.tree, anchor=tkinter.NW
+        )
+
+        # The class bindings, which give the Treeview focus on click, are
+        # done before the cell bindings which give focus to the grid.  The
+        # canvas bindings apply to the Treeview because it covers the canvas.
+        tags = list(self.tree.bindtags())
+        tags[:2] = tags[1], tags[0]
+        tags.insert(2, str(canvas))
+        self.tree.bindtags(tuple(tags))
+        self.bind(self.tree, "<Motion>", function=self._track_pointer_item)
+        self.bind(self.tree, "<Leave>", function=self._leave_tree)
+
+    def add_widget_to_spare_pool(self, widget):
+        """Extend to keep cells for reuse, or discard them if pool is full."""
+        if not isinstance(widget, TreeviewCell):
+            super().add_widget_to_spare_pool(widget)
+            return
+        self._gridded_cells.pop(widget, None)
+        if len(self._cell_pool) >= self.cell_pool_size:
+            widget.destroy()
+            return
+        widget.reset()
+        self._cell_pool.append(widget)
+
+    def bind_handler(self, widget, sequence, function):
+        """Override to bind sequence for cells to the grid's handler.
+
+        Cells call Python functions rather than Tcl scripts.
+
+        """
+        if not isinstance(widget, TreeviewCell):
+            super().bind_handler(widget, sequence, function)
+            return
+        widget.bind(sequence=sequence, func=self.get_handler(function))
+
+    def bind_tree_sequence(self, sequence):
+        """Bind sequence on the Treeview to call the bindings of cells."""
+        if sequence in self._tree_sequences:
+            return
+        if sequence in _CROSSING_SEQUENCES:
+            return
+        self._tree_sequences.add(sequence)
+        self.bind(
+            self.tree,
+            sequence,
+            function=functools.partial(self._dispatch_event, sequence),
+            add=True,
+        )
+
+    def get_background_tag(self, background):
+        """Return Treeview tag for background colour, configured once."""
+        tag = self._background_tags.get(background)
+        if tag is None:
+            tag = "".join(("background", str(len(self._background_tags))))
+            self.tree.tag_configure(tag, background=background)
+            self._background_tags[background] = tag
+        return tag
+
+    def get_cell_bbox(self, cell):
+        """Return x, y, width, and height, of cell in the Treeview."""
+        if cell.item is None:
+            return (0, 0, 0, 0)
+        bbox = self.tree.bbox(cell.item, column=_column_id(cell.column))
+        if not bbox:
+            return (0, 0, 0, 0)
+        return bbox
+
+    def get_cell_funcid(self):
+        """Return identifier for a binding of a cell."""
+        return "".join(("cell", str(next(self._funcids))))
+
+    def get_font(self):
+        """Return tkinter.font.Font used to show values in the Treeview."""
+        if self._font is None:
+            font = tkinter.ttk.Style(master=self.tree).lookup(
+                "Treeview", "font"
+            )
+            self._font = tkinter.font.Font(
+                root=self.tree, font=font or "TkDefaultFont"
+            )
+        return self._font
+
+    def get_row_height(self):
+        """Return height of a row in the Treeview."""
+        if self._row_height is None:
+            height = tkinter.ttk.Style(master=self.tree).lookup(
+                "Treeview", "rowheight"
+            )
+            try:
+                self._row_height = int(height)
+            except ValueError:
+                self._row_height = self.get_font().metrics("linespace")
+        return self._row_height
+
+    def get_spare_row_widget(self, widget_type=tkinter.Label):
+        """Return a cell from the pool, or a new cell if pool is empty.
+
+        A cell is returned whatever widget_type is given.
+
+        """
+        if self._cell_pool:
+            return self._cell_pool.pop()
+        return TreeviewCell(self)
+
+    def layout_cells(self):
+        """Show gridded cells as headings and items in the Treeview."""
+        tree = self.tree
+        header_count = self._header_row_count
+        rows = {}
+        widths = {}
+        for cell in self._gridded_cells:
+            row = cell.grid_info.get("row", 0)
+            column = cell.grid_info.get("column", 0)
+            cell.column = column
+            rows.setdefault(row, {})[column] = cell
+            widths[column] = max(widths.get(column, 0), cell.winfo_reqwidth())
+        columns = tuple(sorted(widths))
+        if columns != self._columns:
+            identifiers = [_column_id(c) for c in columns]
+            tree.configure(columns=identifiers, displaycolumns=identifiers)
+            self._columns = columns
+        self._heading_cells = rows.get(0, {}) if header_count else {}
+        for column in columns:
+            cell = self._heading_cells.get(column)
+            tree.column(
+                _column_id(column), width=widths[column], stretch=False
+            )
+            tree.heading(
+                _column_id(column),
+                text="" if cell is None else str(cell.cget("text")),
+            )
+        data_rows = [rows[r] for r in sorted(rows) if r >= header_count]
+        row_items = self._row_items
+        while len(row_items) < len(data_rows):
+            row_items.append(tree.insert("", tkinter.END))
+        self._cells_by_item = {}
+        for index, row in enumerate(data_rows):
+            item = row_items[index]
+            cells = [row[c] for c in columns if c in row]
+            for cell in cells:
+                cell.item = item
+            self._cells_by_item[item] = row
+            tree.item(
+                item,
+                values=[
+                    str(row[c].cget("text")) if c in row else ""
+                    for c in columns
+                ],
+                tags=(self.get_background_tag(cells[0].cget("background")),),
+            )
+            if index >= self._attached_items:
+                tree.move(item, "", index)
+        if len(data_rows) < self._attached_items:
+            tree.detach(*row_items[len(data_rows) : self._attached_items])
+        self._attached_items = len(data_rows)
+        self._pointer_item = None
+        self._layout_width = sum(widths.values())
+        canvas = self.gcanvas
+        canvas.itemconfigure(
+            self._tree_window,
+            width=max(self._layout_width, canvas.winfo_width()),
+            height=canvas.winfo_height(),
+        )
+
+    def make_treeview(self):
+        """Return ttk.Treeview for rows, on canvas, with no tree column.
+
+        Subclasses may override this method to set style or font options.
+
+        """
+        return tkinter.ttk.Treeview(
+            master=self.gcanvas,
+            show="headings",
+            selectmode="none",
+            takefocus=False,
+        )
+
+    def note_forgotten_cell(self, cell):
+        """Remove cell from cells displayed by layout_cells."""
+        self._gridded_cells.pop(cell, None)
+
+    def note_gridded_cell(self, cell):
+        """Add cell to cells displayed by layout_cells."""
+        self._gridded_cells[cell] = None
+
+    def set_cell_background(self, cell):
+        """Set background of row displaying cell to cell's background."""
+        self.tree.item(
+            cell.item, tags=(self.get_background_tag(cell.cget("background")),)
+        )
+
+    def set_cell_text(self, cell):
+        """Set value of column displaying cell to cell's text."""
+        self.tree.set(
+            cell.item,
+            column=_column_id(cell.column),
+            value=cell.cget("text"),
+        )
+
+    def show_popup_menu_no_row(self, event=None):
+        """Extend to ignore events on the Treeview over a row.
+
+        Events on a row are seen by the cell bindings and then by the canvas
+        bindings.
+
+        """
+        if self._get_pointer_item():
+            return
+        super().show_popup_menu_no_row(event=event)
+
+    def _call_cell_bindings(self, cell, sequence, event):
+        """Call cell's bindings for sequence with event."""
+        event.widget = cell
+        for func in list(cell.bindings.get(sequence, {}).values()):
+            if func(event) == "break":
+                return "break"
+        return None
+
+    def _call_row_bindings(self, item, sequence, event):
+        """Call first binding for sequence of cells in row for item."""
+        for cell in self._cells_by_item.get(item, {}).values():
+            if cell.bindings.get(sequence):
+                return self._call_cell_bindings(cell, sequence, event)
+        return None
+
+    def _dispatch_event(self, sequence, event):
+        """Call bindings for sequence of cell at event's x and y."""
+        tree = self.tree
+        region = tree.identify_region(event.x, event.y)
+        if region == "heading":
+            cells = self._heading_cells
+        else:
+            cells = self._cells_by_item.get(tree.identify_row(event.y), {})
+        try:
+            index = int(tree.identify_column(event.x).lstrip("#")) - 1
+            cell = cells[self._columns[index]]
+        except (IndexError, KeyError, ValueError):
+            return None
+        return self._call_cell_bindings(cell, sequence, event)
+
+    def _get_background_script(self, widget, background):
+        """Override to return Tcl command to set background of a row.
+
+        The command is returned for the first cell in the row only.
+
+        """
+        if not isinstance(widget, TreeviewCell):
+            return super()._get_background_script(widget, background)
+        widget.options["background"] = background
+        if widget.item is None:
+            return ""
+        for cell in self._cells_by_item[widget.item].values():
+            if cell is not widget:
+                return ""
+            break
+        return "".join(
+            (
+                str(self.tree),
+                " item ",
+                widget.item,
+                " -tags {",
+                self.get_background_tag(background),
+                "}",
+            )
+        )
+
+    def _get_gridded_widgets(self):
+        """Override to return gridded cells."""
+        return list(self._gridded_cells)
+
+    def _get_key_under_pointer(self, keys):
+        """Override to return key in keys of row under pointer."""
+        item = self._get_pointer_item()
+        if not item:
+            return None
+        for key in keys:
+            for row_widget in self.get_row_widgets(key):
+                cell = row_widget[0]
+                if isinstance(cell, TreeviewCell) and cell.item == item:
+                    return key
+        return None
+
+    def _get_pointer_item(self):
+        """Return Treeview item under the pointer or an empty string."""
+        tree = self.tree
+        pointerx, pointery = self.get_pointerxy()
+        try:
+            if tree.winfo_containing(pointerx, pointery) is not tree:
+                return ""
+        except KeyError:
+            return ""
+        return tree.identify_row(pointery - tree.winfo_rooty())
+
+    def _get_scrollregion_width(self):
+        """Override to return width of columns in last layout."""
+        return self._layout_width
+
+    def _is_row_event_delegation_used(self):
+        """Override to return False because cells do not have bindtags.
+
+        Each cell is bound by bind_handler whatever the value of the
+        delegate_row_events attribute.
+
+        """
+        return False
+
+    def _layout_grid(self):
+        """Override to show the header and data cells after gridding."""
+        self.layout_cells()
+
+    def _leave_tree(self, event):
+        """Call <Leave> bindings for row under pointer on leaving Treeview."""
+        if self._pointer_item:
+            self._call_row_bindings(self._pointer_item, "<Leave>", event)
+        self._pointer_item = None
+
+    def _track_pointer_item(self, event):
+        """Call <Leave> and <Enter> bindings when pointer moves to new row."""
+        tree = self.tree
+        item = ""
+        if tree.identify_region(event.x, event.y) == "cell":
+            item = tree.identify_row(event.y)
+        if item == self._pointer_item:
+            return
+        if self._pointer_item:
+            self._call_row_bindings(self._pointer_item, "<Leave>", event)
+        self._pointer_item = item
+        if item:
+            self._call_row_bindings(item, "<Enter>", event)
+
+
+def _column_id(column):
+    """Return Treeview column identifier for grid column number column."""
+    return "".join(("column", str(column)))
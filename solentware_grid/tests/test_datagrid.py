@@ -9,6 +9,7 @@ import tkinter
 import sys
 
 from .. import datagrid
+from ..gui import datarow
 
 
 class _DataGridBase(unittest.TestCase):
@@ -71,10 +72,15 @@ class _DataGridBase(unittest.TestCase):
 
         class Datasource:
             dbhome = self.Dbhome()
+            dbset = None
+            dbname = None
 
             def get_cursor(self):
                 return Cursor()
 
+            def record_count_key(self, partial):
+                return (self.dbset, self.dbname, partial)
+
         self.Datasource = Datasource
 
         def header_maker(*a):
@@ -128,6 +134,18 @@ class _DataGridBase(unittest.TestCase):
             def set_popup_state(*a, **k):
                 pass
 
+            def unbind_row_widgets(*a):
+                pass
+
+            def set_current_row_background(*a):
+                pass
+
+            def is_background_painted(*a):
+                return False
+
+            def set_painted_background(*a):
+                pass
+
         self.Datarow = Datarow
 
         class Widget:
@@ -148,6 +166,45 @@ class _DataGridBase(unittest.TestCase):
     def tearDown(self):
         self.parent.destroy()
 
+    def position_estimator(self):
+        class Estimator:
+            refine = False
+            source = None
+            building = None
+            builds = 0
+            steps = 0
+
+            def is_valid(self, source):
+                return self.source == source
+
+            def is_building(self, source):
+                return self.building == source
+
+            def start_build(self, cursor, source):
+                self.builds += 1
+                self.building = source
+
+            def continue_build(self, cursor):
+                self.steps += 1
+                if self.steps < 2:
+                    return False
+                self.source = self.building
+                self.building = None
+                return True
+
+            def estimate_position(self, record):
+                return None if record == "unknown" else 7
+
+            def nearest_checkpoint(self, position):
+                return ("key", position), 1
+
+        self.datagridinstance.datasource = self.Datasource()
+        self.datagridinstance.make_client_cursor()
+        estimator = Estimator()
+        estimator.source = (self.datagridinstance.datasource, None)
+        self.datagridinstance.position_estimator = estimator
+        return estimator
+
 
 class DataGridBase___init_____del___ignored(_DataGridBase):
     # For solentware_bind.gui.bindings.Bindings.__del__ attributes referenced.
@@ -265,32 +322,47 @@ class DataGridBase(_DataGridBase):
             self.datagridinstance.add_widget_to_spare_pool,
         )
 
-    # spare widget pool disabled so len(_spare_rows) always 0.
     def test_005_add_widget_to_spare_pool_002(self):
         self.assertEqual(self.datagridinstance._spare_rows, {})
         self.assertEqual(
-            self.datagridinstance.add_widget_to_spare_pool(self.Widget()), None
+            self.datagridinstance.add_widget_to_spare_pool(
+                tkinter.Label(master=self.datagridinstance.data, text="a")
+            ),
+            None,
+        )
+        self.assertEqual(len(self.datagridinstance._spare_rows), 1)
+        self.assertEqual(
+            len(self.datagridinstance._spare_rows[tkinter.Label]), 1
         )
-        # self.assertEqual(len(self.datagridinstance._spare_rows), 1)
-        # self.assertEqual(
-        #    len(self.datagridinstance._spare_rows[self.Widget]), 1
-        # )
-        self.assertEqual(len(self.datagridinstance._spare_rows), 0)
+        widget = self.datagridinstance.get_spare_row_widget()
+        self.assertEqual(widget.cget("text"), "")
         self.assertEqual(
-            self.Widget in self.datagridinstance._spare_rows, False
+            self.datagridinstance.add_widget_to_spare_pool(widget), None
         )
         self.assertEqual(
-            self.datagridinstance.add_widget_to_spare_pool(self.Widget()), None
+            self.datagridinstance.add_widget_to_spare_pool(
+                tkinter.Label(master=self.datagridinstance.data)
+            ),
+            None,
         )
-        # self.assertEqual(len(self.datagridinstance._spare_rows), 1)
-        # self.assertEqual(
-        #     len(self.datagridinstance._spare_rows[self.Widget]), 2
-        # )
-        self.assertEqual(len(self.datagridinstance._spare_rows), 0)
+        self.assertEqual(len(self.datagridinstance._spare_rows), 1)
         self.assertEqual(
-            self.Widget in self.datagridinstance._spare_rows, False
+            len(self.datagridinstance._spare_rows[tkinter.Label]), 2
         )
 
+    def test_005_add_widget_to_spare_pool_003(self):
+        widgets = [
+            tkinter.Label(master=self.datagridinstance.data)
+            for i in range(datagrid.SPARE_WIDGET_POOL_SIZE + 1)
+        ]
+        for widget in widgets:
+            self.datagridinstance.add_widget_to_spare_pool(widget)
+        self.assertEqual(
+            len(self.datagridinstance._spare_rows[tkinter.Label]),
+            datagrid.SPARE_WIDGET_POOL_SIZE,
+        )
+        self.assertEqual(widgets[-1].winfo_exists(), 0)
+
     def test_006_bind_off_001(self):
         self.assertRaisesRegex(
             TypeError,
@@ -697,6 +769,14 @@ class DataGridBase(_DataGridBase):
     def test_029_focus_set_frame_002(self):
         self.assertEqual(self.datagridinstance.focus_set_frame(), None)
 
+    def test_029_focus_set_frame_003(self):
+        calls = []
+        self.datagridinstance.frame.winfo_viewable = lambda: True
+        self.datagridinstance._deferred_refresh = lambda: calls.append(1)
+        self.assertEqual(self.datagridinstance.focus_set_frame(), None)
+        self.assertEqual(calls, [1])
+        self.assertEqual(self.datagridinstance._deferred_refresh, None)
+
     def test_030_focus_set_grid_on_click_child_widget_001(self):
         self.assertRaisesRegex(
             TypeError,
@@ -737,6 +817,13 @@ class DataGridBase(_DataGridBase):
             (0, 0, 0),
         )
 
+    def test_031_get_client_item_and_record_counts_003(self):
+        self.datagridinstance.datasource = self.Datasource()
+        self.datagridinstance.get_client_item_and_record_counts()
+        self.assertEqual(
+            self.datagridinstance.record_counts, {(None, None, None): 0}
+        )
+
     def test_032_get_client_item_count_001(self):
         self.assertRaisesRegex(
             TypeError,
@@ -1262,6 +1349,14 @@ class DataGridBase(_DataGridBase):
         self.datagridinstance.header_maker = self.header_maker
         self.assertEqual(self.datagridinstance.on_configure_canvas(), None)
 
+    def test_054_on_configure_canvas_002(self):
+        calls = []
+        self.datagridinstance.frame.winfo_viewable = lambda: True
+        self.datagridinstance._deferred_refresh = lambda: calls.append(1)
+        self.assertEqual(self.datagridinstance.on_configure_canvas(), None)
+        self.assertEqual(calls, [1])
+        self.assertEqual(self.datagridinstance._deferred_refresh, None)
+
     def test_055_on_data_change_001(self):
         self.assertRaisesRegex(
             TypeError,
@@ -1322,6 +1417,68 @@ class DataGridBase(_DataGridBase):
             self.datagridinstance.on_data_change(Instance()), None
         )
 
+    def test_055_on_data_changes_001(self):
+        class Instance:
+            def __init__(self, newrecord):
+                self.newrecord = newrecord
+
+            def get_keys(*a):
+                return []
+
+        self.datagridinstance.datasource = self.Datasource()
+        self.datagridinstance.header_maker = self.header_maker
+        self.datagridinstance.record_count = 10
+        self.assertEqual(
+            self.datagridinstance.on_data_changes(
+                [Instance(None), Instance(False)]
+            ),
+            None,
+        )
+        self.assertEqual(self.datagridinstance.record_count, None)
+
+    def test_055_on_data_change_out_of_view_001(self):
+        class Instance:
+            newrecord = False
+
+            def get_keys(*a):
+                return [("k", 1)]
+
+        self.datagridinstance.datasource = self.Datasource()
+        self.datagridinstance.record_count = 10
+        self.datagridinstance.keys.append(("a", 1))
+        self.assertEqual(
+            self.datagridinstance.on_data_change_out_of_view(Instance()),
+            None,
+        )
+        self.assertEqual(self.datagridinstance.record_count, None)
+        self.assertEqual(self.datagridinstance.keys, [("a", 1)])
+
+    def test_055_on_data_change_out_of_view_002(self):
+        class Newrecord:
+            def get_keys(*a):
+                return [("k", 2)]
+
+        class Instance:
+            def __init__(self, newrecord):
+                self.newrecord = newrecord
+
+            def get_keys(*a):
+                return [("k", 1)]
+
+        dgi = self.datagridinstance
+        dgi.datasource = self.Datasource()
+        for newrecord in (False, Newrecord(), None):
+            dgi.bookmarks.add(("k", 1))
+            dgi.bookmarks.add(("b", 1))
+            dgi.selection = [("k", 1), ("s", 1)]
+            dgi.on_data_change_out_of_view(Instance(newrecord))
+            if newrecord is False:
+                self.assertEqual(dgi.bookmarks, [("b", 1), ("k", 1)])
+                self.assertEqual(dgi.selection, [("k", 1), ("s", 1)])
+            else:
+                self.assertEqual(dgi.bookmarks, [("b", 1)])
+                self.assertEqual(dgi.selection, [("s", 1)])
+
     def test_056_reverse_add_record_direction_001(self):
         self.assertRaisesRegex(
             TypeError,
@@ -1826,6 +1983,14 @@ class DataGridBase(_DataGridBase):
         self.datagridinstance.datasource = self.Datasource()
         self.assertEqual(self.datagridinstance.set_yscrollbar(), None)
 
+    def test_070_set_yscrollbar_004(self):
+        estimator = self.position_estimator()
+        estimator.refine = True
+        self.datagridinstance.set_yscrollbar()
+        self.assertNotEqual(
+            self.datagridinstance._refine_yscrollbar_pending, None
+        )
+
     def test_071_set_xview_001(self):
         self.assertRaisesRegex(
             TypeError,
@@ -1942,6 +2107,20 @@ class DataGridBase(_DataGridBase):
         self.assertEqual(
             self.datagridinstance.set_yview(scroll="moveto", number=10), None
         )
+        self.assertEqual(self.datagridinstance.vsbar_number, 10)
+        self.assertEqual(self.datagridinstance._slider_preview_pending, None)
+
+    def test_072_set_yview_012(self):
+        self.datagridinstance.keys.append("key")
+        self.datagridinstance.slider_preview_interval = 50
+        self.datagridinstance.set_yview(scroll="moveto", number=0.2)
+        pending = self.datagridinstance._slider_preview_pending
+        self.assertNotEqual(pending, None)
+        self.datagridinstance.set_yview(scroll="moveto", number=0.4)
+        self.assertEqual(self.datagridinstance.vsbar_number, 0.4)
+        self.assertEqual(
+            self.datagridinstance._slider_preview_pending, pending
+        )
 
     def test_073_select_row_by_click_001(self):
         self.assertRaisesRegex(
@@ -2247,6 +2426,209 @@ class DataGridBase(_DataGridBase):
         self.assertEqual(self.datagridinstance.clear_selections(), None)
         self.assertEqual(len(self.datagridinstance.selection), 0)
 
+    def test_087_add_row_to_spare_pool_001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"add_row_to_spare_pool\(\) missing 1 required ",
+                    "positional argument: 'row'$",
+                )
+            ),
+            self.datagridinstance.add_row_to_spare_pool,
+        )
+
+    def test_087_add_row_to_spare_pool_002(self):
+        class Datarow(self.Datarow):
+            def __init__(self, widgets):
+                self.widgets = widgets
+
+            def __call__(self):
+                return (self.widgets,)
+
+            def unbind_row_widgets(self):
+                self.widgets = ()
+
+        widgets = [
+            (tkinter.Label(master=self.datagridinstance.data), {}),
+            (tkinter.Label(master=self.datagridinstance.data), {}),
+        ]
+        row = Datarow(widgets)
+        self.assertEqual(
+            self.datagridinstance.add_row_to_spare_pool(row), None
+        )
+        self.assertEqual(row.widgets, ())
+        self.assertEqual(
+            self.datagridinstance._spare_rows[tkinter.Label],
+            set(w[0] for w in widgets),
+        )
+
+    def test_088__get_fresh_widget_configuration_001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"_get_fresh_widget_configuration\(\) missing 1 ",
+                    "required positional argument: 'widget'$",
+                )
+            ),
+            self.datagridinstance._get_fresh_widget_configuration,
+        )
+
+    def test_088__get_fresh_widget_configuration_002(self):
+        widget = tkinter.Label(
+            master=self.datagridinstance.data, text="a", background="red"
+        )
+        configuration = (
+            self.datagridinstance._get_fresh_widget_configuration(widget)
+        )
+        self.assertEqual(configuration["text"], "")
+        self.assertEqual("bg" in configuration, False)
+        self.assertIs(
+            self.datagridinstance._fresh_widget_configuration[tkinter.Label],
+            configuration,
+        )
+        self.assertIs(
+            self.datagridinstance._get_fresh_widget_configuration(widget),
+            configuration,
+        )
+
+    def test_090__schedule_fill_readahead_001(self):
+        self.assertEqual(self.datagridinstance.readahead, 0)
+        self.assertEqual(
+            self.datagridinstance._schedule_fill_readahead(), None
+        )
+        self.assertEqual(self.datagridinstance._fill_readahead_pending, None)
+
+    def test_090__schedule_fill_readahead_002(self):
+        self.datagridinstance.readahead = 5
+        self.assertEqual(
+            self.datagridinstance._schedule_fill_readahead(), None
+        )
+        pending = self.datagridinstance._fill_readahead_pending
+        self.assertNotEqual(pending, None)
+        self.datagridinstance._schedule_fill_readahead()
+        self.assertEqual(
+            self.datagridinstance._fill_readahead_pending, pending
+        )
+
+    def test_091__fill_readahead_when_idle_001(self):
+        self.datagridinstance._fill_readahead_pending = "id"
+        self.datagridinstance.readahead_objects["key"] = self.Datarow()
+        self.datagridinstance.start_readahead()
+        self.assertEqual(
+            self.datagridinstance._fill_readahead_when_idle(), None
+        )
+        self.assertEqual(self.datagridinstance._fill_readahead_pending, None)
+        self.assertEqual(self.datagridinstance.readahead_objects, {})
+
+    def test_091__fill_readahead_when_idle_002(self):
+        steps = []
+
+        def continue_readahead():
+            steps.append(True)
+            return len(steps) > 1
+
+        self.datagridinstance.continue_readahead = continue_readahead
+        self.datagridinstance._fill_readahead_pending = "id"
+        self.datagridinstance._fill_readahead_when_idle()
+        self.assertEqual(len(steps), 1)
+        self.assertNotEqual(
+            self.datagridinstance._fill_readahead_pending, None
+        )
+        self.datagridinstance._fill_readahead_when_idle()
+        self.assertEqual(len(steps), 2)
+        self.assertEqual(self.datagridinstance._fill_readahead_pending, None)
+
+    def test_095_estimate_position_of_record_001(self):
+        estimator = self.position_estimator()
+        self.assertEqual(
+            self.datagridinstance.estimate_position_of_record("key"), 7
+        )
+        self.assertEqual(
+            self.datagridinstance.estimate_position_of_record("unknown"), 0
+        )
+        self.assertEqual(estimator.builds, 0)
+
+    def test_095_estimate_position_of_record_002(self):
+        estimator = self.position_estimator()
+        estimator.source = None
+        self.assertEqual(
+            self.datagridinstance.estimate_position_of_record("key"), 0
+        )
+        self.assertNotEqual(
+            self.datagridinstance._build_position_estimator_pending, None
+        )
+
+    def test_096_estimate_record_at_position_001(self):
+        self.position_estimator()
+        self.assertEqual(
+            self.datagridinstance.estimate_record_at_position(3), ("key", 3)
+        )
+
+    def test_096_estimate_record_at_position_002(self):
+        estimator = self.position_estimator()
+        estimator.source = None
+        self.assertEqual(
+            self.datagridinstance.estimate_record_at_position(3), None
+        )
+
+    def test_097__validate_position_estimator_001(self):
+        estimator = self.position_estimator()
+        self.assertEqual(
+            self.datagridinstance._validate_position_estimator(), True
+        )
+        self.assertEqual(
+            self.datagridinstance._build_position_estimator_pending, None
+        )
+        self.datagridinstance.partial = "p"
+        self.assertEqual(
+            self.datagridinstance._validate_position_estimator(), False
+        )
+        pending = self.datagridinstance._build_position_estimator_pending
+        self.assertNotEqual(pending, None)
+        self.datagridinstance._validate_position_estimator()
+        self.assertEqual(
+            self.datagridinstance._build_position_estimator_pending, pending
+        )
+        self.assertEqual(estimator.builds, 0)
+
+    def test_097__build_position_estimator_when_idle_001(self):
+        estimator = self.position_estimator()
+        self.datagridinstance.partial = "p"
+        self.datagridinstance._build_position_estimator_pending = "id"
+        self.assertEqual(
+            self.datagridinstance._build_position_estimator_when_idle(), None
+        )
+        self.assertEqual(estimator.builds, 1)
+        self.assertNotEqual(
+            self.datagridinstance._build_position_estimator_pending, "id"
+        )
+        self.assertNotEqual(
+            self.datagridinstance._build_position_estimator_pending, None
+        )
+        self.datagridinstance._build_position_estimator_when_idle()
+        self.assertEqual(estimator.builds, 1)
+        self.assertEqual(
+            self.datagridinstance._build_position_estimator_pending, None
+        )
+        self.assertEqual(
+            estimator.source, (self.datagridinstance.datasource, "p")
+        )
+
+    def test_098_refine_yscrollbar_001(self):
+        self.datagridinstance._refine_yscrollbar_pending = "id"
+        self.assertEqual(self.datagridinstance.refine_yscrollbar(), None)
+        self.assertEqual(
+            self.datagridinstance._refine_yscrollbar_pending, None
+        )
+
+    def test_098_refine_yscrollbar_002(self):
+        self.datagridinstance.datasource = self.Datasource()
+        self.assertEqual(self.datagridinstance.refine_yscrollbar(), None)
+        self.assertEqual(self.datagridinstance.record_count, 0)
+        self.assertEqual(self.datagridinstance.vsbar.get(), (0.0, 1.0))
+
 
 class DataGridBase_bookmark_down_bookmark_up(_DataGridBase):
     def setUp(self):
@@ -2440,8 +2822,94 @@ class DataGridBase_on_data_change_instance_is_None(_DataGridBase):
         self.datagridinstance.fill_data_grid = self.null_method
 
     def test_055_on_data_change_003(self):
+        self.datagridinstance.defer_refresh_while_hidden = False
+        self.datagridinstance.keys.append(("key", None))
+        self.assertEqual(self.datagridinstance.on_data_change(None), None)
+
+    def test_055_on_data_change_004(self):
+        self.datagridinstance.defer_refresh_while_hidden = True
+        self.datagridinstance.frame.winfo_viewable = lambda: False
         self.datagridinstance.keys.append(("key", None))
         self.assertEqual(self.datagridinstance.on_data_change(None), None)
+        self.assertIsNot(self.datagridinstance.dirty_since, None)
+        self.assertEqual(
+            self.datagridinstance._deferred_refresh,
+            self.datagridinstance._refill_after_data_change,
+        )
+
+    def test_055_on_data_change_005(self):
+        class Instance:
+            newrecord = None
+
+            def get_keys(*a):
+                return [("key", None)]
+
+        dgi = self.datagridinstance
+        dgi.defer_refresh_while_hidden = True
+        dgi.frame.winfo_viewable = lambda: False
+        dgi.keys.append(("key", None))
+        dgi.bookmarks.add(("key", None))
+        dgi.selection = [("key", None)]
+        self.assertEqual(dgi.on_data_change(Instance()), None)
+        self.assertEqual(
+            dgi._deferred_refresh, dgi._refill_after_data_change
+        )
+        self.assertEqual(dgi.bookmarks, [])
+        self.assertEqual(dgi.selection, [])
+
+    def test_055_on_data_changes_002(self):
+        class Instance:
+            newrecord = None
+
+            def get_keys(*a):
+                return [("key", None)]
+
+        dgi = self.datagridinstance
+        dgi.defer_refresh_while_hidden = True
+        dgi.frame.winfo_viewable = lambda: False
+        dgi.bookmarks.add(("key", None))
+        dgi.selection = [("key", None)]
+        self.assertEqual(dgi.on_data_changes([Instance()]), None)
+        self.assertEqual(dgi.bookmarks, [])
+        self.assertEqual(dgi.selection, [])
+
+    def test_105_on_map_grid_001(self):
+        calls = []
+        frame = self.datagridinstance.frame
+        frame.winfo_viewable = lambda: False
+        self.datagridinstance._deferred_refresh = lambda: calls.append(1)
+        self.datagridinstance.dirty_since = 1
+        self.assertEqual(self.datagridinstance.on_map_grid(), None)
+        self.assertEqual(calls, [])
+        frame.winfo_viewable = lambda: True
+        self.assertEqual(self.datagridinstance.on_map_grid(), None)
+        self.assertEqual(calls, [1])
+        self.assertEqual(self.datagridinstance._deferred_refresh, None)
+        self.assertEqual(self.datagridinstance.dirty_since, None)
+
+    def test_106__defer_refresh_001(self):
+        grid = self.datagridinstance
+        grid.defer_refresh_while_hidden = True
+        grid.frame.winfo_viewable = lambda: False
+        refill = grid._refill_after_data_change
+        self.assertEqual(grid._defer_refresh(refill), True)
+        dirty_since = grid.dirty_since
+        self.assertEqual(grid._defer_refresh(grid.load_new_index), True)
+        self.assertEqual(grid._defer_refresh(refill), True)
+        self.assertEqual(grid._deferred_refresh, grid.load_new_index)
+        self.assertEqual(grid.dirty_since, dirty_since)
+        grid.frame.winfo_viewable = lambda: True
+        self.assertEqual(grid._defer_refresh(grid.load_new_index), False)
+        self.assertEqual(grid._deferred_refresh, None)
+        self.assertEqual(grid._defer_refresh(refill), False)
+
+    def test_106__defer_refresh_002(self):
+        grid = self.datagridinstance
+        self.assertEqual(grid.defer_refresh_while_hidden, False)
+        grid.frame.winfo_viewable = lambda: False
+        self.assertEqual(
+            grid._defer_refresh(grid._refill_after_data_change), False
+        )
 
 
 class DataGridBase_select_down_select_up(_DataGridBase):
@@ -2552,6 +3020,111 @@ class DataGridBase_set_properties(_DataGridBase):
         self.datagridinstance.selection.append("key")
         self.assertEqual(self.datagridinstance.set_properties("key"), True)
 
+    def test_103_set_keys_properties_001(self):
+        calls = []
+
+        class Datarow(self.Datarow):
+            def set_background_bookmark(self, widgets):
+                calls.append("bookmark")
+
+            def set_background_normal(self, widgets):
+                calls.append("normal")
+
+        self.datagridinstance.objects["key"] = Datarow()
+        self.datagridinstance.bookmarks.append("key")
+        self.assertEqual(
+            self.datagridinstance.set_keys_properties(["key", "key", "k2"]),
+            None,
+        )
+        self.datagridinstance.bookmarks.remove("key")
+        self.datagridinstance.set_keys_properties(["key"])
+        self.assertEqual(calls, ["bookmark", "normal"])
+
+    def test_103_set_keys_properties_002(self):
+        class Datarow(datagrid.DataRow):
+            pass
+
+        widget = tkinter.Label(master=self.datagridinstance.data)
+        row = Datarow()
+        row._row_widgets = [(widget, None)]
+        self.datagridinstance.objects["key"] = row
+        self.datagridinstance.gridrows_for_key["key"] = row
+        self.datagridinstance.selection.append("key")
+        self.datagridinstance.set_keys_properties(["key"])
+        self.assertEqual(widget.cget("background"), datagrid.SELECTION_COLOUR)
+        self.assertEqual(
+            row.is_background_painted(datagrid.SELECTION_COLOUR), True
+        )
+        widget.configure(background="red")
+        self.datagridinstance.set_keys_properties(["key"])
+        self.assertEqual(widget.cget("background"), "red")
+
+    def test_103_set_keys_properties_003(self):
+        calls = []
+
+        class DGC(datagrid.DataGridBase):
+            def set_properties(self, key, dodefaultaction=True):
+                calls.append(key)
+                return True
+
+        self.datagridinstance.__class__ = DGC
+        self.datagridinstance.keys.extend(["k1", "k2"])
+        self.assertEqual(
+            self.datagridinstance.set_keys_properties(
+                ["k2", "k1", "k2", "k3"]
+            ),
+            None,
+        )
+        self.assertEqual(calls, ["k2", "k1"])
+
+    def test_103_set_keys_properties_004(self):
+        calls = []
+
+        class Datarow(datagrid.DataRow):
+            def set_background_selection(self, widgets):
+                calls.append("selection")
+                for widget in widgets:
+                    widget[0].configure(background="red")
+
+        widget = tkinter.Label(master=self.datagridinstance.data)
+        row = Datarow()
+        row._row_widgets = [(widget, None)]
+        self.datagridinstance.objects["key"] = row
+        self.datagridinstance.gridrows_for_key["key"] = row
+        normal = datagrid._ROW_STATE_BACKGROUNDS["normal"]
+        self.datagridinstance.set_keys_properties(["key"])
+        self.assertEqual(widget.cget("background"), normal)
+        self.datagridinstance.selection.append("key")
+        self.datagridinstance.set_keys_properties(["key"])
+        self.datagridinstance.set_keys_properties(["key"])
+        self.assertEqual(calls, ["selection", "selection"])
+        self.assertEqual(widget.cget("background"), "red")
+        self.datagridinstance.selection.clear()
+        self.datagridinstance.set_keys_properties(["key"])
+        self.assertEqual(widget.cget("background"), normal)
+
+    def test_103__uses_default_set_properties_001(self):
+        class DGC(datagrid.DataGridBase):
+            def set_row_under_pointer_background(self, key):
+                pass
+
+        self.assertEqual(
+            self.datagridinstance._uses_default_set_properties(), True
+        )
+        self.datagridinstance.__class__ = DGC
+        self.assertEqual(
+            self.datagridinstance._uses_default_set_properties(), False
+        )
+
+    def test_104__get_key_under_pointer_001(self):
+        def get_pointerxy():
+            return (-10000, -10000)
+
+        self.datagridinstance.get_pointerxy = get_pointerxy
+        self.assertEqual(
+            self.datagridinstance._get_key_under_pointer(["key"]), None
+        )
+
     def test_068_set_row_005(self):
         self.assertEqual(len(self.datagridinstance.bookmarks), 0)
         self.assertEqual(len(self.datagridinstance.selection), 0)
@@ -2830,7 +3403,7 @@ class DataGridBase_fill_data_grid(_DataGridBase):
         # The intent is to have something sensible happen with 'cheight'.
         self.datagridinstance.keys = ["k1", "k2", "k3", "k4", "k5"]
         self.datagridinstance.objects = {
-            k: None for k in self.datagridinstance.keys
+            k: self.Datarow() for k in self.datagridinstance.keys
         }
 
         def row_maker():
@@ -2917,6 +3490,46 @@ class DataGridBase_fill_data_grid(_DataGridBase):
         self.assertEqual(len(self.datagridinstance.objects), 0)
         self.assertEqual(len(self.datagridinstance.gridrows_for_key), 0)
 
+    def test_018_fill_data_grid_008(self):
+        dgi = self.datagridinstance
+        headers = self.header_maker()
+        header = headers[0][0][0]
+        dgi.header_maker = lambda *a: headers
+        pooled = []
+        add_widget_to_spare_pool = dgi.add_widget_to_spare_pool
+
+        def spare_pool(widget):
+            pooled.append(widget)
+            add_widget_to_spare_pool(widget)
+
+        dgi.add_widget_to_spare_pool = spare_pool
+        dgi.fill_data_grid()
+        self.assertIs(dgi._header_rows, headers)
+        self.assertEqual(dgi._header_row_count, 1)
+        header_height = dgi._header_height
+        dgi._header_height = header_height + 1
+        dgi.fill_data_grid()
+        self.assertEqual(dgi._header_height, header_height + 1)
+        self.assertNotIn(header, pooled)
+        self.assertIn(header, dgi.data.grid_slaves())
+
+    def test_018_fill_data_grid_009(self):
+        dgi = self.datagridinstance
+        dgi.fill_data_grid()
+        header = dgi._header_rows[0][0][0]
+        dgi.fill_data_grid()
+        self.assertIsNot(dgi._header_rows[0][0][0], header)
+        self.assertNotIn(header, dgi.data.grid_slaves())
+        self.assertIn(dgi._header_rows[0][0][0], dgi.data.grid_slaves())
+
+    def test_018__get_header_widgets_001(self):
+        dgi = self.datagridinstance
+        self.assertEqual(dgi._get_header_widgets(None), set())
+        headers = self.header_maker()
+        self.assertEqual(
+            dgi._get_header_widgets(headers), {headers[0][0][0]}
+        )
+
 
 class DataGridBase__fill_down__fill_up(_DataGridBase):
     def setUp(self):
@@ -2999,6 +3612,659 @@ class DataGridBase__fill_down__fill_up(_DataGridBase):
         self.assertEqual(self.datagridinstance._fill_up([], 0), 19)
         self.assertEqual(self.datagridinstance.bottomkey, "key")
 
+    def _fixed_height_grid(self, records, fixed_row_height=True):
+        grid = self.datagridinstance
+        grid.fixed_row_height = fixed_row_height
+        measured = []
+
+        def _get_row_reqheight(rows):
+            measured.append(rows)
+            return 30
+
+        def _add_record_to_view():
+            if not records:
+                return None
+            key = records.pop(0)
+            grid.objects[key] = None
+            if grid.down:
+                grid.keys.append(key)
+            else:
+                grid.keys.insert(0, key)
+            return key
+
+        class Row:
+            def __call__(self):
+                return ()
+
+            def unbind_row_widgets(self):
+                pass
+
+        grid._get_row_reqheight = _get_row_reqheight
+        grid._add_record_to_view = _add_record_to_view
+        grid.set_row = lambda key: (None, key, {})
+        grid.make_row = lambda record: Row()
+        return measured
+
+    def test_081_fill_down_005(self):
+        measured = self._fixed_height_grid(["k1", "k2", "k3", "k4", "k5"])
+        rows = []
+        self.assertEqual(self.datagridinstance._fill_down(rows, 5), 95)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(len(measured), 1)
+        self.assertEqual(self.datagridinstance.keys, ["k1", "k2", "k3"])
+        self.assertEqual(self.datagridinstance.topkey, "k1")
+        self.assertEqual(self.datagridinstance.view_is_full, True)
+
+    def test_081_fill_down_006(self):
+        measured = self._fixed_height_grid(["k1", "k2"])
+        self.assertEqual(self.datagridinstance._fill_down([], 0), 60)
+        self.assertEqual(self.datagridinstance.keys, ["k1", "k2"])
+        self.assertEqual(self.datagridinstance.view_is_full, False)
+        self.datagridinstance.keys.clear()
+        self.assertEqual(self.datagridinstance._fill_down([], 0), 0)
+        self.assertEqual(len(measured), 1)
+
+    def test_081_fill_down_007(self):
+        self._fixed_height_grid(["k1", "k2"])
+        rows = []
+        self.assertEqual(self.datagridinstance._fill_down(rows, 80), 110)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(self.datagridinstance.view_is_full, True)
+
+    def test_081_fill_down_008(self):
+        records = ["k1", "k2", "k3", "k4", "k5"]
+        measured = self._fixed_height_grid(records, fixed_row_height=False)
+        grid = self.datagridinstance
+        self.assertEqual(grid._fill_down([], 0), 90)
+        self.assertEqual(len(measured), 4)
+        self.assertEqual(grid.keys, ["k1", "k2", "k3"])
+        records.insert(0, "k4")
+        grid.view_is_full = False
+        self.assertEqual(grid._fill_down([], 0), 90)
+        self.assertEqual(len(measured), 4)
+        self.assertEqual(grid.keys, ["k1", "k2", "k3"])
+        self.assertEqual(grid.bottomkey, "k3")
+        self.assertEqual(grid.view_is_full, True)
+        self.assertEqual(records, ["k5"])
+
+    def test_082_fill_up_005(self):
+        self._fixed_height_grid(["k3", "k2", "k1", "k0"])
+        self.datagridinstance.down = False
+        rows = []
+        self.assertEqual(self.datagridinstance._fill_up(rows, 0), 90)
+        self.assertEqual(self.datagridinstance.keys, ["k1", "k2", "k3"])
+        self.assertEqual(self.datagridinstance.bottomkey, "k3")
+
+    def test_107__fill_fixed_height_001(self):
+        measured = self._fixed_height_grid(["k1", "k2", "k3", "k4"])
+        grid = self.datagridinstance
+        self.assertEqual(grid._fill_fixed_height([], 0, True), 90)
+        self.assertEqual(grid.keys, ["k1", "k2", "k3"])
+        self.assertEqual(grid._fill_fixed_height([], 50, True), 80)
+        self.assertEqual(grid.keys, ["k1", "k2", "k3"])
+        self.assertEqual(len(measured), 1)
+
+    def test_107__fill_fixed_height_002(self):
+        self._fixed_height_grid(["k1", "k2"])
+        grid = self.datagridinstance
+        rows = [grid.make_row(None)]
+        grid.keys.append("k0")
+        grid.objects["k0"] = None
+        self.assertEqual(grid._fill_fixed_height(rows, 80, True), 80)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(grid.keys, ["k0"])
+        self.assertEqual(grid.objects, {"k0": None})
+        self.assertEqual(grid.gridrows_for_key, {})
+        self.assertEqual(grid.bottomkey, "k0")
+        self.assertEqual(grid.view_is_full, True)
+
+    def test_108_clear_fixed_row_heights_001(self):
+        measured = self._fixed_height_grid(["k1", "k2", "k3", "k4"])
+        grid = self.datagridinstance
+        self.assertEqual(grid._fill_fixed_height([], 0, True), 90)
+        self.assertEqual(grid.clear_fixed_row_heights(), None)
+        self.assertEqual(grid._fixed_row_heights, {})
+        grid._fill_fixed_height([], 0, True)
+        self.assertEqual(len(measured), 2)
+
+    def test_109__get_fixed_row_height_001(self):
+        measured = self._fixed_height_grid([])
+        grid = self.datagridinstance
+        row = grid.make_row(None)
+        self.assertEqual(grid._get_fixed_row_height(row, (0, 0, {})), 30)
+        self.assertEqual(
+            grid._get_fixed_row_height(row, (0, 0, {"font": "f"})), 30
+        )
+        self.assertEqual(grid._get_fixed_row_height(row, (0, 0, {})), 30)
+        self.assertEqual(len(measured), 2)
+
+    def test_110__get_next_fill_key_001(self):
+        self._fixed_height_grid(["k3"])
+        grid = self.datagridinstance
+        grid.keys.extend(["k1", "k2"])
+        self.assertEqual(grid._get_next_fill_key(1, True), "k2")
+        self.assertEqual(grid.bottomkey, "k2")
+        self.assertEqual(grid._get_next_fill_key(1, False), "k1")
+        self.assertEqual(grid.topkey, "k1")
+        self.assertEqual(grid._get_next_fill_key(2, True), "k3")
+        self.assertEqual(grid._get_next_fill_key(3, True), None)
+
+    def test_111_clear_row_heights_001(self):
+        grid = self.datagridinstance
+        grid._row_heights["k1"] = {}
+        grid._fixed_row_heights["k1"] = 30
+        self.assertEqual(grid.clear_row_heights(), None)
+        self.assertEqual(grid._row_heights, {})
+        self.assertEqual(grid._fixed_row_heights, {})
+
+    def test_112_discard_row_heights_001(self):
+        class Record:
+            def __init__(self, keys):
+                self.keys = keys
+
+            def get_keys(self, datasource):
+                return self.keys
+
+        grid = self.datagridinstance
+        for key in "k1", "k2", "k3":
+            grid._row_heights[key] = {}
+        instance = Record(["k1"])
+        instance.newrecord = Record(["k2"])
+        self.assertEqual(grid.discard_row_heights(instance), None)
+        self.assertEqual(grid._row_heights, {"k3": {}})
+        grid.discard_row_heights(object())
+        self.assertEqual(grid._row_heights, {})
+        grid._row_heights["k3"] = {}
+        grid.discard_row_heights(None)
+        self.assertEqual(grid._row_heights, {})
+
+    def test_113__get_key_row_height_001(self):
+        measured = self._fixed_height_grid([], fixed_row_height=False)
+        grid = self.datagridinstance
+        grid.objects["k1"] = None
+        row = grid.make_row(None)
+        record = (None, None, {})
+        self.assertEqual(grid._get_key_row_height("k1", record, row), 30)
+        self.assertEqual(grid._get_key_row_height("k1", record, row), 30)
+        self.assertEqual(len(measured), 1)
+        self.assertEqual(grid._row_heights, {"k1": {(type(None), "None"): 30}})
+
+    def test_114__is_noted_row_too_high_001(self):
+        grid = self.datagridinstance
+        grid.objects["k1"] = None
+        record = (None, None, {})
+        self.assertEqual(
+            grid._is_noted_row_too_high("k1", record, ["row"], 90), False
+        )
+        grid._row_heights["k1"] = {(type(None), "None"): 30}
+        self.assertEqual(
+            grid._is_noted_row_too_high("k1", record, [], 90), False
+        )
+        self.assertEqual(
+            grid._is_noted_row_too_high("k1", record, ["row"], 70), False
+        )
+        self.assertEqual(grid.view_is_full, False)
+        self.assertEqual(
+            grid._is_noted_row_too_high("k1", record, ["row"], 90), True
+        )
+        self.assertEqual(grid.view_is_full, True)
+
+    def test_115__discard_unbuilt_row_key_001(self):
+        grid = self.datagridinstance
+        grid.keys.extend(["k1", "k2", "k3"])
+        grid.objects.update({"k1": None, "k2": None, "k3": None})
+        grid.gridrows_for_key["k3"] = None
+        self.assertEqual(grid._discard_unbuilt_row_key("k3", True), None)
+        self.assertEqual(grid.keys, ["k1", "k2", "k3"])
+        del grid.gridrows_for_key["k3"]
+        grid._discard_unbuilt_row_key("k3", True)
+        self.assertEqual(grid.keys, ["k1", "k2"])
+        self.assertEqual(grid.bottomkey, "k2")
+        grid._discard_unbuilt_row_key("k1", False)
+        self.assertEqual(grid.keys, ["k2"])
+        self.assertEqual(grid.topkey, "k2")
+        self.assertEqual(grid.objects, {"k2": None})
+
+
+class DataGridBase_delegate_row_events(_DataGridBase):
+    def setUp(self):
+        super().setUp()
+        self.datagridinstance.delegate_row_events = True
+
+        class Row:
+            def __init__(self):
+                self.calls = []
+
+            def highlight_row_on_pointer_enter(self, event):
+                self.calls.append("enter")
+
+            def highlight_row_on_pointer_leave(self, event):
+                self.calls.append("leave")
+
+        self.Row = Row
+
+        class Event:
+            x_root = 0
+            y_root = 25
+            widget = None
+
+        self.Event = Event
+
+    def _grid_rows(self, keys):
+        dgi = self.datagridinstance
+        for key in keys:
+            label = tkinter.Label(master=dgi.data)
+
+            def row(label=label):
+                return [[(label, {"sticky": "nsew"})]]
+
+            dgi.keys.append(key)
+            dgi.gridrows_for_key[key] = row
+        dgi._grid_data_rows()
+
+    def test_116___init___001(self):
+        dgi = self.datagridinstance
+        self.assertEqual(
+            dgi.row_bindtag, "".join(("DataGridRows", str(id(dgi))))
+        )
+        self.assertEqual(dgi._widget_keys, {})
+        self.assertEqual(dgi._row_bands, None)
+        self.assertEqual(
+            sorted(dgi.frame.bind_class(dgi.row_bindtag)),
+            ["<Button-1>", "<Button-3>", "<Enter>", "<Leave>"],
+        )
+        self.assertEqual(len(dgi._handler_scripts), 4)
+
+    def test_117_add_row_bindtag_001(self):
+        dgi = self.datagridinstance
+        widget = tkinter.Frame(master=dgi.data)
+        child = tkinter.Label(master=widget)
+        dgi.add_row_bindtag(widget)
+        dgi.add_row_bindtag(widget)
+        for w in widget, child:
+            self.assertEqual(w.bindtags()[1], dgi.row_bindtag)
+            self.assertEqual(w.bindtags().count(dgi.row_bindtag), 1)
+
+    def test_117__is_row_event_delegation_used_001(self):
+        dgi = self.datagridinstance
+        self.assertEqual(dgi._is_row_event_delegation_used(), True)
+        dgi.delegate_row_events = False
+        self.assertEqual(dgi._is_row_event_delegation_used(), False)
+
+    def test_118_make_row_001(self):
+        dgi = self.datagridinstance
+        widget = tkinter.Label(master=dgi.data)
+
+        def row_maker(*a):
+            def newrow():
+                return [[[widget]]]
+
+            return newrow
+
+        dgi.make_row((row_maker, None, dict()))
+        self.assertIn(dgi.row_bindtag, widget.bindtags())
+        self.assertEqual(widget.bind(), ())
+
+    def test_119__grid_data_rows_001(self):
+        dgi = self.datagridinstance
+        dgi._row_bands = ([], [], [])
+        self._grid_rows(["k1", "k2"])
+        self.assertEqual(
+            {key: widget for widget, key in dgi._widget_keys.items()},
+            {
+                "k1": dgi.gridrows_for_key["k1"]()[0][0][0],
+                "k2": dgi.gridrows_for_key["k2"]()[0][0][0],
+            },
+        )
+        self.assertEqual(dgi._row_bands, None)
+
+    def test_120__get_widget_row_key_001(self):
+        dgi = self.datagridinstance
+        self._grid_rows(["k1"])
+        label = dgi.gridrows_for_key["k1"]()[0][0][0]
+        child = tkinter.Label(master=label)
+        self.assertEqual(dgi._get_widget_row_key(label), "k1")
+        self.assertEqual(dgi._get_widget_row_key(child), "k1")
+        self.assertEqual(dgi._get_widget_row_key(dgi.data), None)
+        self.assertEqual(dgi._get_widget_row_key(None), None)
+        self.assertEqual(dgi._get_widget_row_key(".unknown"), None)
+
+    def test_121_select_row_by_click_001(self):
+        dgi = self.datagridinstance
+        self._grid_rows(["k1"])
+        popups = []
+
+        def show_popup_menu():
+            popups.append(dgi.pointer_popup_selection)
+
+        dgi.show_popup_menu = show_popup_menu
+        event = self.Event()
+        event.widget = dgi.gridrows_for_key["k1"]()[0][0][0]
+        self.assertEqual(dgi.select_row_by_click(event=event), None)
+        self.assertEqual(popups, ["k1"])
+        event.widget = dgi.data
+        self.assertEqual(dgi.select_row_by_click(event=event), None)
+        self.assertEqual(popups, ["k1"])
+        self.assertEqual(dgi.pointer_popup_selection, None)
+
+    def test_122__get_row_key_at_y_001(self):
+        dgi = self.datagridinstance
+        dgi._row_bands = ([0, 20], [20, 40], ["k1", "k2"])
+        self.assertEqual(dgi._get_row_key_at_y(-1), None)
+        self.assertEqual(dgi._get_row_key_at_y(0), "k1")
+        self.assertEqual(dgi._get_row_key_at_y(19), "k1")
+        self.assertEqual(dgi._get_row_key_at_y(20), "k2")
+        self.assertEqual(dgi._get_row_key_at_y(40), None)
+
+    def test_123__get_row_bands_001(self):
+        dgi = self.datagridinstance
+        self._grid_rows(["k1", "k2"])
+        tops, bottoms, keys = dgi._get_row_bands()
+        self.assertEqual(keys, ["k1", "k2"])
+        self.assertEqual(len(tops), 2)
+        self.assertEqual(len(bottoms), 2)
+        self.assertIs(dgi._get_row_bands(), dgi._row_bands)
+
+    def test_124_on_pointer_enter_row_widget_001(self):
+        dgi = self.datagridinstance
+        dgi._row_bands = ([0, 20], [20, 40], ["k1", "k2"])
+        rows = {"k1": self.Row(), "k2": self.Row()}
+        dgi.objects.update(rows)
+        dgi.on_pointer_enter_row_widget(event=self.Event())
+        self.assertEqual(rows["k1"].calls, [])
+        self.assertEqual(rows["k2"].calls, ["enter"])
+
+    def test_125_on_pointer_leave_row_widget_001(self):
+        dgi = self.datagridinstance
+        self._grid_rows(["k1"])
+        row = self.Row()
+        dgi.objects["k1"] = row
+        event = self.Event()
+        event.widget = dgi.gridrows_for_key["k1"]()[0][0][0]
+        dgi.on_pointer_leave_row_widget(event=event)
+        self.assertEqual(row.calls, ["leave"])
+        event.widget = dgi.data
+        dgi.on_pointer_leave_row_widget(event=event)
+        self.assertEqual(row.calls, ["leave"])
+
+    def test_126_bind_off_001(self):
+        dgi = self.datagridinstance
+        dgi.bind_off()
+        self.assertEqual(dgi.frame.bind_class(dgi.row_bindtag), ())
+        dgi.bind_on()
+        self.assertEqual(len(dgi.frame.bind_class(dgi.row_bindtag)), 4)
+        self.assertEqual(len(dgi._handler_scripts), 4)
+
+    def test_127_load_object_001(self):
+        dgi = self.datagridinstance
+        row = datarow.DataRow()
+        dgi.readahead_objects["key"] = row
+        dgi.load_object("key")
+        self.assertIs(dgi.objects["key"], row)
+        self.assertEqual(row.bind_pointer_crossing, False)
+
+    def test_127_load_object_002(self):
+        dgi = self.datagridinstance
+        dgi.delegate_row_events = False
+        row = datarow.DataRow()
+        dgi.readahead_objects["key"] = row
+        dgi.load_object("key")
+        self.assertEqual(row.bind_pointer_crossing, False)
+
+    def test_128_get_handler_script_001(self):
+        dgi = self.datagridinstance
+        script = dgi.get_handler_script(dgi.focus_set_frame)
+        self.assertIs(dgi.get_handler_script(dgi.focus_set_frame), script)
+        funcid = dgi._handler_scripts[dgi.focus_set_frame][0]
+        self.assertIn(funcid, script)
+        self.assertIn(funcid, dgi.frame._tclCommands)
+
+    def test_128_get_handler_script_002(self):
+        # get_handler_script relies on these tkinter internals.
+        frame = self.datagridinstance.frame
+        self.assertEqual(callable(frame._substitute), True)
+        self.assertIsInstance(frame._subst_format_str, str)
+
+    def test_129_bind_handler_001(self):
+        dgi = self.datagridinstance
+        count = len(dgi.frame._tclCommands)
+        widgets = [tkinter.Label(master=dgi.data) for i in range(3)]
+        for widget in widgets:
+            dgi.bind_handler(widget, "<Enter>", dgi.focus_set_frame)
+        self.assertEqual(len(dgi.frame._tclCommands), count + 1)
+        for widget in widgets:
+            self.assertEqual(
+                widget.bind("<Enter>").strip(),
+                dgi.get_handler_script(dgi.focus_set_frame).strip(),
+            )
+            self.assertEqual(widget._tclCommands, None)
+
+    def test_130_delete_handler_scripts_001(self):
+        dgi = self.datagridinstance
+        dgi.get_handler_script(dgi.focus_set_frame)
+        funcid = dgi._handler_scripts[dgi.focus_set_frame][0]
+        dgi.delete_handler_scripts()
+        self.assertEqual(dgi._handler_scripts, {})
+        self.assertNotIn(funcid, dgi.frame._tclCommands)
+
+    def test_131_on_destroy_grid_001(self):
+        dgi = self.datagridinstance
+        dgi.get_handler_script(dgi.focus_set_frame)
+        dgi.frame.destroy()
+        self.assertEqual(dgi._handler_scripts, {})
+
+    def test_131_on_destroy_grid_002(self):
+        dgi = self.datagridinstance
+        dgi._bind_row_bindtag()
+        self.assertNotEqual(dgi.frame.bind_class(dgi.row_bindtag), ())
+        dgi.frame.destroy()
+        self.assertEqual(dgi.frame.bind_class(dgi.row_bindtag), ())
+
+    def test_132_make_row_001(self):
+        dgi = self.datagridinstance
+        dgi.delegate_row_events = False
+        widget = tkinter.Label(master=dgi.data)
+        child = tkinter.Label(master=widget)
+
+        def row_maker(*a):
+            def newrow():
+                return [[[widget]]]
+
+            return newrow
+
+        count = len(dgi.frame._tclCommands)
+        dgi.make_row((row_maker, None, dict()))
+        dgi.make_row((row_maker, None, dict()))
+        self.assertEqual(len(dgi.frame._tclCommands), count)
+        self.assertEqual(
+            sorted(widget.bind()),
+            ["<Button-1>", "<Button-3>", "<Enter>", "<Leave>"],
+        )
+        self.assertEqual(sorted(child.bind()), ["<Button-1>", "<Button-3>"])
+        self.assertNotIn(dgi.row_bindtag, widget.bindtags())
+
+
+class DataGridBase__scroll_grid_one_line(_DataGridBase):
+    def setUp(self):
+        super().setUp()
+
+        class Datarow(self.Datarow):
+            def load_instance(self, *a):
+                self.key = a[-1]
+
+            def make_row_widgets(self, widgetpool, parent, items, **kargs):
+                self._row_widgets = [
+                    (tkinter.Label(master=parent, text=self.key), {})
+                ]
+                return self
+
+            def grid_row_normal(self, *a, **k):
+                return self.make_row_widgets, (), {}
+
+            def __call__(self):
+                return (self._row_widgets,)
+
+            def unbind_row_widgets(self):
+                self._row_widgets = ()
+
+        self.Datarow = Datarow
+
+        class Cursor:
+            def set_partial_key(self, partial):
+                pass
+
+            def setat(self, record):
+                return record
+
+            def next(self):
+                return "key3"
+
+            def prev(self):
+                return "key0"
+
+            def close(self):
+                pass
+
+            def database_cursor_exists(self):
+                return True
+
+        class Datasource(self.Datasource):
+            dbset = None
+            dbname = None
+
+            def get_cursor(self):
+                return Cursor()
+
+            def new_row(self):
+                return Datarow()
+
+        self.datagridinstance.datasource = Datasource()
+        self.datagridinstance.make_client_cursor()
+        for key in ("key1", "key2"):
+            self.datagridinstance.load_object(key)
+            self.datagridinstance.keys.append(key)
+            self.datagridinstance.gridrows_for_key[
+                key
+            ] = self.datagridinstance.make_row(
+                self.datagridinstance.set_row(key)
+            )
+        self.datagridinstance.topkey = "key1"
+        self.datagridinstance.bottomkey = "key2"
+        self.datagridinstance._grid_data_rows()
+
+    def _grid_row_for_key(self, key):
+        return self.datagridinstance.gridrows_for_key[key]()[0][0][
+            0
+        ].grid_info()["row"]
+
+    def test_089__scroll_grid_one_line_001(self):
+        self.assertRaisesRegex(
+            TypeError,
+            "".join(
+                (
+                    r"_scroll_grid_one_line\(\) takes from 1 to 2 ",
+                    "positional arguments but 3 were given$",
+                )
+            ),
+            self.datagridinstance._scroll_grid_one_line,
+            *(None, None),
+        )
+
+    def test_089__scroll_grid_one_line_002(self):
+        self.datagridinstance.keys.pop()
+        self.assertEqual(
+            self.datagridinstance._scroll_grid_one_line(down=True), False
+        )
+        self.assertEqual(self.datagridinstance.keys, ["key1"])
+
+    def test_089__scroll_grid_one_line_003(self):
+        self.assertEqual(
+            self.datagridinstance._scroll_grid_one_line(down=True), True
+        )
+        self.assertEqual(self.datagridinstance.keys, ["key2", "key3"])
+        self.assertEqual(set(self.datagridinstance.objects), {"key2", "key3"})
+        self.assertEqual(
+            set(self.datagridinstance.gridrows_for_key), {"key2", "key3"}
+        )
+        self.assertEqual(self.datagridinstance.topkey, "key2")
+        self.assertEqual(self.datagridinstance.bottomkey, "key3")
+        self.assertEqual(
+            len(self.datagridinstance._spare_rows[tkinter.Label]), 1
+        )
+
+    def test_089__scroll_grid_one_line_004(self):
+        self.assertEqual(
+            self.datagridinstance._scroll_grid_one_line(down=False), True
+        )
+        self.assertEqual(self.datagridinstance.keys, ["key0", "key1"])
+        self.assertEqual(set(self.datagridinstance.objects), {"key0", "key1"})
+        self.assertEqual(self.datagridinstance.topkey, "key0")
+        self.assertEqual(self.datagridinstance.bottomkey, "key1")
+
+    def test_089__scroll_grid_one_line_005(self):
+        self.datagridinstance.bottomkey = None
+        self.assertEqual(
+            self.datagridinstance._scroll_grid_one_line(down=True), False
+        )
+        self.assertEqual(self.datagridinstance.keys, ["key1", "key2"])
+
+    def test_089__scroll_grid_one_line_006(self):
+        dgi = self.datagridinstance
+        row = self._grid_row_for_key("key2")
+        self.assertEqual(dgi._scroll_grid_one_line(down=True), True)
+        self.assertEqual(self._grid_row_for_key("key2"), row)
+        self.assertEqual(self._grid_row_for_key("key3"), row + 1)
+        self.assertEqual(dgi._data_row_base, row)
+        self.assertEqual(dgi._data_row_span, 2)
+        self.assertEqual(set(dgi._widget_keys.values()), {"key2", "key3"})
+
+    def test_089__scroll_grid_one_line_007(self):
+        dgi = self.datagridinstance
+        self.assertEqual(dgi._scroll_grid_one_line(down=True), True)
+        row = self._grid_row_for_key("key2")
+        self.assertEqual(dgi._scroll_grid_one_line(down=False), True)
+        self.assertEqual(dgi.keys, ["key0", "key2"])
+        self.assertEqual(self._grid_row_for_key("key2"), row)
+        self.assertEqual(self._grid_row_for_key("key0"), row - 1)
+        self.assertEqual(dgi._data_row_base, row - 1)
+
+    def test_089__scroll_grid_one_line_008(self):
+        dgi = self.datagridinstance
+        dgi._data_row_base += datagrid.GRID_ROW_OFFSET_LIMIT
+        self.assertEqual(dgi._scroll_grid_one_line(down=True), True)
+        row = dgi._header_row_count + datagrid.GRID_ROW_OFFSET_LIMIT // 2
+        self.assertEqual(dgi._data_row_base, row)
+        self.assertEqual(self._grid_row_for_key("key2"), row)
+        self.assertEqual(self._grid_row_for_key("key3"), row + 1)
+
+    def test_089__scroll_grid_one_line_009(self):
+        dgi = self.datagridinstance
+        regrids = []
+        grid_data_rows = dgi._grid_data_rows
+
+        def _grid_data_rows():
+            regrids.append(True)
+            grid_data_rows()
+
+        dgi._grid_data_rows = _grid_data_rows
+        row = self._grid_row_for_key("key1")
+        self.assertEqual(row > dgi._header_row_count, True)
+        self.assertEqual(dgi._scroll_grid_one_line(down=False), True)
+        self.assertEqual(dgi.keys, ["key0", "key1"])
+        self.assertEqual(self._grid_row_for_key("key1"), row)
+        self.assertEqual(self._grid_row_for_key("key0"), row - 1)
+        self.assertEqual(dgi._scroll_grid_one_line(down=True), True)
+        self.assertEqual(regrids, [])
+
+    def test_089__scroll_grid_one_line_010(self):
+        dgi = self.datagridinstance
+        dgi._data_row_base = dgi._header_row_count
+        self.assertEqual(dgi._scroll_grid_one_line(down=False), True)
+        row = dgi._header_row_count + datagrid.GRID_ROW_OFFSET_LIMIT // 2
+        self.assertEqual(dgi._data_row_base, row)
+        self.assertEqual(self._grid_row_for_key("key0"), row)
+        self.assertEqual(self._grid_row_for_key("key1"), row + 1)
+
 
 class DataGridBase_move_slider(_DataGridBase):
     def setUp(self):
@@ -3043,6 +4309,86 @@ class DataGridBase_move_slider(_DataGridBase):
         self.datagridinstance.record_count = 11
         self.assertEqual(self.datagridinstance.move_slider(), None)
 
+    def test_050_move_slider_010(self):
+        fill_view_args = []
+
+        def fill_view(**kargs):
+            fill_view_args.append(kargs)
+
+        self.position_estimator()
+        self.datagridinstance.fill_view = fill_view
+        self.datagridinstance.vsbar_number = 0.5
+        self.datagridinstance.record_count = 10
+        self.assertEqual(self.datagridinstance.move_slider(), None)
+        self.assertEqual(
+            fill_view_args, [dict(currentkey=("key", 6), exclude=False)]
+        )
+
+    def test_050_move_slider_011(self):
+        self.datagridinstance.fill_view = None
+        self.datagridinstance.vsbar_number = 0.5
+        self.datagridinstance.record_count = 10
+        self.datagridinstance._slider_preview_position = 5
+        self.datagridinstance._slider_preview_pending = (
+            self.datagridinstance.frame.after(1000, self.null_method)
+        )
+        self.assertEqual(self.datagridinstance.move_slider(), None)
+        self.assertEqual(self.datagridinstance._slider_preview_pending, None)
+        self.assertEqual(self.datagridinstance._slider_preview_position, None)
+        self.assertEqual(self.datagridinstance.vsbar_number, None)
+
+    def test_100_preview_slider_001(self):
+        self.datagridinstance._slider_preview_pending = "id"
+        self.assertEqual(self.datagridinstance.preview_slider(), None)
+        self.assertEqual(self.datagridinstance._slider_preview_pending, None)
+        self.assertEqual(self.datagridinstance._slider_preview_position, None)
+
+    def test_100_preview_slider_002(self):
+        fill_view_args = []
+
+        def fill_view(**kargs):
+            fill_view_args.append(kargs)
+
+        self.position_estimator()
+        self.datagridinstance.fill_view = fill_view
+        self.datagridinstance.record_count = 10
+        self.datagridinstance.vsbar_number = 0.5
+        self.assertEqual(self.datagridinstance.preview_slider(), None)
+        self.datagridinstance.preview_slider()
+        self.assertEqual(self.datagridinstance._slider_preview_position, 5)
+        self.assertEqual(
+            self.datagridinstance._slider_position_keys, {5: ("key", 6)}
+        )
+        self.assertEqual(self.datagridinstance.vsbar_number, 0.5)
+        self.assertEqual(
+            fill_view_args, [dict(currentkey=("key", 6), exclude=False)]
+        )
+
+    def test_101__get_slider_position_001(self):
+        self.datagridinstance.record_count = 10
+        self.assertEqual(self.datagridinstance._get_slider_position(-1), 0)
+        self.assertEqual(self.datagridinstance._get_slider_position(0.55), 5)
+        self.assertEqual(self.datagridinstance._get_slider_position(2), 9)
+
+    def test_102__get_record_at_slider_position_001(self):
+        class Cursor:
+            def get_record_at_position(self, position):
+                return position
+
+        self.datagridinstance.make_client_cursor = self.null_method
+        self.datagridinstance.cursor = Cursor()
+        self.datagridinstance.record_count = 10
+        self.assertEqual(
+            self.datagridinstance._get_record_at_slider_position(3), 3
+        )
+        self.assertEqual(
+            self.datagridinstance._get_record_at_slider_position(8), -2
+        )
+        self.datagridinstance.partial = "p"
+        self.assertEqual(
+            self.datagridinstance._get_record_at_slider_position(8), 8
+        )
+
 
 class DataGridReadOnly___init___del___ignored(_DataGridBase):
     # For solentware_bind.gui.bindings.Bindings.__del__ attributes referenced.
@@ -4186,6 +5532,8 @@ if __name__ == "__main__":
     runner().run(loader(DataGridBase_dummy_fill_data_grid))
     runner().run(loader(DataGridBase_fill_data_grid))
     runner().run(loader(DataGridBase__fill_down__fill_up))
+    runner().run(loader(DataGridBase_delegate_row_events))
+    runner().run(loader(DataGridBase__scroll_grid_one_line))
     runner().run(loader(DataGridBase_move_slider))
     runner().run(loader(DataGridReadOnly___init___del___ignored))
     runner().run(loader(DataGridReadOnly))